@@ -13,18 +13,37 @@ Version: 2.0.0
 
 import csv
 import io
+import ipaddress
 import json
 import logging
+import socket
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from getpass import getpass
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import typer
 from typing_extensions import Annotated
 
+from netmiko_collector_workers import (
+    OUTPUT_RENDER_CACHE_SIZE,
+    _count_status,
+    _open_output,
+    get_pool,
+    is_cpu_bound,
+    pickle_results,
+    run_pickled,
+    save_to_excel,
+    save_to_html,
+)
+
 # Set UTF-8 encoding for Windows console to support emojis
 if sys.platform == "win32":
     try:
@@ -41,6 +60,27 @@ TRUTHY_VALUES = ("true", "yes", "1")
 MIN_WORKERS = 1
 MAX_WORKERS = 20
 
+# Upper bound on concurrent output writers (one per format for --format all)
+MAX_SAVE_WORKERS = 5
+
+# SSH handshake rate limiting (new connections per second, burst size)
+HANDSHAKE_RATE = 8.0
+HANDSHAKE_BURST = 10
+
+# Output format names accepted by --format, mapped to their canonical name
+_FMT_ALIASES = {
+    "csv": "csv",
+    "json": "json",
+    "html": "html",
+    "markdown": "markdown",
+    "md": "markdown",
+    "excel": "excel",
+    "xlsx": "excel",
+}
+
+# Formats written for --format all
+_ALL_FORMATS = ("csv", "json", "html", "markdown", "excel")
+
 # Retry configuration
 MAX_RETRY_ATTEMPTS = 3
 RETRY_MIN_WAIT = 1
@@ -61,6 +101,21 @@ DEFAULT_CONFIG = {
 # Configuration file location
 CONFIG_FILE = Path.home() / ".netmiko_collector_config.json"
 
+# Pre-resolved device addresses, kept across runs only with --dns-cache.
+# getaddrinfo() does not report record TTLs, so entries expire after a fixed
+# DNS_CACHE_TTL seconds regardless of the record's own TTL.
+DNS_CACHE_FILE = Path.home() / ".netmiko-collector" / "cache" / "dns.json"
+DNS_CACHE_TTL = 300
+DNS_RESOLVE_WORKERS = 16
+DNS_RESOLVE_TIMEOUT = 2.0
+
+# OS keyring services for cached SSH and enable passwords
+KEYRING_SERVICE = "netmiko-collector"
+KEYRING_ENABLE_SERVICE = "netmiko-collector-enable"
+
+# Output recorded for every command of a device that rejected the credentials
+AUTH_FAILED_MESSAGE = "Authentication failed - check credentials"
+
 # Command database for different device types
 DEVICE_COMMANDS = {
     "cisco_ios": {
@@ -330,14 +385,6 @@ try:
 except ImportError:
     TENACITY_AVAILABLE = False
 
-try:
-    import openpyxl
-    from openpyxl.styles import Alignment, Font, PatternFill
-
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
-
 try:
     from prompt_toolkit import prompt
     from prompt_toolkit.application import Application
@@ -355,6 +402,13 @@ try:
 except ImportError:
     PROMPT_TOOLKIT_AVAILABLE = False
 
+try:
+    import keyring
+
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -659,6 +713,20 @@ def get_commands_for_device_type(device_type: str) -> List[str]:
     Returns:
         List of available commands
     """
+    return list(_command_suggestions(device_type))
+
+
+@lru_cache(maxsize=8)
+def _command_suggestions(device_type: str) -> Tuple[str, ...]:
+    """
+    Build the command suggestions for a device type once per process.
+
+    Args:
+        device_type: Device type (e.g., cisco_ios, cisco_xe)
+
+    Returns:
+        Tuple of available commands
+    """
     commands = []
 
     # Get commands from database
@@ -691,7 +759,23 @@ def get_commands_for_device_type(device_type: str) -> List[str]:
             "show inventory",
         ]
 
-    return commands
+    return tuple(commands)
+
+
+@lru_cache(maxsize=8)
+def _command_completer(device_type: str) -> "FuzzyCompleter":
+    """
+    Build the fuzzy command completer for a device type once per process.
+
+    Args:
+        device_type: Device type for command suggestions
+
+    Returns:
+        Fuzzy completer over the device type's command suggestions
+    """
+    return FuzzyCompleter(
+        WordCompleter(list(_command_suggestions(device_type)), ignore_case=True, sentence=True)
+    )
 
 
 def edit_commands_with_autocomplete(file_path: str, device_type: str) -> bool:
@@ -721,9 +805,6 @@ def edit_commands_with_autocomplete(file_path: str, device_type: str) -> bool:
             print_error(f"Failed to read file: {e}")
             return False
 
-    # Get command suggestions for device type
-    command_suggestions = get_commands_for_device_type(device_type)
-
     print_banner(f"INTERACTIVE COMMAND EDITOR - {device_type.upper()}", "bold green")
 
     if RICH_AVAILABLE and console:
@@ -758,8 +839,8 @@ def edit_commands_with_autocomplete(file_path: str, device_type: str) -> bool:
                     print(f"  {idx:2d}. {cmd}")
         print()
 
-    # Create completer with fuzzy matching - clean and simple
-    completer = FuzzyCompleter(WordCompleter(command_suggestions, ignore_case=True, sentence=True))
+    # Completer with fuzzy matching, reused across edits in the same session
+    completer = _command_completer(device_type)
 
     # Create history
     history = InMemoryHistory()
@@ -955,6 +1036,68 @@ def view_output_file(file_path: str) -> None:
         print_error(f"Failed to view file: {e}")
 
 
+def get_password(
+    prompt_text: str, username: str, service: str = KEYRING_SERVICE, use_cache: bool = False
+) -> str:
+    """
+    Prompt for a password, optionally reusing one cached in the OS keyring.
+
+    The keyring stores secrets in the platform's secret service, so nothing
+    is written to disk in plaintext. Without the keyring package, or without
+    use_cache, this is a plain getpass prompt.
+
+    Args:
+        prompt_text: Prompt shown when the password has to be typed
+        username: Account the password belongs to
+        service: Keyring service name the password is stored under
+        use_cache: Read and store the password in the keyring (default: False)
+
+    Returns:
+        The password (empty if the user entered nothing)
+    """
+    use_cache = use_cache and KEYRING_AVAILABLE
+
+    if use_cache:
+        try:
+            cached = keyring.get_password(service, username)
+        except Exception as e:
+            logger.debug("Keyring lookup failed: %s", e)
+            cached = None
+        if cached is not None:
+            logger.info("Using cached %s credentials for %s", service, username)
+            return cached
+
+    password = getpass(prompt_text)
+
+    if use_cache and password:
+        try:
+            keyring.set_password(service, username, password)
+        except Exception as e:
+            logger.debug("Could not store password in keyring: %s", e)
+
+    return password
+
+
+def forget_password(username: str, service: str = KEYRING_SERVICE) -> None:
+    """
+    Remove a password cached in the OS keyring, if there is one.
+
+    Args:
+        username: Account the password belongs to
+        service: Keyring service name the password is stored under
+    """
+    if not KEYRING_AVAILABLE:
+        return
+
+    try:
+        keyring.delete_password(service, username)
+    except Exception as e:
+        # Raised when nothing was stored, or the backend refused
+        logger.debug("No cached %s password removed for %s: %s", service, username, e)
+    else:
+        logger.info("Removed cached %s credentials for %s", service, username)
+
+
 def get_or_create_file(default_filename: str, file_description: str) -> Optional[str]:
     """
     Check for file in current directory, or prompt user to create/select one.
@@ -1433,6 +1576,34 @@ def load_devices(
         raise ValueError(f"Error parsing CSV file: {e}") from e
 
 
+DEVICE_COLUMNS = ("hostname", "ip_address", "device_type")
+
+
+def load_devices_soa(
+    devices_file: str, default_device_type: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Load devices column-wise: one list per required field.
+
+    Validation is the same as load_devices. Callers that check every
+    hostname or address can walk a single list instead of indexing a
+    dict per device.
+
+    Args:
+        devices_file: Path to the devices CSV file
+        default_device_type: Default device type to use if not specified
+
+    Returns:
+        Dict mapping each of DEVICE_COLUMNS to its values, in file order
+
+    Raises:
+        FileNotFoundError: If the devices file doesn't exist
+        ValueError: If the CSV format is invalid
+    """
+    devices = load_devices(devices_file, default_device_type)
+    return {column: list(map(itemgetter(column), devices)) for column in DEVICE_COLUMNS}
+
+
 def load_commands(commands_file: str) -> List[str]:
     """
     Load commands from a text file (one command per line).
@@ -1464,6 +1635,184 @@ def load_commands(commands_file: str) -> List[str]:
     return commands
 
 
+def _is_ip_address(value: str) -> bool:
+    """Return True if value is an IPv4 or IPv6 address literal."""
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _resolve_host(host: str) -> Optional[str]:
+    """Resolve a hostname to its first TCP address, or None on failure."""
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return None
+    return str(ipaddress.ip_address(infos[0][4][0])) if infos else None
+
+
+def batch_resolve(
+    hosts: List[str], timeout: float = DNS_RESOLVE_TIMEOUT, persist: bool = False
+) -> Dict[str, str]:
+    """
+    Resolve device hostnames up front, in parallel.
+
+    Each distinct name is looked up once instead of once per connection
+    attempt. IP literals are left alone, and names that fail or take longer
+    than ``timeout`` are omitted so the SSH library resolves them itself as
+    before. With ``persist``, answers are also cached in DNS_CACHE_FILE for
+    DNS_CACHE_TTL seconds so back-to-back runs skip DNS entirely.
+
+    Args:
+        hosts: Hostnames or IP addresses of the devices
+        timeout: Seconds to wait for the whole batch of lookups
+        persist: Read and update the on-disk cache (default: False)
+
+    Returns:
+        Mapping of hostname to resolved IP address
+    """
+    names = {host for host in hosts if not _is_ip_address(host)}
+    if not names:
+        return {}
+
+    now = time.time()
+    cache = {}
+    if persist:
+        try:
+            cache = json.loads(DNS_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+    cache = {
+        name: entry
+        for name, entry in cache.items()
+        if isinstance(entry, list) and len(entry) == 2 and entry[1] > now
+    }
+
+    resolved = {name: cache[name][0] for name in names if name in cache}
+    pending = sorted(names - resolved.keys())
+
+    if pending:
+        executor = ThreadPoolExecutor(max_workers=min(len(pending), DNS_RESOLVE_WORKERS))
+        futures = {executor.submit(_resolve_host, name): name for name in pending}
+        done, _ = wait(futures, timeout=timeout)
+        # Don't let a hung lookup hold up the run
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        expires = now + DNS_CACHE_TTL
+        for future in done:
+            address = future.result()
+            if address:
+                resolved[futures[future]] = address
+                cache[futures[future]] = [address, expires]
+
+        if persist:
+            try:
+                DNS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                DNS_CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+            except OSError as e:
+                logger.debug("Could not write DNS cache %s: %s", DNS_CACHE_FILE, e)
+
+    logger.debug("Pre-resolved %d of %d device hostname(s)", len(resolved), len(names))
+    return resolved
+
+
+@dataclass(slots=True)
+class Result:
+    """
+    Outcome of a single command on a single device.
+
+    Slotted so large result sets stay compact; fields match the CSV columns.
+    """
+
+    timestamp: str
+    hostname: str
+    ip_address: str
+    command: str
+    output: str
+    status: str
+
+
+RESULT_FIELDS = ("timestamp", "hostname", "ip_address", "command", "output", "status")
+
+
+def _failed_results(device: Dict[str, str], commands: List[str], error_msg: str) -> List[Result]:
+    """
+    Build failed results for every command of a device.
+
+    The shared fields are resolved once and reused per command, so the
+    failure path does not recompute the timestamp or re-read the device.
+
+    Args:
+        device: Device information dictionary
+        commands: Commands that could not be executed
+        error_msg: Error message stored as the output of each result
+
+    Returns:
+        List of failed results, one per command
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    hostname = device["hostname"]
+    ip_address = device["ip_address"]
+    return [
+        Result(timestamp, hostname, ip_address, command, error_msg, "failed")
+        for command in commands
+    ]
+
+
+class HandshakeLimiter:
+    """
+    Token bucket capping how many SSH handshakes start per second.
+
+    Only connection setup is throttled; once a session is established it
+    runs at full worker concurrency. Use as a context manager around the
+    ConnectHandler call.
+    """
+
+    def __init__(self, rate_per_sec: float = HANDSHAKE_RATE, burst: int = HANDSHAKE_BURST):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_per_sec: Sustained number of handshakes allowed per second
+            burst: Number of handshakes allowed back to back
+        """
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        """Block until a handshake token is available, then consume it."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate_per_sec
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                self._condition.wait((1 - self._tokens) / self.rate_per_sec)
+
+    def __enter__(self) -> "HandshakeLimiter":
+        """Acquire a handshake token."""
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """Nothing to release; tokens refill over time."""
+        return False
+
+
 def connect_and_execute(
     device: Dict[str, str],
     commands: List[str],
@@ -1476,7 +1825,8 @@ def connect_and_execute(
     enable_session_logging: bool = False,
     enable_mode: bool = False,
     enable_password: str = None,
-) -> List[Dict[str, str]]:
+    handshake_limiter: Optional[HandshakeLimiter] = None,
+) -> List[Result]:
     """
     Connect to a device and execute commands.
 
@@ -1492,9 +1842,10 @@ def connect_and_execute(
         enable_session_logging: Enable session logging (default: False)
         enable_mode: Enter enable mode after connecting (default: False)
         enable_password: Enable mode password (optional)
+        handshake_limiter: Rate limiter for new SSH connections (optional)
 
     Returns:
-        List of result dictionaries containing command outputs
+        List of results containing command outputs
     """
     results = []
     hostname = device["hostname"]
@@ -1502,7 +1853,7 @@ def connect_and_execute(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     device_params = {
         "device_type": device["device_type"],
-        "host": device["ip_address"],
+        "host": device.get("resolved_ip") or device["ip_address"],
         "username": username,
         "password": password,
         "timeout": connection_timeout,
@@ -1540,7 +1891,11 @@ def connect_and_execute(
 
     try:
         logger.info("Connecting to %s (%s)...", hostname, device["ip_address"])
-        connection = ConnectHandler(**device_params)
+        if handshake_limiter:
+            with handshake_limiter:
+                connection = ConnectHandler(**device_params)
+        else:
+            connection = ConnectHandler(**device_params)
 
         logger.info("Successfully connected to %s", hostname)
 
@@ -1575,28 +1930,28 @@ def connect_and_execute(
                     output = "\n".join(stripped_lines)
 
                 results.append(
-                    {
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "hostname": hostname,
-                        "ip_address": device["ip_address"],
-                        "command": command,
-                        "output": output,
-                        "status": "success",
-                    }
+                    Result(
+                        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        hostname=hostname,
+                        ip_address=device["ip_address"],
+                        command=command,
+                        output=output,
+                        status="success",
+                    )
                 )
                 logger.info("Command '%s' executed successfully on %s", command, hostname)
             except Exception as cmd_error:
                 error_msg = f"Error executing command: {str(cmd_error)}"
                 logger.error("%s on %s", error_msg, hostname)
                 results.append(
-                    {
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "hostname": hostname,
-                        "ip_address": device["ip_address"],
-                        "command": command,
-                        "output": error_msg,
-                        "status": "failed",
-                    }
+                    Result(
+                        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        hostname=hostname,
+                        ip_address=device["ip_address"],
+                        command=command,
+                        output=error_msg,
+                        status="failed",
+                    )
                 )
 
         connection.disconnect()
@@ -1605,47 +1960,17 @@ def connect_and_execute(
     except NetmikoTimeoutException:
         error_msg = "Connection timeout - device unreachable"
         logger.error("%s: %s", hostname, error_msg)
-        for command in commands:
-            results.append(
-                {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "hostname": hostname,
-                    "ip_address": device["ip_address"],
-                    "command": command,
-                    "output": error_msg,
-                    "status": "failed",
-                }
-            )
+        results.extend(_failed_results(device, commands, error_msg))
 
     except NetmikoAuthenticationException:
-        error_msg = "Authentication failed - check credentials"
+        error_msg = AUTH_FAILED_MESSAGE
         logger.error("%s: %s", hostname, error_msg)
-        for command in commands:
-            results.append(
-                {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "hostname": hostname,
-                    "ip_address": device["ip_address"],
-                    "command": command,
-                    "output": error_msg,
-                    "status": "failed",
-                }
-            )
+        results.extend(_failed_results(device, commands, error_msg))
 
     except Exception as conn_error:
         error_msg = f"Unexpected error: {str(conn_error)}"
         logger.error("%s: %s", hostname, error_msg)
-        for command in commands:
-            results.append(
-                {
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "hostname": hostname,
-                    "ip_address": device["ip_address"],
-                    "command": command,
-                    "output": error_msg,
-                    "status": "failed",
-                }
-            )
+        results.extend(_failed_results(device, commands, error_msg))
 
     return results
 
@@ -1663,7 +1988,8 @@ def connect_with_retry(
     enable_mode: bool,
     enable_password: str,
     retry_enabled: bool,
-) -> List[Dict[str, str]]:
+    handshake_limiter: Optional[HandshakeLimiter] = None,
+) -> List[Result]:
     """
     Connect to device with optional retry logic.
 
@@ -1680,6 +2006,7 @@ def connect_with_retry(
         enable_mode: Enter enable mode
         enable_password: Enable mode password
         retry_enabled: Enable retry on failure
+        handshake_limiter: Rate limiter for new SSH connections (optional)
 
     Returns:
         List of result dictionaries
@@ -1711,6 +2038,7 @@ def connect_with_retry(
                 enable_session_logging,
                 enable_mode,
                 enable_password,
+                handshake_limiter,
             )
         except Exception:
             # If all retries fail, call without retry to get proper error handling
@@ -1726,6 +2054,7 @@ def connect_with_retry(
                 enable_session_logging,
                 enable_mode,
                 enable_password,
+                handshake_limiter,
             )
     else:
         # No retry - direct connection
@@ -1741,6 +2070,7 @@ def connect_with_retry(
             enable_session_logging,
             enable_mode,
             enable_password,
+            handshake_limiter,
         )
 
 
@@ -1759,7 +2089,8 @@ def process_devices_parallel(
     enable_password: Optional[str] = None,
     retry_on_failure: bool = True,
     show_progress: bool = True,
-) -> List[Dict[str, str]]:
+    handshake_limiter: Optional[HandshakeLimiter] = None,
+) -> List[Result]:
     """
     Process multiple devices in parallel using ThreadPoolExecutor.
 
@@ -1778,6 +2109,7 @@ def process_devices_parallel(
         enable_password: Enable mode password
         retry_on_failure: Retry on connection failures
         show_progress: Show progress bar
+        handshake_limiter: Rate limiter for new SSH connections (optional)
 
     Returns:
         List of all results from all devices
@@ -1812,6 +2144,7 @@ def process_devices_parallel(
                         enable_mode,
                         enable_password,
                         retry_on_failure,
+                        handshake_limiter,
                     ): device
                     for device in devices
                 }
@@ -1833,17 +2166,11 @@ def process_devices_parallel(
                             task, advance=1, description=f"[red]Failed {device['hostname']}"
                         )
                         # Add error results for all commands
-                        for command in commands:
-                            all_results.append(
-                                {
-                                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                    "hostname": device["hostname"],
-                                    "ip_address": device["ip_address"],
-                                    "command": command,
-                                    "output": f"Exception during processing: {str(exc)}",
-                                    "status": "failed",
-                                }
+                        all_results.extend(
+                            _failed_results(
+                                device, commands, f"Exception during processing: {str(exc)}"
                             )
+                        )
 
     elif show_progress and TQDM_AVAILABLE:
         # Fallback to tqdm if rich not available
@@ -1863,6 +2190,7 @@ def process_devices_parallel(
                     enable_mode,
                     enable_password,
                     retry_on_failure,
+                    handshake_limiter,
                 ): device
                 for device in devices
             }
@@ -1877,17 +2205,11 @@ def process_devices_parallel(
                     all_results.extend(results)
                 except Exception as exc:
                     logger.error("Device %s generated an exception: %s", device["hostname"], exc)
-                    for command in commands:
-                        all_results.append(
-                            {
-                                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "hostname": device["hostname"],
-                                "ip_address": device["ip_address"],
-                                "command": command,
-                                "output": f"Exception during processing: {str(exc)}",
-                                "status": "failed",
-                            }
+                    all_results.extend(
+                        _failed_results(
+                            device, commands, f"Exception during processing: {str(exc)}"
                         )
+                    )
     else:
         # No progress bar
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -1906,6 +2228,7 @@ def process_devices_parallel(
                     enable_mode,
                     enable_password,
                     retry_on_failure,
+                    handshake_limiter,
                 ): device
                 for device in devices
             }
@@ -1917,50 +2240,49 @@ def process_devices_parallel(
                     all_results.extend(results)
                 except Exception as exc:
                     logger.error("Device %s generated an exception: %s", device["hostname"], exc)
-                    for command in commands:
-                        all_results.append(
-                            {
-                                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "hostname": device["hostname"],
-                                "ip_address": device["ip_address"],
-                                "command": command,
-                                "output": f"Exception during processing: {str(exc)}",
-                                "status": "failed",
-                            }
+                    all_results.extend(
+                        _failed_results(
+                            device, commands, f"Exception during processing: {str(exc)}"
                         )
+                    )
 
     return all_results
 
 
-def save_to_csv(results: List[Dict[str, str]], output_file: str) -> None:
+def save_to_csv(results: List[Result], output_file: str, compress: bool = False) -> None:
     """
     Save command outputs to a CSV file.
 
     Args:
-        results: List of result dictionaries
+        results: List of results
         output_file: Path to the output CSV file
+        compress: Gzip the output and append ".gz" to the filename
     """
     if not results:
         logger.warning("No results to save")
         return
 
-    fieldnames = ["timestamp", "hostname", "ip_address", "command", "output", "status"]
+    if compress:
+        output_file = f"{output_file}.gz"
 
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
+    with _open_output(output_file, compress, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_FIELDS)
+        writer.writerows(
+            (r.timestamp, r.hostname, r.ip_address, r.command, r.output, r.status) for r in results
+        )
 
     logger.info("Results saved to %s", output_file)
 
 
-def save_to_json(results: List[Dict[str, str]], output_file: str) -> None:
+def save_to_json(results: List[Result], output_file: str, compress: bool = False) -> None:
     """
     Save command outputs to a JSON file with beautiful formatting.
 
     Args:
-        results: List of result dictionaries
+        results: List of results
         output_file: Path to the output JSON file
+        compress: Gzip the output and append ".gz" to the filename
     """
     if not results:
         logger.warning("No results to save")
@@ -1969,20 +2291,20 @@ def save_to_json(results: List[Dict[str, str]], output_file: str) -> None:
     # Group results by device for better structure
     devices_data = {}
     for result in results:
-        hostname = result["hostname"]
+        hostname = result.hostname
         if hostname not in devices_data:
             devices_data[hostname] = {
                 "hostname": hostname,
-                "ip_address": result["ip_address"],
+                "ip_address": result.ip_address,
                 "commands": [],
             }
 
         devices_data[hostname]["commands"].append(
             {
-                "timestamp": result["timestamp"],
-                "command": result["command"],
-                "output": result["output"],
-                "status": result["status"],
+                "timestamp": result.timestamp,
+                "command": result.command,
+                "output": result.output,
+                "status": result.status,
             }
         )
 
@@ -1993,19 +2315,46 @@ def save_to_json(results: List[Dict[str, str]], output_file: str) -> None:
         "devices": list(devices_data.values()),
     }
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    if compress:
+        output_file = f"{output_file}.gz"
+
+    with _open_output(output_file, compress) as f:
         json.dump(output_data, f, indent=2, ensure_ascii=False)
 
     logger.info("JSON results saved to %s", output_file)
 
 
-def save_to_markdown(results: List[Dict[str, str]], output_file: str) -> None:
+@lru_cache(maxsize=OUTPUT_RENDER_CACHE_SIZE)
+def _render_output_markdown(output: str) -> str:
+    """
+    Render a successful command output as a Markdown code block.
+
+    Cached on the output text, so repeated runs against devices whose
+    output has not changed reuse the rendered block.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        Markdown fragment for the output section
+    """
+    return f"**Output:**\n\n```\n{output}\n```\n\n"
+
+
+def save_to_markdown(
+    results: List[Result],
+    output_file: str,
+    status_counts: Optional[Tuple[int, int]] = None,
+    compress: bool = False,
+) -> None:
     """
     Save command outputs to a Markdown file with beautiful formatting.
 
     Args:
-        results: List of result dictionaries
+        results: List of results
         output_file: Path to the output Markdown file
+        status_counts: Precomputed (successful, failed) counts, computed if omitted
+        compress: Gzip the output and append ".gz" to the filename
     """
     if not results:
         logger.warning("No results to save")
@@ -2014,17 +2363,19 @@ def save_to_markdown(results: List[Dict[str, str]], output_file: str) -> None:
     # Group by device
     devices_data = {}
     for result in results:
-        hostname = result["hostname"]
+        hostname = result.hostname
         if hostname not in devices_data:
-            devices_data[hostname] = {"ip_address": result["ip_address"], "commands": []}
+            devices_data[hostname] = {"ip_address": result.ip_address, "commands": []}
         devices_data[hostname]["commands"].append(result)
 
     # Calculate statistics
     total_commands = len(results)
-    successful = sum(1 for r in results if r["status"] == "success")
-    failed = total_commands - successful
+    successful, failed = status_counts or _count_status(results)
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    if compress:
+        output_file = f"{output_file}.gz"
+
+    with _open_output(output_file, compress) as f:
         # Header
         f.write("# Network Device Command Collection Report\n\n")
         f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
@@ -2044,388 +2395,90 @@ def save_to_markdown(results: List[Dict[str, str]], output_file: str) -> None:
             f.write(f"**IP Address:** `{data['ip_address']}`\n\n")
 
             for cmd_result in data["commands"]:
-                status_emoji = "✓" if cmd_result["status"] == "success" else "✗"
-                f.write(f"#### {status_emoji} `{cmd_result['command']}`\n\n")
-                f.write(f"**Timestamp:** {cmd_result['timestamp']}  \n")
-                f.write(f"**Status:** {cmd_result['status']}\n\n")
-
-                if cmd_result["status"] == "success":
-                    f.write("**Output:**\n\n")
-                    f.write("```\n")
-                    f.write(cmd_result["output"])
-                    f.write("\n```\n\n")
+                status_emoji = "✓" if cmd_result.status == "success" else "✗"
+                f.write(f"#### {status_emoji} `{cmd_result.command}`\n\n")
+                f.write(f"**Timestamp:** {cmd_result.timestamp}  \n")
+                f.write(f"**Status:** {cmd_result.status}\n\n")
+
+                if cmd_result.status == "success":
+                    f.write(_render_output_markdown(cmd_result.output))
                 else:
-                    f.write(f"**Error:** {cmd_result['output']}\n\n")
+                    f.write(f"**Error:** {cmd_result.output}\n\n")
 
             f.write("---\n\n")
 
     logger.info("Markdown report saved to %s", output_file)
 
 
-def save_to_html(results: List[Dict[str, str]], output_file: str) -> None:  # type: ignore
-    """
-    Save command outputs to an HTML file with beautiful Bootstrap styling.
-
-    Args:
-        results: List of result dictionaries
-        output_file: Path to the output HTML file
-    """
-    if not results:
-        logger.warning("No results to save")
-        return
-
-    # Group by device
-    devices_data = {}
-    for result in results:
-        hostname = result["hostname"]
-        if hostname not in devices_data:
-            devices_data[hostname] = {"ip_address": result["ip_address"], "commands": []}
-        devices_data[hostname]["commands"].append(result)
-
-    # Calculate statistics
-    total_commands = len(results)
-    successful = sum(1 for r in results if r["status"] == "success")
-    failed = total_commands - successful
-    success_rate = (successful / total_commands * 100) if total_commands > 0 else 0
-
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Network Device Command Collection Report</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css"
-          rel="stylesheet">
-    <link rel="stylesheet"
-          href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css">
-    <style>
-        body {{
-            background-color: #f8f9fa;
-            padding: 20px;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .stat-card {{
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .device-card {{
-            background: white;
-            border-radius: 10px;
-            padding: 25px;
-            margin-bottom: 25px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .command-output {{
-            background-color: #2d2d2d;
-            color: #f8f8f2;
-            padding: 15px;
-            border-radius: 5px;
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-            overflow-x: auto;
-            white-space: pre-wrap;
-        }}
-        .badge-success-custom {{
-            background-color: #10b981;
-        }}
-        .badge-danger-custom {{
-            background-color: #ef4444;
-        }}
-        .progress-bar-custom {{
-            background: linear-gradient(90deg, #10b981 0%, #059669 100%);
-        }}
-    </style>
-</head>
-<body>
-    <div class="container-fluid">
-        <!-- Header -->
-        <div class="header">
-            <h1><i class="bi bi-router"></i> Network Device Command
-                Collection Report</h1>
-            <p class="mb-0"><i class="bi bi-calendar"></i> Generated:
-               {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-
-        <!-- Statistics -->
-        <div class="row mb-4">
-            <div class="col-md-3">
-                <div class="stat-card bg-primary text-white">
-                    <h5><i class="bi bi-hdd-network"></i> Total Devices</h5>
-                    <h2>{len(devices_data)}</h2>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="stat-card bg-info text-white">
-                    <h5><i class="bi bi-terminal"></i> Total Commands</h5>
-                    <h2>{total_commands}</h2>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="stat-card bg-success text-white">
-                    <h5><i class="bi bi-check-circle"></i> Successful</h5>
-                    <h2>{successful}</h2>
-                </div>
-            </div>
-            <div class="col-md-3">
-                <div class="stat-card bg-danger text-white">
-                    <h5><i class="bi bi-x-circle"></i> Failed</h5>
-                    <h2>{failed}</h2>
-                </div>
-            </div>
-        </div>
-
-        <!-- Success Rate -->
-        <div class="card mb-4">
-            <div class="card-body">
-                <h5>Success Rate</h5>
-                <div class="progress" style="height: 30px;">
-                    <div class="progress-bar progress-bar-custom" role="progressbar"
-                         style="width: {success_rate}%;" aria-valuenow="{success_rate}"
-                         aria-valuemin="0" aria-valuemax="100">
-                        {success_rate:.1f}%
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Device Results -->
-        <h2 class="mb-4">Device Results</h2>
-"""
-
-    for hostname, data in devices_data.items():
-        device_success = sum(1 for c in data["commands"] if c["status"] == "success")
-        device_total = len(data["commands"])
-
-        html_content += f"""
-        <div class="device-card">
-            <h3><i class="bi bi-router-fill text-primary"></i> {hostname}</h3>
-            <p><strong>IP Address:</strong> <code>{data['ip_address']}</code></p>
-            <p><strong>Commands:</strong> {device_success}/{device_total} successful</p>
-
-            <div class="accordion" id="accordion-{hostname}">
-"""
-
-        for idx, cmd_result in enumerate(data["commands"]):
-            status_class = "success" if cmd_result["status"] == "success" else "danger"
-            status_icon = "check-circle" if cmd_result["status"] == "success" else "x-circle"
-
-            html_content += f"""
-                <div class="accordion-item">
-                    <h2 class="accordion-header">
-                        <button class="accordion-button collapsed" type="button"
-                                data-bs-toggle="collapse"
-                                data-bs-target="#collapse-{hostname}-{idx}">
-                            <i class="bi bi-{status_icon} text-{status_class} me-2"></i>
-                            <code>{cmd_result['command']}</code>
-                            <span class="badge badge-{status_class}-custom ms-2">
-                                {cmd_result['status']}</span>
-                        </button>
-                    </h2>
-                    <div id="collapse-{hostname}-{idx}" class="accordion-collapse collapse"
-                         data-bs-parent="#accordion-{hostname}">
-                        <div class="accordion-body">
-                            <p><strong>Timestamp:</strong> {cmd_result['timestamp']}</p>
-"""
-
-            if cmd_result["status"] == "success":
-                html_content += f"""
-                            <p><strong>Output:</strong></p>
-                            <div class="command-output">{cmd_result['output']}</div>
-"""
-            else:
-                html_content += f"""
-                            <div class="alert alert-danger">
-                                <strong>Error:</strong> {cmd_result['output']}
-                            </div>
-"""
-
-            html_content += """
-                        </div>
-                    </div>
-                </div>
-"""
-
-        html_content += """
-            </div>
-        </div>
-"""
-
-    html_content += """
-        <!-- Footer -->
-        <div class="text-center mt-5 mb-3 text-muted">
-            <p>Generated by Netmiko Device Command Collector v3.0
-            </p>
-        </div>
-    </div>
-
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js">
-    </script>
-</body>
-</html>
-"""
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    logger.info("HTML report saved to %s", output_file)
-
-
-def save_to_excel(results: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save command outputs to an Excel file with beautiful formatting.
-
-    Args:
-        results: List of result dictionaries
-        output_file: Path to the output Excel file
-    """
-    if not OPENPYXL_AVAILABLE:
-        logger.warning("openpyxl not installed. Cannot create Excel file.")
-        logger.info("Install with: pip install openpyxl")
-        return
-
-    if not results:
-        logger.warning("No results to save")
-        return
-
-    # Create workbook
-    wb = openpyxl.Workbook()
-
-    # Summary sheet
-    ws_summary = wb.active
-    ws_summary.title = "Summary"
-
-    # Header styling
-    header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True, size=12)
-    header_alignment = Alignment(horizontal="center", vertical="center")
-
-    # Calculate statistics
-    devices = set(r["hostname"] for r in results)
-    total_commands = len(results)
-    successful = sum(1 for r in results if r["status"] == "success")
-    failed = total_commands - successful
-
-    # Write summary
-    ws_summary["A1"] = "Network Device Command Collection Report"
-    ws_summary["A1"].font = Font(bold=True, size=16, color="4F46E5")
-    ws_summary.merge_cells("A1:B1")
-
-    ws_summary["A3"] = "Generated:"
-    ws_summary["B3"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    ws_summary["A5"] = "Metric"
-    ws_summary["B5"] = "Value"
-    ws_summary["A5"].fill = header_fill
-    ws_summary["B5"].fill = header_fill
-    ws_summary["A5"].font = header_font
-    ws_summary["B5"].font = header_font
-
-    summary_data = [
-        ("Total Devices", len(devices)),
-        ("Total Commands", total_commands),
-        ("Successful", successful),
-        ("Failed", failed),
-        ("Success Rate", f"{(successful/total_commands*100):.1f}%"),
-    ]
-
-    for idx, (metric, value) in enumerate(summary_data, start=6):
-        ws_summary[f"A{idx}"] = metric
-        ws_summary[f"B{idx}"] = value
-        if metric == "Successful":
-            ws_summary[f"B{idx}"].font = Font(color="10B981", bold=True)
-        elif metric == "Failed" and failed > 0:
-            ws_summary[f"B{idx}"].font = Font(color="EF4444", bold=True)
-
-    ws_summary.column_dimensions["A"].width = 20
-    ws_summary.column_dimensions["B"].width = 20
-
-    # Detailed results sheet
-    ws_details = wb.create_sheet("Detailed Results")
-
-    headers = ["Timestamp", "Hostname", "IP Address", "Command", "Output", "Status"]
-    for col_num, header in enumerate(headers, 1):
-        cell = ws_details.cell(row=1, column=col_num)
-        cell.value = header
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-
-    # Write data
-    for row_num, result in enumerate(results, start=2):
-        ws_details.cell(row=row_num, column=1, value=result["timestamp"])
-        ws_details.cell(row=row_num, column=2, value=result["hostname"])
-        ws_details.cell(row=row_num, column=3, value=result["ip_address"])
-        ws_details.cell(row=row_num, column=4, value=result["command"])
-        ws_details.cell(row=row_num, column=5, value=result["output"])
-
-        status_cell = ws_details.cell(row=row_num, column=6, value=result["status"])
-
-        if result["status"] == "success":
-            status_cell.fill = PatternFill(
-                start_color="D1FAE5", end_color="D1FAE5", fill_type="solid"
-            )
-            status_cell.font = Font(color="059669", bold=True)
-        else:
-            status_cell.fill = PatternFill(
-                start_color="FEE2E2", end_color="FEE2E2", fill_type="solid"
-            )
-            status_cell.font = Font(color="DC2626", bold=True)
-
-    # Adjust column widths
-    ws_details.column_dimensions["A"].width = 20
-    ws_details.column_dimensions["B"].width = 20
-    ws_details.column_dimensions["C"].width = 15
-    ws_details.column_dimensions["D"].width = 30
-    ws_details.column_dimensions["E"].width = 50
-    ws_details.column_dimensions["F"].width = 12
-
-    # Freeze header row
-    ws_details.freeze_panes = "A2"
-
-    # Save workbook
-    wb.save(output_file)
-    logger.info("Excel report saved to %s", output_file)
-
-
 def save_results(
-    results: List[Dict[str, str]], output_file: str, formats: Optional[List[str]] = None
+    results: List[Result],
+    output_file: str,
+    formats: Optional[List[str]] = None,
+    compress: bool = False,
+    parallel: bool = True,
 ) -> None:
     """
     Save results in multiple formats.
 
     Args:
-        results: List of result dictionaries
+        results: List of results
         output_file: Base output filename (extension will be replaced)
         formats: List of formats to save ('csv', 'json', 'html', 'markdown', 'excel')
+        compress: Gzip text formats (Excel files are already zip-compressed)
+        parallel: Write the formats concurrently instead of one after another.
+            A single format is always written on the calling thread; HTML and
+            Excel run in worker processes, the other formats in threads.
     """
     if formats is None:
         formats = ["csv"]
 
     base_name = output_file.rsplit(".", 1)[0]
+    status_counts = _count_status(results)
 
+    # (writer, writer arguments after results)
+    tasks = []
     for fmt in formats:
         if fmt == "csv":
-            save_to_csv(results, f"{base_name}.csv")
+            tasks.append((save_to_csv, (f"{base_name}.csv", compress)))
         elif fmt == "json":
-            save_to_json(results, f"{base_name}.json")
+            tasks.append((save_to_json, (f"{base_name}.json", compress)))
         elif fmt == "html":
-            save_to_html(results, f"{base_name}.html")
+            tasks.append((save_to_html, (f"{base_name}.html", status_counts, compress)))
         elif fmt in ("markdown", "md"):
-            save_to_markdown(results, f"{base_name}.md")
+            tasks.append((save_to_markdown, (f"{base_name}.md", status_counts, compress)))
         elif fmt in ("excel", "xlsx"):
-            save_to_excel(results, f"{base_name}.xlsx")
+            tasks.append((save_to_excel, (f"{base_name}.xlsx", status_counts)))
         else:
             logger.warning("Unknown format: %s", fmt)
 
+    if not (parallel and len(tasks) > 1):
+        for writer, args in tasks:
+            writer(results, *args)
+        return
+
+    process_pool = None
+    if any(is_cpu_bound(writer) for writer, _ in tasks):
+        try:
+            process_pool = get_pool()
+        except OSError as e:
+            logger.debug("Process pool unavailable, saving in threads: %s", e)
+
+    # The writers only read the shared results, so they can run side by side.
+    # CPU-bound writers go to the worker processes, the rest stay on threads.
+    payload = None
+    with ThreadPoolExecutor(max_workers=min(len(tasks), MAX_SAVE_WORKERS)) as executor:
+        futures = []
+        for writer, args in tasks:
+            if process_pool is not None and is_cpu_bound(writer):
+                # Pickle the results once for every process-bound writer
+                if payload is None:
+                    payload = pickle_results(results)
+                futures.append(process_pool.submit(run_pickled, writer, payload, *args))
+            else:
+                futures.append(executor.submit(writer, results, *args))
+        for future in futures:
+            future.result()
+
 
 # ====================================================================================
 # TYPER CLI APPLICATION
@@ -2489,6 +2542,50 @@ def run_collection(
         bool, typer.Option("--no-strip-whitespace", help="Don't strip whitespace")
     ] = False,
     no_retry: Annotated[bool, typer.Option("--no-retry", help="Disable retry on failure")] = False,
+    compress: Annotated[
+        bool, typer.Option("--compress", help="Gzip text output files (.gz)")
+    ] = False,
+    parallel_save: Annotated[
+        bool,
+        typer.Option(
+            "--parallel-save/--sequential-save", help="Write output formats concurrently"
+        ),
+    ] = True,
+    handshake_rate: Annotated[
+        float,
+        typer.Option(
+            "--handshake-rate",
+            min=0,
+            help="Maximum new SSH connections per second (0 disables the limit)",
+        ),
+    ] = HANDSHAKE_RATE,
+    pre_resolve: Annotated[
+        bool,
+        typer.Option(
+            "--pre-resolve/--no-pre-resolve",
+            help="Resolve device hostnames up front and connect to the resolved IP",
+        ),
+    ] = False,
+    dns_cache: Annotated[
+        bool,
+        typer.Option(
+            "--dns-cache",
+            help=f"Keep pre-resolved addresses on disk for {DNS_CACHE_TTL}s (ignores record TTLs)",
+        ),
+    ] = False,
+    credential_cache: Annotated[
+        bool,
+        typer.Option(
+            "--credential-cache/--no-credential-cache",
+            help="Reuse and store passwords in the OS keyring",
+        ),
+    ] = False,
+    reset_credentials: Annotated[
+        bool,
+        typer.Option(
+            "--reset-credentials", help="Remove cached passwords from the keyring before prompting"
+        ),
+    ] = False,
 ):
     """
     Run command collection on network devices.
@@ -2527,14 +2624,21 @@ def run_collection(
     if not username:
         username = typer.prompt("Enter SSH username")
 
-    password = getpass("Enter SSH password: ")
+    if reset_credentials:
+        forget_password(username, KEYRING_SERVICE)
+        forget_password(username, KEYRING_ENABLE_SERVICE)
+
+    password = get_password("Enter SSH password: ", username, use_cache=credential_cache)
 
     # Ask about enable mode if config has it enabled
     if config.get("enable_mode", False) and not enable_mode:
         if typer.confirm("Enter enable mode?", default=True):
             enable_mode = True
-            enable_password = getpass(
-                "Enter enable password (or press Enter to use SSH password): "
+            enable_password = get_password(
+                "Enter enable password (or press Enter to use SSH password): ",
+                username,
+                KEYRING_ENABLE_SERVICE,
+                use_cache=credential_cache,
             )
             if not enable_password:
                 enable_password = password
@@ -2552,24 +2656,29 @@ def run_collection(
     strip_whitespace = not no_strip_whitespace
     retry_on_failure = not no_retry
 
-    # Process formats
-    output_formats = []
-    for fmt in output_format:
-        if fmt in ["markdown", "md"]:
-            output_formats.append("markdown")
-        elif fmt in ["excel", "xlsx"]:
-            output_formats.append("excel")
-        elif fmt == "all":
-            output_formats = ["csv", "json", "html", "markdown", "excel"]
-            break
-        else:
-            output_formats.append(fmt)
+    # Process formats (canonical names, duplicates dropped, order kept)
+    if "all" in output_format:
+        output_formats = list(_ALL_FORMATS)
+    else:
+        output_formats = list(dict.fromkeys(_FMT_ALIASES.get(fmt, fmt) for fmt in output_format))
 
     # Load devices and commands
     try:
         devices_list = load_devices(devices, device_type)
         commands_list = load_commands(commands)
 
+        # Devices behind an SSH config may rely on Host aliases or reach the
+        # device through a ProxyJump/ProxyCommand, so keep their names for
+        # OpenSSH-style matching
+        if pre_resolve and not ssh_config:
+            resolved = batch_resolve(
+                [d["ip_address"] for d in devices_list if not d.get("ssh_config_file")],
+                persist=dns_cache,
+            )
+            for device in devices_list:
+                if device["ip_address"] in resolved and not device.get("ssh_config_file"):
+                    device["resolved_ip"] = resolved[device["ip_address"]]
+
         typer.secho(
             f"\n✅ Loaded {len(devices_list)} device(s) and {len(commands_list)} command(s)",
             fg=typer.colors.GREEN,
@@ -2591,10 +2700,20 @@ def run_collection(
             enable_password,
             retry_on_failure,
             show_progress=True,
+            handshake_limiter=HandshakeLimiter(handshake_rate) if handshake_rate > 0 else None,
         )
 
+        # A cached password that was rejected (rotated or mistyped) would fail
+        # every later run, so drop it and prompt again next time
+        if credential_cache and any(r.output == AUTH_FAILED_MESSAGE for r in all_results):
+            forget_password(username, KEYRING_SERVICE)
+            typer.secho(
+                "⚠️  Authentication failed; the cached password was removed from the keyring",
+                fg=typer.colors.YELLOW,
+            )
+
         # Save results
-        save_results(all_results, output, output_formats)
+        save_results(all_results, output, output_formats, compress, parallel_save)
 
         typer.secho("\n✅ Collection completed successfully!", fg=typer.colors.GREEN, bold=True)
 
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-pool report writers for the Netmiko Device Command Collector
+
+The HTML and Excel writers are CPU-bound pure Python, so running them on
+threads gives no real concurrency. They live in this module rather than in
+the collector script so that a worker process only has to import this file:
+the writers pickle by reference to it under both fork and spawn, and the
+results cross the process boundary as plain tuples rather than as
+collector objects.
+
+The pool is created on first use, shared by every save in an invocation
+and shut down at exit.
+"""
+
+import atexit
+import gzip
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, NamedTuple, Optional, Protocol, Sequence, TextIO, Tuple
+
+# HTML escaping table for report output (&, <, >, ")
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# gzip level for --compress output (favours speed over ratio)
+GZIP_COMPRESS_LEVEL = 3
+
+# Rendered output fragments kept for reuse across report runs
+OUTPUT_RENDER_CACHE_SIZE = 65536
+
+# Worker processes in the shared pool (one per CPU-bound writer)
+POOL_WORKERS = 2
+
+try:
+    import openpyxl
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class ResultRecord(Protocol):
+    """Fields the report writers read from a collector Result or a ReportRow."""
+
+    @property
+    def timestamp(self) -> str: ...
+
+    @property
+    def hostname(self) -> str: ...
+
+    @property
+    def ip_address(self) -> str: ...
+
+    @property
+    def command(self) -> str: ...
+
+    @property
+    def output(self) -> str: ...
+
+    @property
+    def status(self) -> str: ...
+
+
+class ReportRow(NamedTuple):
+    """Plain copy of a collector Result, rebuilt in worker processes."""
+
+    timestamp: str
+    hostname: str
+    ip_address: str
+    command: str
+    output: str
+    status: str
+
+
+_row_fields = attrgetter(*ReportRow._fields)
+
+# Writers registered with @cpu_bound, run in the process pool by save_results
+_CPU_BOUND_WRITERS: set = set()
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def cpu_bound(writer: Callable) -> Callable:
+    """
+    Register a module-level writer to run in the shared process pool.
+
+    Args:
+        writer: Writer called as writer(results, *args)
+
+    Returns:
+        The writer, unchanged
+    """
+    _CPU_BOUND_WRITERS.add(writer)
+    return writer
+
+
+def is_cpu_bound(writer: Callable) -> bool:
+    """Check whether a writer was registered with @cpu_bound."""
+    return writer in _CPU_BOUND_WRITERS
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool shared by every save in this invocation.
+
+    The pool is created on first use, so runs that never write a CPU-bound
+    format do not start worker processes.
+
+    Returns:
+        The shared ProcessPoolExecutor
+
+    Raises:
+        OSError: If worker processes cannot be started
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+        atexit.register(_shutdown_pool)
+    return _POOL
+
+
+def _shutdown_pool() -> None:
+    """Wait for pending writes and stop the worker processes."""
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+        _POOL = None
+
+
+def pickle_results(results: Sequence[ResultRecord]) -> bytes:
+    """
+    Serialize results once for every process-bound writer.
+
+    Args:
+        results: List of results
+
+    Returns:
+        Pickled list of plain field tuples
+    """
+    return pickle.dumps([_row_fields(r) for r in results], pickle.HIGHEST_PROTOCOL)
+
+
+def run_pickled(writer: Callable, payload: bytes, *args) -> None:
+    """
+    Rebuild pickled results in a worker process and hand them to a writer.
+
+    Args:
+        writer: Module-level writer registered with @cpu_bound
+        payload: Output of pickle_results
+        *args: Writer arguments after the results
+    """
+    writer([ReportRow._make(row) for row in pickle.loads(payload)], *args)
+
+
+def _count_status(results: Sequence[ResultRecord]) -> Tuple[int, int]:
+    """
+    Count successful and failed results in a single pass.
+
+    Args:
+        results: List of results
+
+    Returns:
+        Tuple of (successful, failed) counts
+    """
+    successful = [r.status for r in results].count("success")
+    return successful, len(results) - successful
+
+
+def _open_output(output_file: str, compress: bool = False, newline: Optional[str] = None) -> TextIO:
+    """
+    Open an output file for text writing, optionally through gzip.
+
+    Args:
+        output_file: Path to the output file
+        compress: Write through a gzip stream instead of a plain file
+        newline: Newline translation passed to the underlying text stream
+
+    Returns:
+        Writable text file object
+    """
+    if compress:
+        return gzip.open(  # type: ignore[return-value]
+            output_file,
+            "wt",
+            compresslevel=GZIP_COMPRESS_LEVEL,
+            encoding="utf-8",
+            newline=newline,
+        )
+    return open(output_file, "w", encoding="utf-8", newline=newline)
+
+
+@lru_cache(maxsize=OUTPUT_RENDER_CACHE_SIZE)
+def _render_output_html(output: str) -> str:
+    """
+    Render a successful command output as an escaped HTML fragment.
+
+    Cached on the output text, so repeated runs against devices whose
+    output has not changed skip re-escaping it.
+
+    Args:
+        output: Raw command output
+
+    Returns:
+        HTML fragment for the output section
+    """
+    return f"""
+                            <p><strong>Output:</strong></p>
+                            <div class="command-output">{output.translate(_HTML_ESCAPE)}</div>
+"""
+
+
+@cpu_bound
+def save_to_html(
+    results: Sequence[ResultRecord],
+    output_file: str,
+    status_counts: Optional[Tuple[int, int]] = None,
+    compress: bool = False,
+) -> None:  # type: ignore
+    """
+    Save command outputs to an HTML file with beautiful Bootstrap styling.
+
+    Args:
+        results: List of results
+        output_file: Path to the output HTML file
+        status_counts: Precomputed (successful, failed) counts, computed if omitted
+        compress: Gzip the output and append ".gz" to the filename
+    """
+    if not results:
+        logger.warning("No results to save")
+        return
+
+    # Group by device
+    devices_data = {}
+    for result in results:
+        hostname = result.hostname
+        if hostname not in devices_data:
+            devices_data[hostname] = {"ip_address": result.ip_address, "commands": []}
+        devices_data[hostname]["commands"].append(result)
+
+    # Calculate statistics
+    total_commands = len(results)
+    successful, failed = status_counts or _count_status(results)
+    success_rate = (successful / total_commands * 100) if total_commands > 0 else 0
+
+    html_content = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Network Device Command Collection Report</title>
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css"
+          rel="stylesheet">
+    <link rel="stylesheet"
+          href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.10.0/font/bootstrap-icons.css">
+    <style>
+        body {{
+            background-color: #f8f9fa;
+            padding: 20px;
+        }}
+        .header {{
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }}
+        .stat-card {{
+            border-radius: 10px;
+            padding: 20px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        .device-card {{
+            background: white;
+            border-radius: 10px;
+            padding: 25px;
+            margin-bottom: 25px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+        .command-output {{
+            background-color: #2d2d2d;
+            color: #f8f8f2;
+            padding: 15px;
+            border-radius: 5px;
+            font-family: 'Courier New', monospace;
+            font-size: 14px;
+            overflow-x: auto;
+            white-space: pre-wrap;
+        }}
+        .badge-success-custom {{
+            background-color: #10b981;
+        }}
+        .badge-danger-custom {{
+            background-color: #ef4444;
+        }}
+        .progress-bar-custom {{
+            background: linear-gradient(90deg, #10b981 0%, #059669 100%);
+        }}
+    </style>
+</head>
+<body>
+    <div class="container-fluid">
+        <!-- Header -->
+        <div class="header">
+            <h1><i class="bi bi-router"></i> Network Device Command
+                Collection Report</h1>
+            <p class="mb-0"><i class="bi bi-calendar"></i> Generated:
+               {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        </div>
+
+        <!-- Statistics -->
+        <div class="row mb-4">
+            <div class="col-md-3">
+                <div class="stat-card bg-primary text-white">
+                    <h5><i class="bi bi-hdd-network"></i> Total Devices</h5>
+                    <h2>{len(devices_data)}</h2>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stat-card bg-info text-white">
+                    <h5><i class="bi bi-terminal"></i> Total Commands</h5>
+                    <h2>{total_commands}</h2>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stat-card bg-success text-white">
+                    <h5><i class="bi bi-check-circle"></i> Successful</h5>
+                    <h2>{successful}</h2>
+                </div>
+            </div>
+            <div class="col-md-3">
+                <div class="stat-card bg-danger text-white">
+                    <h5><i class="bi bi-x-circle"></i> Failed</h5>
+                    <h2>{failed}</h2>
+                </div>
+            </div>
+        </div>
+
+        <!-- Success Rate -->
+        <div class="card mb-4">
+            <div class="card-body">
+                <h5>Success Rate</h5>
+                <div class="progress" style="height: 30px;">
+                    <div class="progress-bar progress-bar-custom" role="progressbar"
+                         style="width: {success_rate}%;" aria-valuenow="{success_rate}"
+                         aria-valuemin="0" aria-valuemax="100">
+                        {success_rate:.1f}%
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Device Results -->
+        <h2 class="mb-4">Device Results</h2>
+"""
+
+    for hostname, data in devices_data.items():
+        device_success = sum(1 for c in data["commands"] if c.status == "success")
+        device_total = len(data["commands"])
+        host = hostname.translate(_HTML_ESCAPE)
+        ip_address = data["ip_address"].translate(_HTML_ESCAPE)
+
+        html_content += f"""
+        <div class="device-card">
+            <h3><i class="bi bi-router-fill text-primary"></i> {host}</h3>
+            <p><strong>IP Address:</strong> <code>{ip_address}</code></p>
+            <p><strong>Commands:</strong> {device_success}/{device_total} successful</p>
+
+            <div class="accordion" id="accordion-{host}">
+"""
+
+        for idx, cmd_result in enumerate(data["commands"]):
+            status_class = "success" if cmd_result.status == "success" else "danger"
+            status_icon = "check-circle" if cmd_result.status == "success" else "x-circle"
+            command = cmd_result.command.translate(_HTML_ESCAPE)
+
+            html_content += f"""
+                <div class="accordion-item">
+                    <h2 class="accordion-header">
+                        <button class="accordion-button collapsed" type="button"
+                                data-bs-toggle="collapse"
+                                data-bs-target="#collapse-{host}-{idx}">
+                            <i class="bi bi-{status_icon} text-{status_class} me-2"></i>
+                            <code>{command}</code>
+                            <span class="badge badge-{status_class}-custom ms-2">
+                                {cmd_result.status}</span>
+                        </button>
+                    </h2>
+                    <div id="collapse-{host}-{idx}" class="accordion-collapse collapse"
+                         data-bs-parent="#accordion-{host}">
+                        <div class="accordion-body">
+                            <p><strong>Timestamp:</strong> {cmd_result.timestamp}</p>
+"""
+
+            if cmd_result.status == "success":
+                html_content += _render_output_html(cmd_result.output)
+            else:
+                html_content += f"""
+                            <div class="alert alert-danger">
+                                <strong>Error:</strong> {cmd_result.output.translate(_HTML_ESCAPE)}
+                            </div>
+"""
+
+            html_content += """
+                        </div>
+                    </div>
+                </div>
+"""
+
+        html_content += """
+            </div>
+        </div>
+"""
+
+    html_content += """
+        <!-- Footer -->
+        <div class="text-center mt-5 mb-3 text-muted">
+            <p>Generated by Netmiko Device Command Collector v3.0
+            </p>
+        </div>
+    </div>
+
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js">
+    </script>
+</body>
+</html>
+"""
+
+    if compress:
+        output_file = f"{output_file}.gz"
+
+    with _open_output(output_file, compress) as f:
+        f.write(html_content)
+
+    logger.info("HTML report saved to %s", output_file)
+
+
+@cpu_bound
+def save_to_excel(
+    results: Sequence[ResultRecord],
+    output_file: str,
+    status_counts: Optional[Tuple[int, int]] = None,
+) -> None:
+    """
+    Save command outputs to an Excel file with beautiful formatting.
+
+    Args:
+        results: List of results
+        output_file: Path to the output Excel file
+        status_counts: Precomputed (successful, failed) counts, computed if omitted
+    """
+    if not OPENPYXL_AVAILABLE:
+        logger.warning("openpyxl not installed. Cannot create Excel file.")
+        logger.info("Install with: pip install openpyxl")
+        return
+
+    if not results:
+        logger.warning("No results to save")
+        return
+
+    # Create workbook
+    wb = openpyxl.Workbook()
+
+    # Summary sheet
+    ws_summary = wb.active
+    ws_summary.title = "Summary"
+
+    # Header styling
+    header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
+    header_font = Font(color="FFFFFF", bold=True, size=12)
+    header_alignment = Alignment(horizontal="center", vertical="center")
+
+    # Calculate statistics
+    devices = set(r.hostname for r in results)
+    total_commands = len(results)
+    successful, failed = status_counts or _count_status(results)
+
+    # Write summary
+    ws_summary["A1"] = "Network Device Command Collection Report"
+    ws_summary["A1"].font = Font(bold=True, size=16, color="4F46E5")
+    ws_summary.merge_cells("A1:B1")
+
+    ws_summary["A3"] = "Generated:"
+    ws_summary["B3"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    ws_summary["A5"] = "Metric"
+    ws_summary["B5"] = "Value"
+    ws_summary["A5"].fill = header_fill
+    ws_summary["B5"].fill = header_fill
+    ws_summary["A5"].font = header_font
+    ws_summary["B5"].font = header_font
+
+    summary_data = [
+        ("Total Devices", len(devices)),
+        ("Total Commands", total_commands),
+        ("Successful", successful),
+        ("Failed", failed),
+        ("Success Rate", f"{(successful/total_commands*100):.1f}%"),
+    ]
+
+    for idx, (metric, value) in enumerate(summary_data, start=6):
+        ws_summary[f"A{idx}"] = metric
+        ws_summary[f"B{idx}"] = value
+        if metric == "Successful":
+            ws_summary[f"B{idx}"].font = Font(color="10B981", bold=True)
+        elif metric == "Failed" and failed > 0:
+            ws_summary[f"B{idx}"].font = Font(color="EF4444", bold=True)
+
+    ws_summary.column_dimensions["A"].width = 20
+    ws_summary.column_dimensions["B"].width = 20
+
+    # Detailed results sheet
+    ws_details = wb.create_sheet("Detailed Results")
+
+    headers = ["Timestamp", "Hostname", "IP Address", "Command", "Output", "Status"]
+    for col_num, header in enumerate(headers, 1):
+        cell = ws_details.cell(row=1, column=col_num)
+        cell.value = header
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = header_alignment
+
+    # Write data
+    for row_num, result in enumerate(results, start=2):
+        ws_details.cell(row=row_num, column=1, value=result.timestamp)
+        ws_details.cell(row=row_num, column=2, value=result.hostname)
+        ws_details.cell(row=row_num, column=3, value=result.ip_address)
+        ws_details.cell(row=row_num, column=4, value=result.command)
+        ws_details.cell(row=row_num, column=5, value=result.output)
+
+        status_cell = ws_details.cell(row=row_num, column=6, value=result.status)
+
+        if result.status == "success":
+            status_cell.fill = PatternFill(
+                start_color="D1FAE5", end_color="D1FAE5", fill_type="solid"
+            )
+            status_cell.font = Font(color="059669", bold=True)
+        else:
+            status_cell.fill = PatternFill(
+                start_color="FEE2E2", end_color="FEE2E2", fill_type="solid"
+            )
+            status_cell.font = Font(color="DC2626", bold=True)
+
+    # Adjust column widths
+    ws_details.column_dimensions["A"].width = 20
+    ws_details.column_dimensions["B"].width = 20
+    ws_details.column_dimensions["C"].width = 15
+    ws_details.column_dimensions["D"].width = 30
+    ws_details.column_dimensions["E"].width = 50
+    ws_details.column_dimensions["F"].width = 12
+
+    # Freeze header row
+    ws_details.freeze_panes = "A2"
+
+    # Save workbook
+    wb.save(output_file)
+    logger.info("Excel report saved to %s", output_file)
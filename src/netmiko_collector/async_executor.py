@@ -0,0 +1,271 @@
+"""Event-loop based command execution using asyncssh.
+
+This module provides an asyncio alternative to the ThreadPoolExecutor
+orchestration in executor.py. Every device session runs as a coroutine on a
+single thread, so SSH handshakes and command reads become await points
+instead of blocked worker threads.
+
+asyncssh is an optional dependency; callers should check
+``supports_async(devices)`` and fall back to ``execute_on_devices`` otherwise.
+Synchronous callers use ``run_on_devices_async``, which drives the coroutine
+with ``asyncio.run``.
+"""
+
+import asyncio
+import importlib.util
+import time
+from typing import Callable, Optional
+
+from .executor import ExecutionStats
+from .models import AuthMethod, Command, Device, DeviceType, ExecutionResult, ExecutionStatus
+from .ssh import SSHConfig, _failed_results
+
+
+# Device types whose SSH servers run commands on an exec channel, which is
+# what asyncssh's ``conn.run()`` uses. Other platforms need Netmiko's
+# interactive shell handling and stay on the threaded executor.
+ASYNC_DEVICE_TYPES = frozenset({
+    DeviceType.ARISTA_EOS,
+    DeviceType.JUNIPER_JUNOS,
+    DeviceType.GENERIC,
+})
+
+ProgressCallback = Callable[[ExecutionStats, Device, list[ExecutionResult]], None]
+"""Signature of the per-device progress callback shared with execute_on_devices."""
+
+
+def _import_asyncssh():
+    """Import asyncssh, raising a helpful error if it is missing."""
+    try:
+        import asyncssh
+    except ImportError:
+        raise ImportError(
+            "asyncssh is required for async execution. "
+            "Install with: pip install asyncssh"
+        )
+    return asyncssh
+
+
+def asyncssh_available() -> bool:
+    """Check whether asyncssh can be imported."""
+    return importlib.util.find_spec("asyncssh") is not None
+
+
+def supports_async(devices: list[Device]) -> bool:
+    """Check whether the async executor can handle all given devices.
+
+    Args:
+        devices: Devices that will be executed against
+
+    Returns:
+        True if asyncssh is installed and every device type is exec-capable
+    """
+    return asyncssh_available() and all(
+        device.device_type in ASYNC_DEVICE_TYPES for device in devices
+    )
+
+
+def _connect_options(device: Device, ssh_config: SSHConfig) -> dict:
+    """Build asyncssh.connect() keyword arguments for a device."""
+    options = {
+        "host": device.hostname,
+        "port": device.port,
+        "username": device.username,
+        "connect_timeout": ssh_config.timeout,
+        # known_hosts is left at asyncssh's default, so host keys are still
+        # checked against ~/.ssh/known_hosts
+    }
+
+    auth_method = device.auth_method
+    if auth_method is AuthMethod.PASSWORD:
+        options["password"] = device.password or ""
+    elif auth_method is AuthMethod.KEY and device.ssh_key_file:
+        options["client_keys"] = [device.ssh_key_file]
+
+    if device.ssh_config:
+        options["config"] = [device.ssh_config]
+
+    return options
+
+
+async def execute_commands_on_device_async(
+    asyncssh,
+    device: Device,
+    commands: list[Command],
+    ssh_config: Optional[SSHConfig] = None,
+) -> list[ExecutionResult]:
+    """Execute commands on a device over a single asyncssh connection.
+
+    Args:
+        asyncssh: The imported asyncssh module
+        device: Device to connect to
+        commands: List of commands to execute
+        ssh_config: SSH configuration options
+
+    Returns:
+        List of ExecutionResult for each command
+    """
+    ssh_config = ssh_config or SSHConfig()
+    results: list[ExecutionResult] = []
+
+    try:
+        async with asyncssh.connect(**_connect_options(device, ssh_config)) as conn:
+            for command in commands:
+                start = time.monotonic()
+                try:
+                    completed = await asyncio.wait_for(
+                        conn.run(command.command, check=False),
+                        timeout=command.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    results.append(
+                        ExecutionResult(
+                            device=device,
+                            command=command,
+                            output="",
+                            status=ExecutionStatus.TIMEOUT,
+                            error=f"Command timeout after {command.timeout}s",
+                            duration=time.monotonic() - start,
+                        )
+                    )
+                    continue
+
+                succeeded = completed.exit_status in (0, None)
+                results.append(
+                    ExecutionResult(
+                        device=device,
+                        command=command,
+                        output=completed.stdout or "",
+                        status=ExecutionStatus.SUCCESS if succeeded else ExecutionStatus.FAILED,
+                        error="" if succeeded else (completed.stderr or ""),
+                        duration=time.monotonic() - start,
+                    )
+                )
+    except asyncssh.PermissionDenied as e:
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.FAILED,
+                            f"Authentication failed: {str(e)}")
+        )
+    except asyncio.TimeoutError as e:
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.TIMEOUT,
+                            f"Connection timeout: {str(e)}")
+        )
+    except (OSError, asyncssh.Error) as e:
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.FAILED,
+                            f"Connection error: {str(e)}")
+        )
+
+    return results
+
+
+async def execute_on_devices_async(
+    devices: list[Device],
+    commands: list[Command],
+    max_workers: int = 10,
+    ssh_config: Optional[SSHConfig] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    sink: Optional[Callable[[ExecutionResult], None]] = None,
+) -> tuple[list[ExecutionResult], ExecutionStats]:
+    """Execute commands on multiple devices concurrently on one event loop.
+
+    Mirrors ``execute_on_devices``: an ``asyncio.Semaphore`` bounds the number
+    of open sessions to ``max_workers`` and ``progress_callback`` is invoked as
+    each device completes.
+
+    Args:
+        devices: List of devices to execute commands on
+        commands: List of commands to execute on each device
+        max_workers: Maximum number of concurrent device connections
+        ssh_config: SSH configuration options
+        progress_callback: Optional callback(stats, device, results) called after
+            each device completes
+        sink: Optional callable receiving each result instead of it being retained
+
+    Returns:
+        Tuple of (all_results, execution_stats)
+
+    Raises:
+        ImportError: If asyncssh is not installed
+
+    Example:
+        >>> results, stats = asyncio.run(
+        ...     execute_on_devices_async(devices, commands, max_workers=50)
+        ... )
+    """
+    asyncssh = _import_asyncssh()
+
+    stats = ExecutionStats()
+    stats.start(len(devices), len(commands))
+
+    all_results: list[ExecutionResult] = []
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run_device(device: Device) -> tuple[Device, list[ExecutionResult]]:
+        async with semaphore:
+            try:
+                results = await execute_commands_on_device_async(
+                    asyncssh, device, commands, ssh_config
+                )
+            except Exception as e:
+                results = _failed_results(device, commands, ExecutionStatus.FAILED,
+                                          f"Executor error: {str(e)}")
+            return device, results
+
+    for next_done in asyncio.as_completed([run_device(device) for device in devices]):
+        device, results = await next_done
+        if sink is not None:
+            for result in results:
+                sink(result)
+        else:
+            all_results.extend(results)
+        stats.record_device_results(results)
+
+        if progress_callback:
+            progress_callback(stats, device, results)
+
+    stats.finish()
+    return all_results, stats
+
+
+def run_on_devices_async(
+    devices: list[Device],
+    commands: list[Command],
+    max_workers: int = 10,
+    ssh_config: Optional[SSHConfig] = None,
+    progress_callback: Optional[ProgressCallback] = None,
+    sink: Optional[Callable[[ExecutionResult], None]] = None,
+) -> tuple[list[ExecutionResult], ExecutionStats]:
+    """Run ``execute_on_devices_async`` to completion from synchronous code.
+
+    Drop-in replacement for ``execute_on_devices``. Because sessions are
+    coroutines rather than threads, ``max_workers`` can be raised to
+    hundreds without a thread stack per connection.
+
+    Args:
+        devices: List of devices to execute commands on
+        commands: List of commands to execute on each device
+        max_workers: Maximum number of concurrent device connections
+        ssh_config: SSH configuration options
+        progress_callback: Optional callback(stats, device, results) called after
+            each device completes
+        sink: Optional callable receiving each result instead of it being retained
+
+    Returns:
+        Tuple of (all_results, execution_stats)
+
+    Raises:
+        ImportError: If asyncssh is not installed
+        RuntimeError: If called from a running event loop
+    """
+    return asyncio.run(
+        execute_on_devices_async(
+            devices,
+            commands,
+            max_workers=max_workers,
+            ssh_config=ssh_config,
+            progress_callback=progress_callback,
+            sink=sink,
+        )
+    )
@@ -5,6 +5,7 @@ This module provides the main CLI entry point using Typer for command-line
 argument parsing and Rich for beautiful console output.
 """
 
+from functools import partial
 from pathlib import Path
 from typing import Optional
 import sys
@@ -21,11 +22,11 @@ from . import __version__
 from .config import Config
 from .devices import load_devices_from_csv
 from .commands import load_commands_from_file
-from .executor import execute_on_devices
-from .formatters import get_formatter
+from .pool import ConnectionPool
 from .ui import (
+    BatchedProgress,
     create_progress_bar,
-    create_device_summary,
+    create_stats_summary,
     print_error,
     print_success,
     print_warning,
@@ -115,6 +116,20 @@ def main(
         min=1,
         max=100,
     ),
+    use_async: bool = typer.Option(
+        False,
+        "--async",
+        help=(
+            "Run sessions on an asyncssh event loop (Arista EOS, Juniper Junos and "
+            "generic devices only). Host keys are verified against ~/.ssh/known_hosts, "
+            "and retries, enable mode, proxy jump and the connection pool are not supported"
+        ),
+    ),
+    connection_pool: bool = typer.Option(
+        False,
+        "--connection-pool",
+        help="Reuse idle SSH sessions for devices listed more than once in the inventory",
+    ),
     version: bool = typer.Option(
         False,
         "--version",
@@ -130,6 +145,15 @@ def main(
     This tool connects to multiple network devices concurrently, executes
     specified commands, and collects the outputs into a structured format.
     """
+    # Imported on first use rather than at module level: the executors pull
+    # in netmiko/paramiko, which dominate import time, so --version and
+    # --help stay fast
+    from .async_executor import run_on_devices_async, supports_async
+    from .executor import execute_on_devices
+    from .formatters import get_formatter
+    from .formatters.base import WRITE_BUFFER_SIZE
+    from .sink import ResultSink
+    
     try:
         # Load devices from CSV
         print_warning(f"Loading devices from {devices_file}...")
@@ -152,56 +176,100 @@ def main(
             ssh_key_file=ssh_key,
             ssh_config_file=ssh_config,
             max_workers=workers,
+            use_async=use_async,
+            connection_pool_enabled=connection_pool,
         )
         
         # Execute commands on devices
         console.print("\n[bold cyan]Executing commands on devices...[/bold cyan]")
         
+        # The async executor is opt-in: it checks host keys and skips the
+        # retry, enable and proxy handling of the Netmiko path
+        run_async = config.use_async and supports_async(devices)
+        if config.use_async and not run_async:
+            print_warning(
+                "--async needs asyncssh and only supports Arista EOS, Juniper Junos "
+                "and generic devices; using the threaded executor"
+            )
+        
+        pool = None
+        if config.connection_pool_enabled and not run_async:
+            pool = ConnectionPool(
+                max_size=config.connection_pool_max_size,
+                idle_timeout=config.connection_pool_idle_timeout,
+                max_age=config.connection_pool_max_age,
+            )
+        
         results = []
         progress_bar = create_progress_bar(len(devices))
         
-        with progress_bar as progress:
-            task = progress.add_task("Processing devices", total=len(devices))
-            
-            def progress_callback(result):
-                """Update progress bar on each completed device."""
-                results.append(result)
-                progress.update(task, advance=1)
-            
-            # Execute on all devices
-            stats = execute_on_devices(
-                devices=devices,
-                commands=commands,
-                max_workers=config.max_workers,
-                progress_callback=progress_callback,
-            )
+        # CSV rows are streamed to disk as devices complete instead of
+        # being held in memory until the end
+        sink = ResultSink(output_file) if output_format.lower() == "csv" else None
+        
+        try:
+            with progress_bar as progress:
+                task = progress.add_task("Processing devices", total=len(devices))
+                
+                with BatchedProgress(progress, task) as batched:
+                    
+                    def progress_callback(stats, device, device_results):
+                        """Count each completed device towards the next progress update."""
+                        if sink is None:
+                            results.extend(device_results)
+                        batched.advance()
+                    
+                    # Both executors return (results, stats) and share the
+                    # same callback
+                    run = run_on_devices_async if run_async else partial(
+                        execute_on_devices, pool=pool
+                    )
+                    _, stats = run(
+                        devices=devices,
+                        commands=commands,
+                        max_workers=config.max_workers,
+                        progress_callback=progress_callback,
+                        sink=sink.put if sink else None,
+                    )
+        finally:
+            if pool is not None:
+                pool.close()
+            if sink is not None:
+                sink.close()
+                if not sink.count:
+                    # Don't leave the header-only file behind
+                    output_file.unlink(missing_ok=True)
         
         # Display summary
         console.print()
-        summary_panel = create_device_summary(stats)
+        summary_panel = create_stats_summary(stats)
         console.print(summary_panel)
         
         # Generate output file
-        if results:
+        if sink is not None and sink.count:
+            print_success(f"✓ Output written to: {output_file}")
+        elif results:
             print_warning(f"\nGenerating {output_format.upper()} output...")
             formatter = get_formatter(output_format)
-            output_content = formatter.format(results)
             
-            output_file.write_text(output_content)
+            with output_file.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
+                formatter.write(results, f)
             print_success(f"✓ Output written to: {output_file}")
         else:
             print_warning("No results to write")
         
         # Exit with appropriate code
-        if stats.failed > 0:
+        if stats.failed_devices > 0:
             console.print(
-                f"\n[yellow]Warning: {stats.failed} device(s) failed[/yellow]"
+                f"\n[yellow]Warning: {stats.failed_devices} device(s) failed[/yellow]"
             )
             raise typer.Exit(code=1)
         else:
             console.print("\n[green]✓ All devices completed successfully[/green]")
             raise typer.Exit(code=0)
             
+    except typer.Exit:
+        raise
     except FileNotFoundError as e:
         print_error(f"File not found: {e}")
         raise typer.Exit(code=2)
@@ -4,10 +4,23 @@ This module handles reading commands from text files with support for
 comments and blank lines.
 """
 
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List
+import re
 
-from .models import Command
+from .models import Command, DeviceType
+
+
+BATCH_MARKER = "__NMC_END__"
+"""Sentinel printed after each command of a batch."""
+
+BATCH_DEVICE_TYPES = frozenset({DeviceType.GENERIC})
+"""Device types with a POSIX shell that can run a joined batch."""
+
+BULK_LOAD_THRESHOLD = 64 * 1024
+"""Commands files at least this large are split in one bulk pass."""
 
 
 def load_commands_from_file(commands_file: Path) -> List[Command]:
@@ -32,20 +45,12 @@ def load_commands_from_file(commands_file: Path) -> List[Command]:
     if not commands_file.exists():
         raise FileNotFoundError(f"Commands file not found: {commands_file}")
     
-    commands: List[Command] = []
-    
-    with open(commands_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, start=1):
-            # Strip whitespace
-            line = line.strip()
-            
-            # Skip blank lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Create Command object
-            command = Command(command=line)
-            commands.append(command)
+    if commands_file.stat().st_size >= BULK_LOAD_THRESHOLD:
+        # Split the whole file in one C-level call instead of reading per line
+        commands = _parse_command_lines(commands_file.read_bytes().split(b"\n"))
+    else:
+        with open(commands_file, 'rb') as f:
+            commands = _parse_command_lines(f)
     
     if not commands:
         raise ValueError(f"No valid commands found in file: {commands_file}")
@@ -53,6 +58,36 @@ def load_commands_from_file(commands_file: Path) -> List[Command]:
     return commands
 
 
+def _parse_command_lines(lines: Iterable[bytes]) -> List[Command]:
+    """Parse raw lines of a commands file into Command objects.
+    
+    Lines are decoded before trimming, so Unicode whitespace such as a
+    no-break space is stripped the same way str.strip() always did.
+    
+    Args:
+        lines: Raw UTF-8 encoded lines
+        
+    Returns:
+        List of Command objects
+    """
+    commands: List[Command] = []
+    
+    for raw in lines:
+        # Skip comments before paying for a decode
+        if raw.lstrip()[:1] == b'#':
+            continue
+        
+        line = raw.decode('utf-8').strip()
+        
+        # Skip blank lines and comments indented with non-ASCII whitespace
+        if not line or line.startswith('#'):
+            continue
+        
+        commands.append(Command(command=line))
+    
+    return commands
+
+
 def commands_to_strings(commands: List[Command]) -> List[str]:
     """Convert list of Command objects to list of command strings.
     
@@ -62,38 +97,117 @@ def commands_to_strings(commands: List[Command]) -> List[str]:
     Returns:
         List of command strings
     """
-    return [cmd.command_string for cmd in commands]
+    # cmd.command is the raw field behind command_string; attrgetter
+    # keeps the per-command lookup in C
+    return list(map(attrgetter("command"), commands))
 
 
 def filter_commands(
-    commands: List[Command],
-    include_patterns: List[str] = None,
-    exclude_patterns: List[str] = None,
-) -> List[Command]:
+    commands: Iterable[Command],
+    include_patterns: Iterable[str] = None,
+    exclude_patterns: Iterable[str] = None,
+) -> Iterator[Command]:
     """Filter commands based on include/exclude patterns.
     
+    Commands are filtered lazily; wrap the result in ``list()`` when a
+    list is needed.
+    
+    Args:
+        commands: Iterable of Command objects
+        include_patterns: Patterns to include (keep only matching)
+        exclude_patterns: Patterns to exclude (remove matching)
+        
+    Returns:
+        Iterator over the matching Command objects, in input order
+    """
+    include_patterns = tuple(include_patterns or ())
+    exclude_patterns = tuple(exclude_patterns or ())
+    included = _substring_matcher(include_patterns) if include_patterns else None
+    excluded = _substring_matcher(exclude_patterns) if exclude_patterns else None
+    
+    # Single pass applying both filters; cmd.command is the raw field
+    # behind the command_string property
+    return (
+        cmd for cmd in commands
+        if (included is None or included(cmd.command))
+        and (excluded is None or not excluded(cmd.command))
+    )
+
+
+@lru_cache(maxsize=32)
+def _substring_matcher(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a predicate testing whether text contains any of the patterns.
+    
+    Uses a pyahocorasick automaton when installed, so each command is
+    scanned once regardless of how many patterns there are; otherwise a
+    single compiled alternation of the escaped patterns. Matchers are
+    cached per pattern tuple so repeated filter passes reuse them.
+    
+    Args:
+        patterns: Substrings to look for
+        
+    Returns:
+        Callable returning True if its argument contains any pattern
+    """
+    if "" in patterns:
+        # The empty string is a substring of everything
+        return lambda text: True
+    
+    try:
+        import ahocorasick
+    except ImportError:
+        regex = re.compile("|".join(map(re.escape, patterns)))
+        return lambda text: regex.search(text) is not None
+    
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+def join_for_batch(commands: List[Command], marker: str = BATCH_MARKER) -> str:
+    """Join commands into a single shell brace group with a marker after each.
+    
+    Each command is followed by ``printf '<marker>:%s\\n' <index>`` so the
+    combined output can be split back per command. The echoed command
+    line shows ``%s`` rather than the index, so it never matches the marker.
+    Every command sits on its own line, so a trailing ``;`` or ``&`` or a
+    ``#`` comment only affects that command, not the markers after it.
+    
     Args:
         commands: List of Command objects
-        include_patterns: List of patterns to include (keep only matching)
-        exclude_patterns: List of patterns to exclude (remove matching)
+        marker: Sentinel string printed after each command
         
     Returns:
-        Filtered list of Command objects
+        A brace group running the whole batch
     """
-    filtered = commands.copy()
-    
-    # Apply include filter
-    if include_patterns:
-        filtered = [
-            cmd for cmd in filtered
-            if any(pattern in cmd.command_string for pattern in include_patterns)
-        ]
-    
-    # Apply exclude filter
-    if exclude_patterns:
-        filtered = [
-            cmd for cmd in filtered
-            if not any(pattern in cmd.command_string for pattern in exclude_patterns)
-        ]
-    
-    return filtered
+    body = "\n".join(
+        f"{cmd.command_string}\nprintf '{marker}:%s\\n' {i}"
+        for i, cmd in enumerate(commands)
+    )
+    return f"{{\n{body}\n}}"
+
+
+def split_batch_output(output: str, marker: str = BATCH_MARKER) -> List[str]:
+    """Split the output of a ``join_for_batch`` line into per-command outputs.
+    
+    Only outputs terminated by consecutive markers (0, 1, 2, ...) are
+    returned, so a batch cut short yields fewer outputs than commands.
+    
+    Args:
+        output: Combined output of the batch
+        marker: Sentinel string used when joining the batch
+        
+    Returns:
+        List of command outputs, in command order
+    """
+    parts = re.split(rf"{re.escape(marker)}:(\d+)(?:\r?\n|$)", output)
+    outputs: List[str] = []
+    
+    for i, (text, index) in enumerate(zip(parts[0::2], parts[1::2])):
+        if int(index) != i:
+            break
+        outputs.append(text.rstrip("\r\n"))
+    
+    return outputs
@@ -7,12 +7,13 @@ This module handles loading and managing configuration from multiple sources:
 - Default values
 """
 
+import os.path as osp
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from .models import AuthMethod
-from .utils import expand_path
+from .utils import resolve_path
 
 
 @dataclass
@@ -39,6 +40,13 @@ class Config:
     max_workers: int = 5
     retry_attempts: int = 3
     retry_delay: int = 5
+    use_async: bool = False
+    
+    # Connection pool settings
+    connection_pool_enabled: bool = False
+    connection_pool_max_size: int = 20
+    connection_pool_idle_timeout: int = 300
+    connection_pool_max_age: int = 3600
     
     # Output settings
     output_file: Path = Path("output.csv")
@@ -51,19 +59,19 @@ class Config:
     
     def __post_init__(self):
         """Validate and normalize configuration values."""
-        # Expand paths
-        self.devices_file = expand_path(str(self.devices_file))
-        self.commands_file = expand_path(str(self.commands_file))
-        self.output_file = expand_path(str(self.output_file))
+        # Expand and resolve paths
+        self.devices_file = resolve_path(self.devices_file)
+        self.commands_file = resolve_path(self.commands_file)
+        self.output_file = resolve_path(self.output_file)
         
         if self.ssh_key_file:
-            self.ssh_key_file = expand_path(str(self.ssh_key_file))
+            self.ssh_key_file = resolve_path(self.ssh_key_file)
         
         if self.ssh_config_file:
-            self.ssh_config_file = expand_path(str(self.ssh_config_file))
+            self.ssh_config_file = resolve_path(self.ssh_config_file)
         
         if self.session_log_dir:
-            self.session_log_dir = expand_path(str(self.session_log_dir))
+            self.session_log_dir = resolve_path(self.session_log_dir)
         
         # Validate numeric values
         if self.ssh_timeout <= 0:
@@ -84,6 +92,15 @@ class Config:
         if self.retry_delay < 0:
             raise ValueError("retry_delay cannot be negative")
         
+        if self.connection_pool_max_size <= 0:
+            raise ValueError("connection_pool_max_size must be positive")
+        
+        if self.connection_pool_idle_timeout <= 0:
+            raise ValueError("connection_pool_idle_timeout must be positive")
+        
+        if self.connection_pool_max_age <= 0:
+            raise ValueError("connection_pool_max_age must be positive")
+        
         # Validate output format
         valid_formats = {"csv", "json", "yaml", "html", "xlsx"}
         if self.output_format.lower() not in valid_formats:
@@ -98,7 +115,7 @@ class Config:
         if self.auth_method == AuthMethod.KEY:
             if not self.ssh_key_file:
                 raise ValueError("ssh_key_file required when using KEY auth method")
-            if not self.ssh_key_file.exists():
+            if not osp.exists(self.ssh_key_file):
                 raise FileNotFoundError(f"SSH key file not found: {self.ssh_key_file}")
     
     def validate_input_files(self) -> None:
@@ -107,10 +124,10 @@ class Config:
         Raises:
             FileNotFoundError: If devices or commands file doesn't exist
         """
-        if not self.devices_file.exists():
+        if not osp.exists(self.devices_file):
             raise FileNotFoundError(f"Devices file not found: {self.devices_file}")
         
-        if not self.commands_file.exists():
+        if not osp.exists(self.commands_file):
             raise FileNotFoundError(f"Commands file not found: {self.commands_file}")
     
     @property
@@ -149,6 +166,11 @@ class Config:
             "max_workers": self.max_workers,
             "retry_attempts": self.retry_attempts,
             "retry_delay": self.retry_delay,
+            "use_async": self.use_async,
+            "connection_pool_enabled": self.connection_pool_enabled,
+            "connection_pool_max_size": self.connection_pool_max_size,
+            "connection_pool_idle_timeout": self.connection_pool_idle_timeout,
+            "connection_pool_max_age": self.connection_pool_max_age,
             "output_file": str(self.output_file),
             "output_format": self.output_format,
             "verbose": self.verbose,
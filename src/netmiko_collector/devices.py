@@ -5,13 +5,21 @@ them into Device objects with proper validation.
 """
 
 import csv
+import re
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
 from .models import AuthMethod, Device, DeviceType
 from .utils import validate_hostname, validate_port
 
 
+_IP4_FAST = re.compile(r'^(?:[0-9]{1,3}\.){3}[0-9]{1,3}$').match
+"""Match dotted-quad hostnames, which always pass validate_hostname."""
+
+
 def load_devices_from_csv(
     csv_file: Path,
     default_username: Optional[str] = None,
@@ -38,6 +46,47 @@ def load_devices_from_csv(
     Returns:
         List of Device objects
         
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV is malformed or required fields missing
+    """
+    devices = list(
+        iter_devices_from_csv(
+            csv_file,
+            default_username=default_username,
+            default_password=default_password,
+            default_port=default_port,
+        )
+    )
+    
+    if not devices:
+        raise ValueError(f"No devices found in CSV file: {csv_file}")
+    
+    return devices
+
+
+def iter_devices_from_csv(
+    csv_file: Path,
+    default_username: Optional[str] = None,
+    default_password: Optional[str] = None,
+    default_port: int = 22,
+) -> Iterator[Device]:
+    """Yield devices from a CSV file one row at a time.
+    
+    Streaming variant of load_devices_from_csv for callers that only
+    iterate once, so a large inventory is never held in memory as a list.
+    Unlike load_devices_from_csv, a file without data rows yields nothing
+    instead of raising.
+    
+    Args:
+        csv_file: Path to CSV file
+        default_username: Default username for all devices
+        default_password: Default password for all devices
+        default_port: Default SSH port
+        
+    Yields:
+        Device objects, in file order
+        
     Raises:
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV is malformed or required fields missing
@@ -45,47 +94,77 @@ def load_devices_from_csv(
     if not csv_file.exists():
         raise FileNotFoundError(f"Device CSV file not found: {csv_file}")
     
-    devices: List[Device] = []
-    
     with open(csv_file, 'r', encoding='utf-8') as f:
-        # Detect delimiter (support both comma and semicolon)
-        sample = f.read(1024)
-        f.seek(0)
+        # Detect delimiter (support both comma and semicolon) from the
+        # header line, so the file is read once without seeking back
+        first_line = f.readline()
         
-        delimiter = ',' if ',' in sample else ';'
-        reader = csv.DictReader(f, delimiter=delimiter)
+        try:
+            delimiter = csv.Sniffer().sniff(first_line, delimiters=',;').delimiter
+        except csv.Error:
+            # Single-column files give the sniffer nothing to go on
+            delimiter = ',' if ',' in first_line else ';'
+        reader = csv.reader(chain([first_line], f), delimiter=delimiter)
         
-        if not reader.fieldnames:
+        header = next(reader, None)
+        if not header:
             raise ValueError(f"CSV file is empty or malformed: {csv_file}")
         
-        # Normalize fieldnames (lowercase, strip whitespace)
-        reader.fieldnames = [name.lower().strip() for name in reader.fieldnames]
+        # Map normalized column names (lowercase, stripped) to row indices
+        fieldnames = [name.lower().strip() for name in header]
+        columns = {name: index for index, name in enumerate(fieldnames)}
         
-        if 'hostname' not in reader.fieldnames:
+        if 'hostname' not in columns:
             raise ValueError(
-                f"CSV must have 'hostname' column. Found columns: {reader.fieldnames}"
+                f"CSV must have 'hostname' column. Found columns: {fieldnames}"
             )
         
         for line_num, row in enumerate(reader, start=2):  # start=2 because of header
+            if not row:
+                continue
             try:
                 device = _parse_device_row(
                     row,
+                    columns,
                     default_username=default_username,
                     default_password=default_password,
                     default_port=default_port,
                 )
-                devices.append(device)
             except ValueError as e:
                 raise ValueError(f"Error on line {line_num}: {e}") from e
+            yield device
+
+
+def _column(row: Sequence[str], columns: dict[str, int], name: str) -> str:
+    """Get a stripped column value from a CSV row, or '' if absent."""
+    index = columns.get(name)
+    if index is None or index >= len(row):
+        return ''
+    return row[index].strip()
+
+
+@lru_cache(maxsize=1024)
+def _parse_port(port_str: str) -> int:
+    """Parse and range-check a port column value.
     
-    if not devices:
-        raise ValueError(f"No devices found in CSV file: {csv_file}")
+    Cached because an inventory only uses a handful of distinct ports.
     
-    return devices
+    Raises:
+        ValueError: If the port is not an integer or is out of range
+    """
+    try:
+        port = int(port_str)
+    except ValueError:
+        raise ValueError(f"Invalid port number: {port_str}")
+    
+    if not validate_port(port):
+        raise ValueError(f"Port out of range (1-65535): {port}")
+    return port
 
 
 def _parse_device_row(
-    row: dict,
+    row: Sequence[str],
+    columns: dict[str, int],
     default_username: Optional[str],
     default_password: Optional[str],
     default_port: int,
@@ -93,7 +172,8 @@ def _parse_device_row(
     """Parse a single CSV row into a Device object.
     
     Args:
-        row: Dictionary from CSV DictReader
+        row: Field values from csv.reader
+        columns: Normalized column name to index in row
         default_username: Default username
         default_password: Default password
         default_port: Default port
@@ -105,37 +185,31 @@ def _parse_device_row(
         ValueError: If required fields are missing or invalid
     """
     # Required field
-    hostname = row.get('hostname', '').strip()
+    hostname = _column(row, columns, 'hostname')
     if not hostname:
         raise ValueError("hostname is required")
     
-    if not validate_hostname(hostname):
+    if not _IP4_FAST(hostname) and not validate_hostname(hostname):
         raise ValueError(f"Invalid hostname: {hostname}")
     
     # Optional IP field (if provided, use it as hostname)
-    ip = row.get('ip', '').strip()
+    ip = _column(row, columns, 'ip')
     if ip:
         hostname = ip  # Use IP as hostname if provided
     
     # Port handling
-    port_str = row.get('port', '').strip()
+    port_str = _column(row, columns, 'port')
     if port_str:
-        try:
-            port = int(port_str)
-        except ValueError:
-            raise ValueError(f"Invalid port number: {port_str}")
-        
-        if not validate_port(port):
-            raise ValueError(f"Port out of range (1-65535): {port}")
+        port = _parse_port(port_str)
     else:
         port = default_port
     
     # Credentials
-    username = row.get('username', '').strip() or default_username
-    password = row.get('password', '').strip() or default_password
+    username = _column(row, columns, 'username') or default_username
+    password = _column(row, columns, 'password') or default_password
     
     # Device type
-    device_type_str = row.get('device_type', '').strip()
+    device_type_str = _column(row, columns, 'device_type')
     if device_type_str:
         try:
             device_type = DeviceType.from_string(device_type_str)
@@ -146,7 +220,7 @@ def _parse_device_row(
         device_type = DeviceType.CISCO_IOS
     
     # Auth method
-    auth_method_str = row.get('auth_method', '').strip()
+    auth_method_str = _column(row, columns, 'auth_method')
     if auth_method_str:
         try:
             auth_method = AuthMethod.from_string(auth_method_str)
@@ -181,10 +255,9 @@ def validate_devices(devices: List[Device]) -> List[str]:
         return errors
     
     # Check for duplicate hostnames
-    hostnames = [d.hostname for d in devices]
-    duplicates = [h for h in hostnames if hostnames.count(h) > 1]
-    if duplicates:
-        unique_duplicates = list(set(duplicates))
+    counts = Counter(d.hostname for d in devices)
+    unique_duplicates = [h for h, count in counts.items() if count > 1]
+    if unique_duplicates:
         errors.append(f"Duplicate hostnames found: {', '.join(unique_duplicates)}")
     
     # Check that all devices have required credentials
@@ -4,17 +4,47 @@ This module provides ThreadPoolExecutor-based orchestration for executing
 commands on multiple network devices concurrently with progress tracking.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Callable, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, ContextManager, Optional
 import time
 
 from .models import Device, Command, ExecutionResult, ExecutionStatus
+from .pool import ConnectionPool
 from .ssh import SSHConfig, execute_commands_on_device
 
 
+SUBMIT_AHEAD = 2
+"""Futures kept queued per worker; further devices are submitted as others finish."""
+
+_status_of = attrgetter("status")
+"""Status getter used to tally results without a Python-level loop."""
+
+
+def _emit_each(sink: Callable[[ExecutionResult], None], results: list[ExecutionResult]) -> None:
+    """Pass each result of a completed device to the sink."""
+    for result in results:
+        sink(result)
+
+
 class ExecutionStats:
     """Statistics for command execution across devices."""
     
+    __slots__ = (
+        "total_devices",
+        "completed_devices",
+        "successful_devices",
+        "failed_devices",
+        "total_commands",
+        "successful_commands",
+        "failed_commands",
+        "start_time",
+        "end_time",
+    )
+    
     def __init__(self):
         """Initialize execution statistics."""
         self.total_devices = 0
@@ -41,17 +71,15 @@ class ExecutionStats:
         """Record results for a completed device."""
         self.completed_devices += 1
         
-        device_success = all(r.is_success for r in results)
-        if device_success:
+        # One C-level pass over the statuses feeds both device and command counters
+        succeeded = list(map(_status_of, results)).count(ExecutionStatus.SUCCESS)
+        self.successful_commands += succeeded
+        self.failed_commands += len(results) - succeeded
+        
+        if succeeded == len(results):
             self.successful_devices += 1
         else:
             self.failed_devices += 1
-        
-        for result in results:
-            if result.is_success:
-                self.successful_commands += 1
-            else:
-                self.failed_commands += 1
     
     @property
     def duration(self) -> float:
@@ -89,6 +117,10 @@ def execute_on_devices(
     max_workers: int = 10,
     ssh_config: Optional[SSHConfig] = None,
     progress_callback: Optional[Callable[[ExecutionStats, Device, list[ExecutionResult]], None]] = None,
+    pool: Optional[ConnectionPool] = None,
+    sink: Optional[Callable[[ExecutionResult], None]] = None,
+    stats: Optional[ExecutionStats] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
 ) -> tuple[list[ExecutionResult], ExecutionStats]:
     """Execute commands on multiple devices concurrently.
     
@@ -101,6 +133,14 @@ def execute_on_devices(
         max_workers: Maximum number of concurrent device connections
         ssh_config: SSH configuration options
         progress_callback: Optional callback(stats, device, results) called after each device completes
+        pool: Connection pool to reuse SSH sessions from (optional)
+        sink: Optional callable receiving each result as its device completes.
+            Results passed to the sink are not retained, so all_results is
+            empty and memory stays flat for large inventories.
+        stats: Statistics to record into (optional). The caller owns its
+            start()/finish() lifecycle, so several calls can share one.
+        executor: Thread pool to dispatch on (optional). It is left running
+            for the caller to reuse; otherwise one is created per call.
         
     Returns:
         Tuple of (all_results, execution_stats)
@@ -112,57 +152,73 @@ def execute_on_devices(
         >>> print(f"Completed {stats.completed_devices}/{stats.total_devices} devices")
         >>> print(f"Success rate: {stats.successful_commands}/{stats.total_commands}")
     """
-    stats = ExecutionStats()
-    stats.start(len(devices), len(commands))
+    owns_stats = stats is None
+    if stats is None:
+        stats = ExecutionStats()
+        stats.start(len(devices), len(commands))
     
     all_results: list[ExecutionResult] = []
+    emit = all_results.extend if sink is None else partial(_emit_each, sink)
+    
+    run_device = execute_commands_on_device
+    if pool is not None:
+        run_device = partial(execute_commands_on_device, pool=pool)
     
     # Use ThreadPoolExecutor for concurrent execution
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all device tasks
-        future_to_device = {
-            executor.submit(
-                execute_commands_on_device,
-                device,
-                commands,
-                ssh_config,
-            ): device
-            for device in devices
+    dispatcher: ContextManager[ThreadPoolExecutor]
+    if executor is None:
+        dispatcher = ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        dispatcher = nullcontext(executor)
+    
+    with dispatcher as thread_pool:
+        # Keep only a bounded window of devices submitted, so pending futures
+        # stay flat regardless of inventory size
+        remaining = iter(devices)
+        pending = {
+            thread_pool.submit(run_device, device, commands, ssh_config): device
+            for device in islice(remaining, max_workers * SUBMIT_AHEAD)
         }
         
-        # Process results as they complete
-        for future in as_completed(future_to_device):
-            device = future_to_device[future]
-            
-            try:
-                results = future.result()
-                all_results.extend(results)
-                stats.record_device_results(results)
+        # Process results as they complete, topping the window back up
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                device = pending.pop(future)
+                for next_device in islice(remaining, 1):
+                    next_future = thread_pool.submit(run_device, next_device, commands, ssh_config)
+                    pending[next_future] = next_device
                 
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(stats, device, results)
+                try:
+                    results = future.result()
+                    emit(results)
+                    stats.record_device_results(results)
                     
-            except Exception as e:
-                # If something went wrong outside of execute_commands_on_device
-                # Create failed results for all commands
-                failed_results = [
-                    ExecutionResult(
-                        device=device,
-                        command=cmd,
-                        output="",
-                        status=ExecutionStatus.FAILED,
-                        error=f"Executor error: {str(e)}",
-                    )
-                    for cmd in commands
-                ]
-                all_results.extend(failed_results)
-                stats.record_device_results(failed_results)
-                
-                if progress_callback:
-                    progress_callback(stats, device, failed_results)
+                    # Call progress callback if provided
+                    if progress_callback:
+                        progress_callback(stats, device, results)
+                        
+                except Exception as e:
+                    # If something went wrong outside of execute_commands_on_device
+                    # Create failed results for all commands
+                    failed_results = [
+                        ExecutionResult(
+                            device=device,
+                            command=cmd,
+                            output="",
+                            status=ExecutionStatus.FAILED,
+                            error=f"Executor error: {str(e)}",
+                        )
+                        for cmd in commands
+                    ]
+                    emit(failed_results)
+                    stats.record_device_results(failed_results)
+                    
+                    if progress_callback:
+                        progress_callback(stats, device, failed_results)
     
-    stats.finish()
+    if owns_stats:
+        stats.finish()
     return all_results, stats
 
 
@@ -173,6 +229,7 @@ def execute_on_device_batches(
     max_workers: int = 10,
     ssh_config: Optional[SSHConfig] = None,
     progress_callback: Optional[Callable[[ExecutionStats, Device, list[ExecutionResult]], None]] = None,
+    pool: Optional[ConnectionPool] = None,
 ) -> tuple[list[ExecutionResult], ExecutionStats]:
     """Execute commands on devices in batches.
     
@@ -186,6 +243,7 @@ def execute_on_device_batches(
         max_workers: Maximum number of concurrent device connections per batch
         ssh_config: SSH configuration options
         progress_callback: Optional callback(stats, device, results) called after each device completes
+        pool: Connection pool to reuse SSH sessions from (optional)
         
     Returns:
         Tuple of (all_results, execution_stats)
@@ -203,25 +261,25 @@ def execute_on_device_batches(
     
     all_results: list[ExecutionResult] = []
     
-    # Process devices in batches
-    for i in range(0, len(devices), batch_size):
-        batch_devices = devices[i:i + batch_size]
-        
-        # Execute on this batch
-        batch_results, _ = execute_on_devices(
-            batch_devices,
-            commands,
-            max_workers=max_workers,
-            ssh_config=ssh_config,
-            progress_callback=progress_callback,
-        )
-        
-        all_results.extend(batch_results)
-        
-        # Update overall stats manually since we're not using the batch stats
-        for device in batch_devices:
-            device_results = [r for r in batch_results if r.device == device]
-            stats.record_device_results(device_results)
+    # One set of worker threads serves every batch
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Process devices in batches
+        for i in range(0, len(devices), batch_size):
+            batch_devices = devices[i:i + batch_size]
+            
+            # Execute on this batch, recording into the overall stats
+            batch_results, _ = execute_on_devices(
+                batch_devices,
+                commands,
+                max_workers=max_workers,
+                ssh_config=ssh_config,
+                progress_callback=progress_callback,
+                pool=pool,
+                stats=stats,
+                executor=executor,
+            )
+            
+            all_results.extend(batch_results)
     
     stats.finish()
     return all_results, stats
@@ -2,22 +2,61 @@
 
 This package provides formatters for various output formats including
 CSV, JSON, YAML, HTML, and XLSX.
+
+Formatter modules are imported on first use, so selecting one format does
+not pay the import cost of the others.
 """
 
+import importlib
+from functools import lru_cache
+
 from .base import BaseFormatter
-from .csv_formatter import CSVFormatter
-from .json_formatter import JSONFormatter
-from .yaml_formatter import YAMLFormatter
-from .html_formatter import HTMLFormatter
-from .xlsx_formatter import XLSXFormatter
+
+# Format name -> (module, class name), imported on first lookup
+_FORMATTERS = {
+    "csv": (".csv_formatter", "CSVFormatter"),
+    "json": (".json_formatter", "JSONFormatter"),
+    "yaml": (".yaml_formatter", "YAMLFormatter"),
+    "html": (".html_formatter", "HTMLFormatter"),
+    "xlsx": (".xlsx_formatter", "XLSXFormatter"),
+}
+
+_CLASS_MODULES = {class_name: module_name for module_name, class_name in _FORMATTERS.values()}
+
+
+@lru_cache(maxsize=None)
+def _formatter_class(format_name: str) -> type[BaseFormatter]:
+    """Import and return the formatter class for a lowercased format name."""
+    module_name, class_name = _FORMATTERS[format_name]
+    module = importlib.import_module(module_name, __package__)
+    formatter_class: type[BaseFormatter] = getattr(module, class_name)
+    return formatter_class
 
 
-def get_formatter(format_name: str) -> BaseFormatter:
+@lru_cache(maxsize=8)
+def _shared_formatter(format_name: str) -> BaseFormatter:
+    """Return the shared formatter instance for a lowercased format name."""
+    return _formatter_class(format_name)()
+
+
+def __getattr__(name: str):
+    """Resolve formatter classes accessed as package attributes."""
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is not None:
+        return getattr(importlib.import_module(module_name, __package__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_formatter(format_name: str, fresh: bool = False) -> BaseFormatter:
     """
     Get a formatter instance by format name.
     
+    Formatters hold no per-call state, so by default one shared instance
+    per format is returned.
+    
     Args:
         format_name: Name of the format (csv, json, yaml, html, xlsx)
+        fresh: Return a new instance instead of the shared one
         
     Returns:
         Formatter instance
@@ -25,22 +64,16 @@ def get_formatter(format_name: str) -> BaseFormatter:
     Raises:
         ValueError: If format name is not recognized
     """
-    formatters = {
-        "csv": CSVFormatter,
-        "json": JSONFormatter,
-        "yaml": YAMLFormatter,
-        "html": HTMLFormatter,
-        "xlsx": XLSXFormatter,
-    }
-    
     format_lower = format_name.lower()
-    if format_lower not in formatters:
-        valid_formats = ", ".join(formatters.keys())
+    if format_lower not in _FORMATTERS:
+        valid_formats = ", ".join(_FORMATTERS.keys())
         raise ValueError(
             f"Unknown format: {format_name}. Valid formats: {valid_formats}"
         )
     
-    return formatters[format_lower]()
+    if fresh:
+        return _formatter_class(format_lower)()
+    return _shared_formatter(format_lower)
 
 
 __all__ = [
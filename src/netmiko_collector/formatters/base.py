@@ -2,11 +2,65 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, List, NamedTuple, Optional
 
 from ..models import ExecutionResult
 
 
+WRITE_BUFFER_SIZE = 1 << 20
+"""Buffer size for output files, so large reports are written in few syscalls."""
+
+
+class ResultView(NamedTuple):
+    """Column-wise projection of execution results, one list per field.
+    
+    ``zip(*view)`` yields one row tuple per result in field order.
+    """
+
+    hostnames: list[str]
+    commands: list[str]
+    statuses: list[str]
+    outputs: list[str]
+    errors: list[str]
+    duration_ms: list[Optional[int]]
+    timestamps: list[Optional[str]]
+
+
+RESULT_FIELDS = ("hostname", "command", "status", "output", "error", "duration_ms", "timestamp")
+"""Record keys matching the ResultView columns."""
+
+
+def project_results(results: List[ExecutionResult]) -> ResultView:
+    """Resolve the output fields of every result in a single pass.
+    
+    Args:
+        results: List of ExecutionResult objects
+        
+    Returns:
+        ResultView with one entry per result in each column
+    """
+    view = ResultView([], [], [], [], [], [], [])
+    add_hostname = view.hostnames.append
+    add_command = view.commands.append
+    add_status = view.statuses.append
+    add_output = view.outputs.append
+    add_error = view.errors.append
+    add_duration = view.duration_ms.append
+    add_timestamp = view.timestamps.append
+    
+    for result in results:
+        duration = result.duration
+        add_hostname(result.device.hostname)
+        add_command(result.command.command)
+        add_status(result.status.value)
+        add_output(result.output)
+        add_error(result.error)
+        add_duration(int(duration * 1000) if duration is not None else None)
+        add_timestamp(result.timestamp_iso)
+    
+    return view
+
+
 class BaseFormatter(ABC):
     """Abstract base class for all output formatters.
     
@@ -26,6 +80,18 @@ class BaseFormatter(ABC):
         """
         pass
 
+    def write(self, results: List[ExecutionResult], fh: BinaryIO) -> None:
+        """Write formatted results to a binary file object.
+        
+        Formatters that can produce output incrementally override this
+        so the whole document never has to exist as one string.
+        
+        Args:
+            results: List of ExecutionResult objects to format
+            fh: Binary file object to write to
+        """
+        fh.write(self.format(results).encode("utf-8"))
+
     def write_to_file(self, results: List[ExecutionResult], filepath: Path) -> None:
         """Write formatted results to a file.
         
@@ -33,5 +99,5 @@ class BaseFormatter(ABC):
             results: List of ExecutionResult objects to format
             filepath: Path to output file
         """
-        output = self.format(results)
-        filepath.write_text(output, encoding="utf-8")
+        with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            self.write(results, f)
@@ -1,19 +1,46 @@
 """CSV formatter for command execution results."""
 
 import csv
-from io import StringIO
-from typing import List
+import re
+from io import StringIO, TextIOWrapper
+from typing import BinaryIO, List, TextIO
 
 from ..models import ExecutionResult
 from .base import BaseFormatter
 
 
+_QUOTE_TRIGGERS = re.compile(r'["\r\n]')
+"""Characters besides the delimiter that make csv.writer quote a field."""
+
+
 class CSVFormatter(BaseFormatter):
     """Format execution results as CSV.
     
     Outputs results with columns: hostname, command, status, output, error, duration
     """
 
+    HEADER = ("hostname", "command", "status", "output", "error", "duration_ms")
+    """Column names of the CSV output."""
+
+    @staticmethod
+    def to_row(result: ExecutionResult) -> tuple:
+        """Convert a single result to a CSV row.
+        
+        Args:
+            result: ExecutionResult to convert
+            
+        Returns:
+            Tuple of column values matching HEADER
+        """
+        return (
+            result.hostname,
+            result.command.text,
+            result.status.value,
+            result.output or "",
+            result.error or "",
+            int(result.duration * 1000) if result.duration is not None else ""
+        )
+
     def format(self, results: List[ExecutionResult]) -> str:
         """Format execution results as CSV.
         
@@ -24,27 +51,38 @@ class CSVFormatter(BaseFormatter):
             CSV formatted string
         """
         output = StringIO()
+        self._write_rows(results, output)
+        return output.getvalue()
+
+    def write(self, results: List[ExecutionResult], fh: BinaryIO) -> None:
+        """Stream execution results as CSV to a binary file object.
+        
+        Args:
+            results: List of ExecutionResult objects
+            fh: Binary file object to write to
+        """
+        text = TextIOWrapper(fh, encoding="utf-8", newline="")
+        try:
+            self._write_rows(results, text)
+            text.flush()
+        finally:
+            # Leave fh open for the caller
+            text.detach()
+
+    def _write_rows(self, results: List[ExecutionResult], output: TextIO) -> None:
+        """Write the header and one line per result to a text stream."""
         writer = csv.writer(output)
+        write = output.write
+        delimiters = len(self.HEADER) - 1
         
         # Write header
-        writer.writerow([
-            "hostname",
-            "command",
-            "status",
-            "output",
-            "error",
-            "duration_ms"
-        ])
+        writer.writerow(self.HEADER)
         
-        # Write data rows
-        for result in results:
-            writer.writerow([
-                result.hostname,
-                result.command.text,
-                result.status.value,
-                result.output or "",
-                result.error or "",
-                int(result.duration * 1000) if result.duration is not None else ""
-            ])
-        
-        return output.getvalue()
+        # Rows without characters that need quoting are joined directly;
+        # only the rest go through csv.writer, with identical output
+        for row in map(self.to_row, results):
+            line = ",".join(map(str, row))
+            if line.count(",") == delimiters and _QUOTE_TRIGGERS.search(line) is None:
+                write(line + "\r\n")
+            else:
+                writer.writerow(row)
@@ -1,14 +1,48 @@
 """HTML formatter for command execution results."""
 
-from datetime import datetime
-from typing import List
+import time
+from io import BytesIO
+from typing import BinaryIO, List
 
 from ..models import ExecutionResult, ExecutionStatus
 from .base import BaseFormatter
 
 
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+"""Translation table escaping HTML special characters in one pass."""
+
+_STATUS_CLASSES = {
+    ExecutionStatus.SUCCESS: "success",
+    ExecutionStatus.FAILED: "failed",
+    ExecutionStatus.PENDING: "pending",
+}
+"""CSS class of the status cell for each execution status."""
+
+
 class HTMLFormatter(BaseFormatter):
-    """Format execution results as HTML table."""
+    """Format execution results as HTML table.
+    
+    Rows are written to the output one at a time, so a large report is
+    never held in memory as a single string.
+    """
+    
+    _ROW_TMPL = (
+        "    <tr>\n"
+        "      <td>{host}</td>\n"
+        "      <td><code>{cmd}</code></td>\n"
+        "      <td class='{cls}'>{status}</td>\n"
+        "      <td><pre>{out}</pre></td>\n"
+        "      <td><pre>{err}</pre></td>\n"
+        "      <td>{dur}</td>\n"
+        "    </tr>\n"
+    )
+    """Template for one result row, filled in with already escaped values."""
 
     def format(self, results: List[ExecutionResult]) -> str:
         """Format execution results as HTML.
@@ -19,7 +53,18 @@ class HTMLFormatter(BaseFormatter):
         Returns:
             HTML formatted string
         """
-        html_parts = [
+        buffer = BytesIO()
+        self.write(results, buffer)
+        return buffer.getvalue().decode("utf-8")
+
+    def write(self, results: List[ExecutionResult], fh: BinaryIO) -> None:
+        """Stream execution results as HTML to a binary file object.
+        
+        Args:
+            results: List of ExecutionResult objects
+            fh: Binary file object to write to
+        """
+        header = [
             "<!DOCTYPE html>",
             "<html>",
             "<head>",
@@ -39,7 +84,7 @@ class HTMLFormatter(BaseFormatter):
             "</head>",
             "<body>",
             f"  <h1>Network Command Execution Results</h1>",
-            f"  <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>",
+            f"  <p>Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}</p>",
             f"  <p>Total Results: {len(results)}</p>",
             "  <table>",
             "    <tr>",
@@ -51,47 +96,28 @@ class HTMLFormatter(BaseFormatter):
             "      <th>Duration (ms)</th>",
             "    </tr>",
         ]
+        fh.write(("\n".join(header) + "\n").encode("utf-8"))
         
+        row_tmpl = self._ROW_TMPL.format
+        status_class_of = _STATUS_CLASSES.get
         for result in results:
-            status_class = {
-                ExecutionStatus.SUCCESS: "success",
-                ExecutionStatus.FAILED: "failed",
-                ExecutionStatus.PENDING: "pending"
-            }.get(result.status, "")
+            status_class = status_class_of(result.status, "")
             
             duration = int(result.duration * 1000) if result.duration is not None else "N/A"
             
-            html_parts.extend([
-                "    <tr>",
-                f"      <td>{self._escape_html(result.hostname)}</td>",
-                f"      <td><code>{self._escape_html(result.command.text)}</code></td>",
-                f"      <td class='{status_class}'>{result.status.value}</td>",
-                f"      <td><pre>{self._escape_html(result.output or '')}</pre></td>",
-                f"      <td><pre>{self._escape_html(result.error or '')}</pre></td>",
-                f"      <td>{duration}</td>",
-                "    </tr>",
-            ])
+            row = row_tmpl(
+                host=result.hostname.translate(_HTML_ESCAPE),
+                cmd=result.command.text.translate(_HTML_ESCAPE),
+                cls=status_class,
+                status=result.status.value,
+                out=(result.output or "").translate(_HTML_ESCAPE),
+                err=(result.error or "").translate(_HTML_ESCAPE),
+                dur=duration,
+            )
+            fh.write(row.encode("utf-8"))
         
-        html_parts.extend([
+        fh.write("\n".join([
             "  </table>",
             "</body>",
             "</html>"
-        ])
-        
-        return "\n".join(html_parts)
-    
-    def _escape_html(self, text: str) -> str:
-        """Escape HTML special characters.
-        
-        Args:
-            text: Text to escape
-            
-        Returns:
-            Escaped text
-        """
-        return (text
-                .replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;")
-                .replace("'", "&#39;"))
+        ]).encode("utf-8"))
@@ -1,14 +1,23 @@
 """JSON formatter for command execution results."""
 
 import json
-from typing import List
+from typing import BinaryIO, List
 
 from ..models import ExecutionResult
-from .base import BaseFormatter
+from .base import RESULT_FIELDS, BaseFormatter, project_results
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 class JSONFormatter(BaseFormatter):
-    """Format execution results as JSON."""
+    """Format execution results as JSON.
+    
+    Uses orjson when it is installed and the indent is 2 (the only
+    indentation orjson supports), falling back to the standard library.
+    """
 
     def __init__(self, indent: int = 2):
         """Initialize JSON formatter.
@@ -18,6 +27,21 @@ class JSONFormatter(BaseFormatter):
         """
         self.indent = indent
 
+    def _records(self, results: List[ExecutionResult]) -> list[dict]:
+        """Convert results to JSON-serializable records."""
+        return [dict(zip(RESULT_FIELDS, row)) for row in zip(*project_results(results))]
+    
+    def _dumps_bytes(self, results: List[ExecutionResult]) -> bytes:
+        """Serialize results to UTF-8 encoded JSON."""
+        data = self._records(results)
+        
+        # orjson's compact output drops the stdlib's ", " / ": " spacing, so it
+        # is only used where the two produce identical text
+        if orjson is not None and self.indent == 2:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        
+        return json.dumps(data, indent=self.indent, ensure_ascii=False).encode("utf-8")
+
     def format(self, results: List[ExecutionResult]) -> str:
         """Format execution results as JSON.
         
@@ -27,16 +51,13 @@ class JSONFormatter(BaseFormatter):
         Returns:
             JSON formatted string
         """
-        data = []
-        for result in results:
-            data.append({
-                "hostname": result.hostname,
-                "command": result.command.text,
-                "status": result.status.value,
-                "output": result.output,
-                "error": result.error,
-                "duration_ms": int(result.duration * 1000) if result.duration is not None else None,
-                "timestamp": result.timestamp.isoformat() if result.timestamp else None
-            })
+        return self._dumps_bytes(results).decode("utf-8")
+
+    def write(self, results: List[ExecutionResult], fh: BinaryIO) -> None:
+        """Write JSON results to a binary file object without an intermediate str.
         
-        return json.dumps(data, indent=self.indent, ensure_ascii=False)
+        Args:
+            results: List of ExecutionResult objects to format
+            fh: Binary file object to write to
+        """
+        fh.write(self._dumps_bytes(results))
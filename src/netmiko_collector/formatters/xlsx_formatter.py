@@ -3,11 +3,43 @@
 from typing import List
 
 from ..models import ExecutionResult
-from .base import BaseFormatter
+from .base import WRITE_BUFFER_SIZE, BaseFormatter, project_results
 
 
 class XLSXFormatter(BaseFormatter):
-    """Format execution results as Excel XLSX file."""
+    """Format execution results as Excel XLSX file.
+    
+    Written with openpyxl by default. The xlsxwriter engine writes the
+    sheet XML directly in constant-memory mode and is faster for large
+    result sets.
+    """
+
+    HEADERS = ("Hostname", "Command", "Status", "Output", "Error", "Duration (ms)")
+    """Column names of the header row."""
+
+    COLUMN_WIDTHS = {"A": 20, "B": 30, "C": 10, "D": 50, "E": 50, "F": 14}
+    """Fixed column widths, since write-only sheets cannot be measured afterwards."""
+
+    MAX_COLUMN_WIDTH = 50
+    """Upper bound for content-fitted column widths."""
+
+    ENGINES = ("openpyxl", "xlsxwriter")
+    """Supported workbook writer libraries."""
+
+    def __init__(self, engine: str = "openpyxl"):
+        """Initialize XLSX formatter.
+        
+        Args:
+            engine: Library used to write the workbook (openpyxl or xlsxwriter)
+            
+        Raises:
+            ValueError: If engine is not recognized
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(
+                f"Unknown XLSX engine: {engine}. Valid engines: {', '.join(self.ENGINES)}"
+            )
+        self.engine = engine
 
     def format(self, results: List[ExecutionResult]) -> str:
         """Format execution results as XLSX (returns binary data as string).
@@ -30,8 +62,13 @@ class XLSXFormatter(BaseFormatter):
             results: List of ExecutionResult objects to format
             filepath: Path to output file
         """
+        if self.engine == "xlsxwriter":
+            self._write_with_xlsxwriter(results, filepath)
+            return
+        
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
         except ImportError:
             raise ImportError(
@@ -39,45 +76,72 @@ class XLSXFormatter(BaseFormatter):
                 "Install with: pip install openpyxl"
             )
         
-        # Create workbook and worksheet
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Command Results"
+        # Write-only workbooks stream rows to the XML writer instead of
+        # keeping a cell object for every value in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Command Results")
         
-        # Define headers
-        headers = ["Hostname", "Command", "Status", "Output", "Error", "Duration (ms)"]
-        ws.append(headers)
+        # Column widths must be set before the first row is written
+        for column_letter, width in self.COLUMN_WIDTHS.items():
+            ws.column_dimensions[column_letter].width = width
         
-        # Style header row
+        # Styled header row
         header_fill = PatternFill(start_color="4CAF50", end_color="4CAF50", fill_type="solid")
         header_font = Font(bold=True, color="FFFFFF")
-        for cell in ws[1]:
+        header_row = []
+        for header in self.HEADERS:
+            cell = WriteOnlyCell(ws, value=header)
             cell.fill = header_fill
             cell.font = header_font
+            header_row.append(cell)
+        ws.append(header_row)
         
-        # Add data rows
-        for result in results:
-            ws.append([
-                result.hostname,
-                result.command.text,
-                result.status.value,
-                result.output or "",
-                result.error or "",
-                int(result.duration * 1000) if result.duration is not None else ""
-            ])
+        # Add data rows; empty and None values both become blank cells
+        append = ws.append
+        for row in zip(*project_results(results)[:len(self.HEADERS)]):
+            append(row)
         
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except (AttributeError, TypeError):
-                    pass  # Skip cells that can't be measured
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Save workbook through a large buffer, so the zip container's many
+        # small writes reach the OS as few large ones
+        with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            wb.save(f)
+
+    def _write_with_xlsxwriter(self, results: List[ExecutionResult], filepath) -> None:
+        """Write results with xlsxwriter, flushing each row to disk as written.
         
-        # Save workbook
-        wb.save(str(filepath))
+        Args:
+            results: List of ExecutionResult objects to format
+            filepath: Path to output file
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            raise ImportError(
+                "xlsxwriter is required for the xlsxwriter XLSX engine. "
+                "Install with: pip install xlsxwriter"
+            )
+        
+        with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            wb = xlsxwriter.Workbook(
+                f, {"constant_memory": True, "strings_to_urls": False}
+            )
+            try:
+                ws = wb.add_worksheet("Command Results")
+                
+                header_format = wb.add_format(
+                    {"bold": True, "bg_color": "#4CAF50", "font_color": "#FFFFFF"}
+                )
+                ws.write_row(0, 0, self.HEADERS, header_format)
+                
+                columns = project_results(results)[:len(self.HEADERS)]
+                write_row = ws.write_row
+                for row_number, row in enumerate(zip(*columns), start=1):
+                    write_row(row_number, 0, row)
+                
+                # Widths are measured per column; xlsxwriter applies them on close
+                for index, (header, values) in enumerate(zip(self.HEADERS, columns)):
+                    longest = max(map(len, map(str, filter(None, values))), default=0)
+                    width = max(len(header), longest)
+                    ws.set_column(index, index, min(width + 2, self.MAX_COLUMN_WIDTH))
+            finally:
+                wb.close()
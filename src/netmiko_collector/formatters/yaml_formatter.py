@@ -1,41 +1,62 @@
 """YAML formatter for command execution results."""
 
-from typing import List
+from typing import BinaryIO, List, Optional
 
 from ..models import ExecutionResult
-from .base import BaseFormatter
+from .base import RESULT_FIELDS, BaseFormatter, project_results
 
 
 class YAMLFormatter(BaseFormatter):
-    """Format execution results as YAML."""
+    """Format execution results as YAML.
+    
+    Uses PyYAML's libyaml-backed CSafeDumper when PyYAML was built with
+    libyaml, falling back to the pure-Python SafeDumper.
+    """
 
     def format(self, results: List[ExecutionResult]) -> str:
         """Format execution results as YAML.
         
         Args:
             results: List of ExecutionResult objects
-            
+        
         Returns:
             YAML formatted string
         """
+        return self._dump(results)
+
+    def write(self, results: List[ExecutionResult], fh: BinaryIO) -> None:
+        """Stream execution results as YAML to a binary file object.
+        
+        The emitter writes to fh as it goes, so the serialized document is
+        never held in memory as one string.
+        
+        Args:
+            results: List of ExecutionResult objects
+            fh: Binary file object to write to
+        """
+        self._dump(results, fh)
+
+    def _dump(self, results: List[ExecutionResult], stream: Optional[BinaryIO] = None):
+        """Dump results as YAML, to a UTF-8 byte stream or as a string."""
         try:
             import yaml
         except ImportError:
             raise ImportError(
                 "PyYAML is required for YAML output. "
-                "Install with: pip install pyyaml"
+                "Install with: pip install pyyaml "
+                "(built against libyaml for faster output)"
             )
         
-        data = []
-        for result in results:
-            data.append({
-                "hostname": result.hostname,
-                "command": result.command.text,
-                "status": result.status.value,
-                "output": result.output,
-                "error": result.error,
-                "duration_ms": int(result.duration * 1000) if result.duration is not None else None,
-                "timestamp": result.timestamp.isoformat() if result.timestamp else None
-            })
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        
+        data = [dict(zip(RESULT_FIELDS, row)) for row in zip(*project_results(results))]
         
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(
+            data,
+            stream,
+            Dumper=dumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+            encoding="utf-8" if stream is not None else None,
+        )
@@ -5,10 +5,13 @@ This module defines the core data structures using dataclasses with
 proper validation and type hints for type safety.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
+import math
+import time
 
 
 class DeviceType(Enum):
@@ -30,21 +33,7 @@ class DeviceType(Enum):
     @classmethod
     def from_string(cls, value: str) -> "DeviceType":
         """Convert string to DeviceType, handling variations."""
-        # Normalize the input
-        normalized = value.lower().replace("-", "_").replace(" ", "_")
-
-        # Direct match
-        for device_type in cls:
-            if device_type.value == normalized:
-                return device_type
-
-        # Try without vendor prefix for backwards compatibility
-        for device_type in cls:
-            if device_type.name.lower() == normalized:
-                return device_type
-
-        # Default to generic if no match
-        return cls.GENERIC
+        return _device_type_from_string(value)
 
 
 class AuthMethod(Enum):
@@ -57,12 +46,30 @@ class AuthMethod(Enum):
     @classmethod
     def from_string(cls, value: str) -> "AuthMethod":
         """Convert string to AuthMethod."""
-        normalized = value.lower().strip()
-        for method in cls:
-            if method.value == normalized:
-                return method
-        # Default to PASSWORD if no match
-        return cls.PASSWORD
+        return _auth_method_from_string(value)
+
+
+# Normalized names and values -> member; values take precedence over names
+_DEVICE_TYPE_LOOKUP = {
+    **{device_type.name.lower(): device_type for device_type in DeviceType},
+    **{device_type.value: device_type for device_type in DeviceType},
+}
+_AUTH_METHOD_LOOKUP = {method.value: method for method in AuthMethod}
+
+
+@lru_cache(maxsize=256)
+def _device_type_from_string(value: str) -> DeviceType:
+    """Look up a DeviceType, cached since inventories repeat a few types."""
+    normalized = value.lower().replace("-", "_").replace(" ", "_")
+    # Default to generic if no match
+    return _DEVICE_TYPE_LOOKUP.get(normalized, DeviceType.GENERIC)
+
+
+@lru_cache(maxsize=256)
+def _auth_method_from_string(value: str) -> AuthMethod:
+    """Look up an AuthMethod, cached since inventories repeat a few methods."""
+    # Default to PASSWORD if no match
+    return _AUTH_METHOD_LOOKUP.get(value.lower().strip(), AuthMethod.PASSWORD)
 
 
 class ExecutionStatus(Enum):
@@ -77,7 +84,7 @@ class ExecutionStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Device:
     """
     Represents a network device to connect to.
@@ -92,7 +99,7 @@ class Device:
         ssh_key_file: Path to SSH private key file (optional)
         proxy_jump: SSH proxy/jump server (optional)
         ssh_config: Path to SSH config file (optional)
-        tags: Device tags for filtering/grouping
+        tags: Device tags for filtering/grouping (case-insensitive, stored lowercased)
         enabled_commands: Whether device supports enable mode
     """
 
@@ -114,6 +121,9 @@ class Device:
             raise ValueError("Device hostname cannot be empty")
         if self.port < 1 or self.port > 65535:
             raise ValueError(f"Invalid port number: {self.port}")
+        if self.tags:
+            # Normalize once so has_tag is a single set lookup
+            object.__setattr__(self, "tags", frozenset(t.lower() for t in self.tags))
 
     @property
     def display_name(self) -> str:
@@ -132,10 +142,10 @@ class Device:
 
     def has_tag(self, tag: str) -> bool:
         """Check if device has a specific tag."""
-        return tag.lower() in (t.lower() for t in self.tags)
+        return tag.lower() in self.tags
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """
     Represents a command to execute on devices.
@@ -178,7 +188,19 @@ class Command:
         return self.command
 
 
-@dataclass
+def _isoformat_epoch(epoch: float) -> str:
+    """Format a local epoch time like datetime.fromtimestamp(epoch).isoformat()."""
+    fraction, seconds = math.modf(epoch)
+    micros = round(fraction * 1_000_000)
+    if micros >= 1_000_000:
+        seconds, micros = seconds + 1, micros - 1_000_000
+    elif micros < 0:
+        seconds, micros = seconds - 1, micros + 1_000_000
+    text = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(seconds))
+    return f"{text}.{micros:06d}" if micros else text
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """
     Result of executing a command on a device.
@@ -189,9 +211,14 @@ class ExecutionResult:
         status: Execution status
         output: Command output (if successful)
         error: Error message (if failed)
-        timestamp: When the command was executed
+        executed_at: When the command was executed, as a datetime (init only;
+            defaults to now)
         duration: How long the command took (seconds)
         retries: Number of retry attempts
+        timestamp_epoch: When the command was executed, in seconds since the epoch
+
+    Only the epoch float is stored; ``timestamp`` builds a local datetime
+    from it when read.
     """
 
     device: Device
@@ -199,9 +226,30 @@ class ExecutionResult:
     status: ExecutionStatus
     output: str = ""
     error: str = ""
-    timestamp: datetime = field(default_factory=datetime.now)
+    executed_at: InitVar[Optional[datetime]] = None
     duration: float = 0.0
     retries: int = 0
+    timestamp_epoch: float = field(default_factory=time.time)
+
+    def __post_init__(self, executed_at: Optional[datetime]) -> None:
+        """Record an explicitly passed execution time."""
+        if executed_at is not None:
+            self.timestamp_epoch = executed_at.timestamp()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Get when the command was executed, as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp_epoch)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        """Set when the command was executed from a datetime."""
+        self.timestamp_epoch = value.timestamp()
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Get the execution time as an ISO 8601 string."""
+        return _isoformat_epoch(self.timestamp_epoch)
 
     @property
     def is_success(self) -> bool:
@@ -232,14 +280,15 @@ class ExecutionResult:
 
     def to_dict(self) -> dict:
         """Convert result to dictionary for serialization."""
+        device = self.device
         return {
-            "hostname": self.device.hostname,
-            "device_type": self.device.device_type.value,
+            "hostname": device.hostname,
+            "device_type": device.device_type.value,
             "command": self.command.command,
             "status": self.status.value,
             "output": self.output,
             "error": self.error,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "duration": self.duration,
             "retries": self.retries,
         }
@@ -0,0 +1,209 @@
+"""Reusable pool of live Netmiko connections.
+
+This module provides a thread-safe cache of open SSH sessions keyed by
+device identity, so back-to-back collections against the same devices can
+skip the SSH handshake and authentication.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .models import Device
+
+
+PoolKey = tuple[str, int, Optional[str], str]
+"""Pool key: (host, port, username, device_type)."""
+
+
+@dataclass
+class PooledConnection:
+    """An idle connection held by the pool."""
+
+    connection: Any
+    """The live Netmiko connection."""
+
+    created_at: float
+    """Monotonic time the connection was opened."""
+
+    last_used: float
+    """Monotonic time the connection was last released."""
+
+
+def pool_key(device: Device) -> PoolKey:
+    """Build the pool key for a device."""
+    return (device.hostname, device.port, device.username, device.device_type.value)
+
+
+def _close(connection: Any) -> None:
+    """Disconnect a connection, ignoring errors."""
+    try:
+        connection.disconnect()
+    except Exception:  # nosec B110 - Best effort disconnect, failure is acceptable
+        pass
+
+
+class ConnectionPool:
+    """Thread-safe pool of idle Netmiko connections.
+
+    Connections are checked out with ``acquire`` and handed back with
+    ``release``; a connection that hit an error should be passed to
+    ``discard`` instead so it is never reused. A background thread closes
+    connections that have been idle longer than ``idle_timeout`` or open
+    longer than ``max_age``.
+
+    Example:
+        >>> with ConnectionPool(max_size=10) as pool:
+        ...     key = pool_key(device)
+        ...     conn = pool.acquire(key, lambda: ConnectHandler(**params))
+        ...     try:
+        ...         conn.send_command("show version")
+        ...     except Exception:
+        ...         pool.discard(conn)
+        ...         raise
+        ...     pool.release(key, conn)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 20,
+        idle_timeout: float = 300,
+        max_age: float = 3600,
+        reap_interval: float = 30,
+    ):
+        """Initialize the connection pool.
+
+        Args:
+            max_size: Maximum number of idle connections kept
+            idle_timeout: Seconds an idle connection is kept before closing
+            max_age: Seconds after which a connection is closed regardless of use
+            reap_interval: Seconds between background eviction passes
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+
+        self._lock = threading.RLock()
+        self._idle: dict[PoolKey, PooledConnection] = {}
+        self._created: dict[int, float] = {}
+        self._closed = False
+
+        self._stop = threading.Event()
+        self._reaper = threading.Thread(
+            target=self._reap_loop,
+            args=(reap_interval,),
+            name="netmiko-pool-reaper",
+            daemon=True,
+        )
+        self._reaper.start()
+
+    def __enter__(self) -> "ConnectionPool":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close all connections."""
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        """Number of idle connections in the pool."""
+        with self._lock:
+            return len(self._idle)
+
+    def _expired(self, entry: PooledConnection, now: float) -> bool:
+        """Check whether an idle entry should be evicted."""
+        return (
+            now - entry.last_used > self.idle_timeout
+            or now - entry.created_at > self.max_age
+        )
+
+    def acquire(self, key: PoolKey, factory: Callable[[], Any]) -> Any:
+        """Check out a connection for a key, opening one if none is idle.
+
+        Args:
+            key: Pool key identifying the device and credentials
+            factory: Callable opening a new connection on a pool miss
+
+        Returns:
+            A live connection owned by the caller until released
+        """
+        with self._lock:
+            entry = self._idle.pop(key, None)
+
+        if entry is not None:
+            if not self._expired(entry, time.monotonic()) and entry.connection.is_alive():
+                return entry.connection
+            self.discard(entry.connection)
+
+        connection = factory()
+        with self._lock:
+            self._created[id(connection)] = time.monotonic()
+        return connection
+
+    def release(self, key: PoolKey, connection: Any) -> None:
+        """Return a healthy connection to the pool for reuse.
+
+        The connection is closed instead if the pool is closed or full, or
+        if another connection for the same key is already idle.
+
+        Args:
+            key: Pool key the connection was acquired with
+            connection: Connection to return
+        """
+        now = time.monotonic()
+        with self._lock:
+            created_at = self._created.get(id(connection), now)
+            keep = (
+                not self._closed
+                and key not in self._idle
+                and len(self._idle) < self.max_size
+                and now - created_at <= self.max_age
+            )
+            if keep:
+                self._idle[key] = PooledConnection(connection, created_at, now)
+                return
+
+        self.discard(connection)
+
+    def discard(self, connection: Any) -> None:
+        """Close a connection and stop tracking it.
+
+        Args:
+            connection: Connection to close
+        """
+        with self._lock:
+            self._created.pop(id(connection), None)
+        _close(connection)
+
+    def evict_expired(self) -> int:
+        """Close idle connections past their idle timeout or max age.
+
+        Returns:
+            Number of connections closed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._idle.items() if self._expired(entry, now)]
+            entries = [self._idle.pop(key) for key in expired]
+
+        for entry in entries:
+            self.discard(entry.connection)
+        return len(entries)
+
+    def close(self) -> None:
+        """Stop the reaper and close every idle connection."""
+        self._stop.set()
+        with self._lock:
+            self._closed = True
+            entries = list(self._idle.values())
+            self._idle.clear()
+
+        for entry in entries:
+            self.discard(entry.connection)
+
+    def _reap_loop(self, interval: float) -> None:
+        """Background loop evicting expired connections."""
+        while not self._stop.wait(interval):
+            self.evict_expired()
@@ -0,0 +1,101 @@
+"""Incremental result writing on a background thread.
+
+This module provides a sink that writes each ExecutionResult to the output
+file as soon as it arrives, so a collection never has to hold every
+device's output in memory and disk I/O overlaps with SSH work.
+"""
+
+import csv
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .formatters.base import WRITE_BUFFER_SIZE
+from .formatters.csv_formatter import CSVFormatter
+from .models import ExecutionResult
+
+
+_STOP = object()
+"""Queue sentinel telling the writer thread to finish."""
+
+
+class ResultSink:
+    """Stream results to a CSV file from a background writer thread.
+
+    ``put`` only enqueues, so it is cheap to call from executor worker
+    threads; rows are written in arrival order with the same columns as
+    CSVFormatter.
+
+    Example:
+        >>> with ResultSink(Path("output.csv")) as sink:
+        ...     execute_on_devices(devices, commands, sink=sink.put)
+    """
+
+    def __init__(self, filepath: Path):
+        """Open the output file and start the writer thread.
+
+        Args:
+            filepath: Path to the CSV file to create
+        """
+        self.filepath = filepath
+        self.count = 0
+        self._error: Optional[Exception] = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        self._file = open(
+            filepath, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE
+        )
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(CSVFormatter.HEADER)
+
+        self._thread = threading.Thread(target=self._run, name="result-sink", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "ResultSink":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - flush and close the file."""
+        self.close()
+        return False
+
+    def put(self, result: ExecutionResult) -> None:
+        """Queue a result for writing.
+
+        Args:
+            result: ExecutionResult to write
+        """
+        self._queue.put(result)
+
+    def _run(self) -> None:
+        """Writer loop: write queued results until the stop sentinel."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._writer.writerow(CSVFormatter.to_row(item))
+                self.count += 1
+            except Exception as e:
+                # Keep draining so producers never block on a dead writer
+                self._error = e
+
+    def close(self) -> None:
+        """Write all queued results, then close the file.
+
+        Raises:
+            Exception: The first error raised while writing, if any
+        """
+        if self._file.closed:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+
+        if self._error is not None:
+            raise self._error
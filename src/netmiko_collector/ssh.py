@@ -5,16 +5,29 @@ using the Netmiko library with comprehensive error handling and retry logic.
 """
 
 from typing import Optional
+import codecs
+import random
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 from netmiko import ConnectHandler
+from netmiko.base_connection import BaseConnection
+from netmiko.channel import SSHChannel
 from netmiko.exceptions import (
     NetmikoTimeoutException,
     NetmikoAuthenticationException,
+    ReadException,
 )
+from netmiko.ssh_dispatcher import CLASS_MAPPER
 
-from .models import Device, Command, ExecutionResult, ExecutionStatus
+from .commands import BATCH_DEVICE_TYPES, join_for_batch, split_batch_output
+from .models import AuthMethod, Device, Command, ExecutionResult, ExecutionStatus
+from .pool import ConnectionPool, pool_key
+
+
+READ_CHUNK_SIZE = 65536
+"""Bytes requested per recv() call when fast_read is enabled."""
 
 
 @dataclass
@@ -31,13 +44,97 @@ class SSHConfig:
     """Maximum number of connection retry attempts."""
     
     retry_delay: int = 5
-    """Delay between retry attempts in seconds."""
+    """Base delay between retry attempts in seconds, doubled per attempt."""
+    
+    max_retry_delay: float = 30
+    """Upper bound for a single retry delay in seconds, before jitter."""
+    
+    retry_budget: Optional[float] = None
+    """Total seconds a connection may spend retrying, or None for no limit."""
     
     read_timeout_override: Optional[int] = None
     """Override for read timeout if needed."""
     
     session_log: Optional[str] = None
     """Path to session log file if logging is enabled."""
+    
+    batch_commands: bool = False
+    """Send all commands in one round-trip on devices that support it."""
+    
+    fast_read: bool = False
+    """Drain the channel in large chunks and decode each read once."""
+
+
+class ChunkedSSHChannel(SSHChannel):
+    """SSH channel that drains all pending data before decoding it.
+    
+    Netmiko's channel decodes every recv() separately and appends it to a
+    string. This one collects the raw chunks, joins them once and decodes
+    them with an incremental decoder, so a multi-byte character split
+    across two reads is kept intact instead of being dropped.
+    """
+    
+    def __init__(self, conn, encoding: str):
+        """Initialize the channel.
+        
+        Args:
+            conn: The underlying paramiko channel
+            encoding: Character encoding of the device output
+        """
+        super().__init__(conn=conn, encoding=encoding)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    
+    def read_channel(self) -> str:
+        """Read and decode all data currently available on the channel.
+        
+        Returns:
+            Decoded output, empty if nothing is pending
+            
+        Raises:
+            ReadException: If there is no channel or the remote closed it
+        """
+        if self.remote_conn is None:
+            raise ReadException("Attempt to read, but there is no active channel.")
+        
+        chunks = []
+        while self.remote_conn.recv_ready():
+            chunk = self.remote_conn.recv(READ_CHUNK_SIZE)
+            if not chunk:
+                raise ReadException("Channel stream closed by remote device.")
+            chunks.append(chunk)
+        
+        return self._decoder.decode(b"".join(chunks))
+
+
+class FastReadMixin:
+    """Netmiko connection mixin that reads through a ChunkedSSHChannel.
+    
+    Only plain SSH channels are swapped; telnet and serial connections
+    keep their own channel.
+    """
+    
+    def establish_connection(self, *args, **kwargs) -> None:
+        """Establish the connection, then replace its SSH channel."""
+        super().establish_connection(*args, **kwargs)
+        if type(self.channel) is SSHChannel:
+            self.channel = ChunkedSSHChannel(self.remote_conn, self.encoding)
+
+
+@lru_cache(maxsize=None)
+def fast_read_class(device_type: str) -> type[BaseConnection]:
+    """Build the fast-read variant of Netmiko's class for a device type.
+    
+    Args:
+        device_type: Netmiko device type, e.g. ``cisco_ios``
+        
+    Returns:
+        Subclass of the Netmiko connection class with FastReadMixin applied
+        
+    Raises:
+        KeyError: If Netmiko does not support the device type
+    """
+    base = CLASS_MAPPER[device_type]
+    return type(f"FastRead{base.__name__}", (FastReadMixin, base), {})
 
 
 class SSHConnection:
@@ -57,17 +154,21 @@ class SSHConnection:
         self,
         device: Device,
         ssh_config: Optional[SSHConfig] = None,
+        pool: Optional[ConnectionPool] = None,
     ):
         """Initialize SSH connection manager.
         
         Args:
             device: Device to connect to
             ssh_config: SSH configuration options
+            pool: Connection pool to reuse sessions from (optional)
         """
         self.device = device
         self.ssh_config = ssh_config or SSHConfig()
+        self.pool = pool
         self.connection: Optional[ConnectHandler] = None
         self._connected = False
+        self._reusable = True
     
     def __enter__(self) -> "SSHConnection":
         """Context manager entry - establish connection."""
@@ -76,6 +177,8 @@ class SSHConnection:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - close connection."""
+        if exc_type is not None:
+            self._reusable = False
         self.disconnect()
         return False
     
@@ -90,22 +193,25 @@ class SSHConnection:
         if self._connected:
             return
         
+        # Built once and reused by every retry attempt in _open()
+        device = self.device
         device_params = {
-            "device_type": self.device.device_type.value,
-            "host": self.device.hostname,
-            "port": self.device.port,
-            "username": self.device.username,
+            "device_type": device.device_type.value,
+            "host": device.hostname,
+            "port": device.port,
+            "username": device.username,
             "timeout": self.ssh_config.timeout,
             "session_timeout": self.ssh_config.session_timeout,
         }
         
         # Add authentication
-        if self.device.auth_method.value == "password":
-            device_params["password"] = self.device.password or ""
-        elif self.device.auth_method.value == "key":
+        auth_method = device.auth_method
+        if auth_method is AuthMethod.PASSWORD:
+            device_params["password"] = device.password or ""
+        elif auth_method is AuthMethod.KEY:
             device_params["use_keys"] = True
-            if self.device.ssh_key_file:
-                device_params["key_file"] = self.device.ssh_key_file
+            if device.ssh_key_file:
+                device_params["key_file"] = device.ssh_key_file
         
         # Add optional parameters
         if self.ssh_config.session_log:
@@ -114,38 +220,78 @@ class SSHConnection:
         if self.ssh_config.read_timeout_override:
             device_params["read_timeout_override"] = self.ssh_config.read_timeout_override
         
-        # Retry logic
+        if self.pool is not None:
+            self.connection = self.pool.acquire(
+                pool_key(self.device), lambda: self._open(device_params)
+            )
+        else:
+            self.connection = self._open(device_params)
+        self._connected = True
+        self._reusable = True
+    
+    def _open(self, device_params: dict) -> BaseConnection:
+        """Open a new Netmiko connection with retry logic.
+        
+        Args:
+            device_params: Keyword arguments for ConnectHandler
+            
+        Returns:
+            The connected Netmiko handler
+        """
+        connect = ConnectHandler
+        if self.ssh_config.fast_read and device_params["device_type"] in CLASS_MAPPER:
+            connect = fast_read_class(device_params["device_type"])
+        
+        deadline = None
+        if self.ssh_config.retry_budget is not None:
+            deadline = time.monotonic() + self.ssh_config.retry_budget
+        
         last_exception = None
         for attempt in range(1, self.ssh_config.max_retries + 1):
             try:
-                self.connection = ConnectHandler(**device_params)
-                self._connected = True
-                return
+                return connect(**device_params)
             except NetmikoAuthenticationException:
                 # Don't retry authentication failures
                 raise
-            except NetmikoTimeoutException as e:
-                last_exception = e
-                if attempt < self.ssh_config.max_retries:
-                    time.sleep(self.ssh_config.retry_delay)
-                    continue
-                raise
             except Exception as e:
+                # Timeouts and other connection errors are retried
                 last_exception = e
-                if attempt < self.ssh_config.max_retries:
-                    time.sleep(self.ssh_config.retry_delay)
-                    continue
-                raise
+                if attempt >= self.ssh_config.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
         
-        # Should not reach here, but just in case
-        if last_exception:
-            raise last_exception
+        # Only reached when max_retries < 1 and no attempt was made
+        raise last_exception or ValueError("max_retries must be at least 1")
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter before retry number ``attempt``.
+        
+        Jitter spreads out retries from many threads that failed together,
+        e.g. when a whole subnet was briefly unreachable.
+        """
+        delay = min(
+            self.ssh_config.retry_delay * 2.0 ** (attempt - 1),
+            self.ssh_config.max_retry_delay,
+        )
+        return delay * random.uniform(0.5, 1.5)
     
     def disconnect(self) -> None:
-        """Close SSH connection gracefully."""
+        """Close SSH connection gracefully.
+        
+        With a pool, a connection that saw no errors is returned to it
+        instead of being closed.
+        """
         if self.connection and self._connected:
             try:
-                self.connection.disconnect()
+                if self.pool is not None and self._reusable:
+                    self.pool.release(pool_key(self.device), self.connection)
+                elif self.pool is not None:
+                    self.pool.discard(self.connection)
+                else:
+                    self.connection.disconnect()
             except Exception:  # nosec B110 - Best effort disconnect, failure is acceptable
                 pass  # Best effort disconnect
             finally:
@@ -177,6 +323,7 @@ class SSHConnection:
                 error=None,
             )
         except NetmikoTimeoutException as e:
+            self._reusable = False
             return ExecutionResult(
                 device=self.device,
                 command=command,
@@ -185,6 +332,7 @@ class SSHConnection:
                 error=f"Command timeout: {str(e)}",
             )
         except Exception as e:
+            self._reusable = False
             return ExecutionResult(
                 device=self.device,
                 command=command,
@@ -193,26 +341,117 @@ class SSHConnection:
                 error=f"Command execution error: {str(e)}",
             )
     
+    def execute_batch(self, commands: list[Command]) -> list[ExecutionResult]:
+        """Execute several commands in a single channel write.
+        
+        The commands are joined into one shell brace group with a marker
+        printed after each, and the combined output is split back per command.
+        Only suitable for device types in BATCH_DEVICE_TYPES.
+        
+        Args:
+            commands: Commands to execute
+            
+        Returns:
+            ExecutionResult for each command, in order
+            
+        Raises:
+            RuntimeError: If not connected
+        """
+        if not self._connected or not self.connection:
+            raise RuntimeError("Not connected to device")
+        
+        try:
+            output = self.connection.send_command_timing(
+                join_for_batch(commands),
+                read_timeout=sum(cmd.timeout for cmd in commands),
+            )
+        except Exception as e:
+            self._reusable = False
+            status = (
+                ExecutionStatus.TIMEOUT
+                if isinstance(e, NetmikoTimeoutException)
+                else ExecutionStatus.FAILED
+            )
+            return [
+                ExecutionResult(
+                    device=self.device,
+                    command=command,
+                    output="",
+                    status=status,
+                    error=f"Batch execution error: {str(e)}",
+                )
+                for command in commands
+            ]
+        
+        outputs = split_batch_output(output)
+        results = [
+            ExecutionResult(
+                device=self.device,
+                command=command,
+                output=command_output,
+                status=ExecutionStatus.SUCCESS,
+            )
+            for command, command_output in zip(commands, outputs)
+        ]
+        
+        # Commands whose marker never arrived did not finish in time
+        if len(outputs) < len(commands):
+            self._reusable = False
+            results.extend(
+                ExecutionResult(
+                    device=self.device,
+                    command=command,
+                    output="",
+                    status=ExecutionStatus.TIMEOUT,
+                    error="Batch output incomplete: command did not finish",
+                )
+                for command in commands[len(outputs):]
+            )
+        
+        return results
+    
     @property
     def is_connected(self) -> bool:
         """Check if connection is active."""
         return self._connected and self.connection is not None
 
 
+def _failed_results(
+    device: Device,
+    commands: list[Command],
+    status: ExecutionStatus,
+    error: str,
+) -> list[ExecutionResult]:
+    """Build results for commands that could not be run."""
+    return [
+        ExecutionResult(
+            device=device,
+            command=command,
+            output="",
+            status=status,
+            error=error,
+        )
+        for command in commands
+    ]
+
+
 def execute_commands_on_device(
     device: Device,
     commands: list[Command],
     ssh_config: Optional[SSHConfig] = None,
+    pool: Optional[ConnectionPool] = None,
 ) -> list[ExecutionResult]:
     """Execute multiple commands on a device with a single SSH connection.
     
     This is a convenience function that manages the connection lifecycle
-    and executes all commands in sequence.
+    and executes all commands in sequence. With ``ssh_config.batch_commands``
+    on a device type in BATCH_DEVICE_TYPES, they are sent in one round-trip.
     
     Args:
         device: Device to connect to
         commands: List of commands to execute
         ssh_config: SSH configuration options
+        pool: Connection pool to reuse sessions from (optional)
         
     Returns:
         List of ExecutionResult for each command
@@ -230,47 +469,35 @@ def execute_commands_on_device(
     results = []
     
     try:
-        with SSHConnection(device, ssh_config) as conn:
-            for command in commands:
-                result = conn.execute_command(command)
-                results.append(result)
+        with SSHConnection(device, ssh_config, pool) as conn:
+            if (
+                conn.ssh_config.batch_commands
+                and device.device_type in BATCH_DEVICE_TYPES
+                and len(commands) > 1
+            ):
+                results.extend(conn.execute_batch(commands))
+            else:
+                for command in commands:
+                    result = conn.execute_command(command)
+                    results.append(result)
     except NetmikoAuthenticationException as e:
         # Authentication failure - mark all commands as failed
-        for command in commands:
-            results.append(
-                ExecutionResult(
-                    device=device,
-                    command=command,
-                    output="",
-                    status=ExecutionStatus.FAILED,
-                    error=f"Authentication failed: {str(e)}",
-                )
-            )
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.FAILED,
+                            f"Authentication failed: {str(e)}")
+        )
     except NetmikoTimeoutException as e:
-        # Connection timeout - mark all remaining commands as failed
-        for command in commands:
-            if not any(r.command == command for r in results):
-                results.append(
-                    ExecutionResult(
-                        device=device,
-                        command=command,
-                        output="",
-                        status=ExecutionStatus.TIMEOUT,
-                        error=f"Connection timeout: {str(e)}",
-                    )
-                )
+        # Connection timeout - mark all remaining commands as failed.
+        # Commands run in order, so the remaining ones follow the results.
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.TIMEOUT,
+                            f"Connection timeout: {str(e)}")
+        )
     except Exception as e:
         # Other errors - mark all remaining commands as failed
-        for command in commands:
-            if not any(r.command == command for r in results):
-                results.append(
-                    ExecutionResult(
-                        device=device,
-                        command=command,
-                        output="",
-                        status=ExecutionStatus.FAILED,
-                        error=f"Connection error: {str(e)}",
-                    )
-                )
+        results.extend(
+            _failed_results(device, commands[len(results):], ExecutionStatus.FAILED,
+                            f"Connection error: {str(e)}")
+        )
     
     return results
@@ -1,6 +1,9 @@
 """Rich UI components for beautiful terminal output."""
 
-from typing import List, Optional
+import threading
+from collections import Counter
+from operator import attrgetter
+from typing import TYPE_CHECKING, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -9,9 +12,52 @@ from rich.table import Table
 
 from .models import ExecutionResult, ExecutionStatus
 
+if TYPE_CHECKING:
+    from .executor import ExecutionStats
+
 
 console = Console()
 
+_PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+    TimeElapsedColumn(),
+)
+"""Progress bar columns, built once and shared by every progress bar."""
+
+_DEVICE_SUMMARY_TEMPLATE = "\n".join([
+    "Total Devices: {total}",
+    "[green]✓ Success: {success}[/green]",
+    "[red]✗ Failed: {failed}[/red]",
+    "[yellow]⏱ Timeout: {timeout}[/yellow]",
+    "[red]🔒 Auth Failed: {auth_failed}[/red]",
+])
+"""Markup for create_device_summary, filled in with per-status counts."""
+
+_STATS_SUMMARY_TEMPLATE = "\n".join([
+    "Total Devices: {total}",
+    "[green]✓ Success: {success}[/green]",
+    "[red]✗ Failed: {failed}[/red]",
+    "Duration: {duration:.1f}s",
+])
+"""Markup for create_stats_summary, filled in from ExecutionStats counters."""
+
+_STATUS_STYLE: dict[ExecutionStatus, str] = {
+    ExecutionStatus.SUCCESS: "[green]✓ Success[/green]",
+    ExecutionStatus.FAILED: "[red]✗ Failed[/red]",
+    ExecutionStatus.TIMEOUT: "[yellow]⏱ Timeout[/yellow]",
+    ExecutionStatus.AUTH_FAILED: "[red]🔒 Auth Failed[/red]",
+}
+"""Status cell markup for create_results_table."""
+
+_UNKNOWN_STYLE = "[white]Unknown[/white]"
+"""Status cell markup for statuses without an entry in _STATUS_STYLE."""
+
+_status_of = attrgetter("status")
+"""Status getter for Counter(map(...)), which keeps the counting loop in C."""
+
 
 def create_progress_bar(total: int, description: str = "Processing devices") -> Progress:
     """
@@ -24,14 +70,70 @@ def create_progress_bar(total: int, description: str = "Processing devices") ->
     Returns:
         Progress: Configured Rich Progress object
     """
-    return Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-    )
+    return Progress(*_PROGRESS_COLUMNS, console=console)
+
+
+class BatchedProgress:
+    """Coalesce progress advances and apply them at a fixed interval.
+
+    ``advance`` only bumps a counter, so it is cheap to call once per
+    device; a background thread hands the accumulated count to Rich every
+    ``interval`` seconds instead of re-rendering on every completion. The
+    remainder is flushed on exit.
+
+    Example:
+        >>> with progress_bar as progress:
+        ...     task = progress.add_task("Processing devices", total=len(devices))
+        ...     with BatchedProgress(progress, task) as batched:
+        ...         execute_on_devices(devices, commands,
+        ...                            progress_callback=lambda *_: batched.advance())
+    """
+
+    def __init__(self, progress: Progress, task_id, interval: float = 0.1):
+        """
+        Initialize the batched progress updater.
+
+        Args:
+            progress: Rich Progress to update
+            task_id: Task to advance
+            interval: Seconds between updates
+        """
+        self.progress = progress
+        self.task_id = task_id
+        self.interval = interval
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress-flush", daemon=True)
+
+    def __enter__(self) -> "BatchedProgress":
+        """Start the flush thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the flush thread and apply any pending advances."""
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        return False
+
+    def advance(self, count: int = 1) -> None:
+        """Record completed steps without touching the display."""
+        with self._lock:
+            self._pending += count
+
+    def flush(self) -> None:
+        """Apply pending advances to the progress bar."""
+        with self._lock:
+            pending, self._pending = self._pending, 0
+        if pending:
+            self.progress.update(self.task_id, advance=pending)
+
+    def _run(self) -> None:
+        """Flush loop: apply pending advances every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.flush()
 
 
 def create_results_table(results: List[ExecutionResult]) -> Table:
@@ -50,16 +152,13 @@ def create_results_table(results: List[ExecutionResult]) -> Table:
     table.add_column("Duration", justify="right", style="green")
     table.add_column("Commands", justify="right", style="blue")
 
+    status_style_of = _STATUS_STYLE.get
     for result in results:
-        status_style = {
-            ExecutionStatus.SUCCESS: "[green]✓ Success[/green]",
-            ExecutionStatus.FAILED: "[red]✗ Failed[/red]",
-            ExecutionStatus.TIMEOUT: "[yellow]⏱ Timeout[/yellow]",
-            ExecutionStatus.AUTH_FAILED: "[red]🔒 Auth Failed[/red]",
-        }.get(result.status, "[white]Unknown[/white]")
+        status_style = status_style_of(result.status, _UNKNOWN_STYLE)
 
         duration = f"{result.duration:.2f}s" if result.duration else "N/A"
-        commands_count = str(len(result.outputs)) if result.outputs else "0"
+        # outputs holds at most one entry, keyed by the command run
+        commands_count = "1" if result.output else "0"
 
         table.add_row(result.hostname, status_style, duration, commands_count)
 
@@ -106,18 +205,33 @@ def create_device_summary(results: List[ExecutionResult]) -> str:
     Returns:
         str: Formatted summary text
     """
-    total = len(results)
-    success = sum(1 for r in results if r.status == ExecutionStatus.SUCCESS)
-    failed = sum(1 for r in results if r.status == ExecutionStatus.FAILED)
-    timeout = sum(1 for r in results if r.status == ExecutionStatus.TIMEOUT)
-    auth_failed = sum(1 for r in results if r.status == ExecutionStatus.AUTH_FAILED)
-
-    summary_lines = [
-        f"Total Devices: {total}",
-        f"[green]✓ Success: {success}[/green]",
-        f"[red]✗ Failed: {failed}[/red]",
-        f"[yellow]⏱ Timeout: {timeout}[/yellow]",
-        f"[red]🔒 Auth Failed: {auth_failed}[/red]",
-    ]
-
-    return "\n".join(summary_lines)
+    counts = Counter(map(_status_of, results))
+
+    return _DEVICE_SUMMARY_TEMPLATE.format(
+        total=len(results),
+        success=counts[ExecutionStatus.SUCCESS],
+        failed=counts[ExecutionStatus.FAILED],
+        timeout=counts[ExecutionStatus.TIMEOUT],
+        auth_failed=counts[ExecutionStatus.AUTH_FAILED],
+    )
+
+
+def create_stats_summary(stats: "ExecutionStats") -> str:
+    """
+    Create a summary of per-device execution statistics.
+
+    Unlike create_device_summary this needs no result list, so it also works
+    when results were streamed to a sink rather than retained.
+
+    Args:
+        stats: Statistics recorded by the executor
+
+    Returns:
+        str: Formatted summary text
+    """
+    return _STATS_SUMMARY_TEMPLATE.format(
+        total=stats.total_devices,
+        success=stats.successful_devices,
+        failed=stats.failed_devices,
+        duration=stats.duration,
+    )
@@ -4,17 +4,61 @@ This module provides pure utility functions used throughout the application.
 All functions are stateless and have no side effects beyond their documented behavior.
 """
 
+import csv
 import os
 import re
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional, Union
 
 
-def expand_path(path: str) -> Path:
+# Each label must start/end with alphanumeric, max 63 chars
+_HOSTNAME_MATCH = re.compile(
+    r'(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?',
+    re.ASCII,
+).fullmatch
+"""Match RFC 1123 hostnames; used by validate_hostname."""
+
+# One octet: 250-255, 200-249, or 0-199 with optional leading zeros
+_OCTET = r'(?:25[0-5]|2[0-4][0-9]|[01]?[0-9]?[0-9])'
+_IPV4_MATCH = re.compile(rf'(?:{_OCTET}\.){{3}}{_OCTET}', re.ASCII).fullmatch
+"""Match dotted-quad IPv4 addresses with every octet in 0-255."""
+
+_INVALID_FN_CHARS = '<>:"/\\|?*'
+"""Characters that sanitize_filename replaces."""
+
+_CONTROL_CHARS = dict.fromkeys(range(32))
+"""Translation table deleting ASCII control characters."""
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+"""Units used by get_file_size_str, each 1024 times the previous."""
+
+
+@lru_cache(maxsize=8)
+def _filename_table(replacement: str) -> dict[int, Optional[str]]:
+    """Build the sanitize_filename translation table for a replacement string.
+    
+    Control characters are dropped from the replacement as well, matching
+    the old replace-then-strip order.
+    """
+    table: dict[int, Optional[str]] = dict.fromkeys(
+        map(ord, _INVALID_FN_CHARS), replacement.translate(_CONTROL_CHARS)
+    )
+    table.update(_CONTROL_CHARS)
+    return table
+
+
+def expand_path(path: Union[str, os.PathLike]) -> Path:
     """Expand user home directory and environment variables in path.
     
+    The result is not resolved against the filesystem; use resolve_path
+    when a canonical absolute path is needed.
+    
     Args:
-        path: Path string that may contain ~ or environment variables
+        path: Path string or path-like object that may contain ~ or
+            environment variables
         
     Returns:
         Expanded Path object
@@ -25,8 +69,32 @@ def expand_path(path: str) -> Path:
         >>> expand_path("$HOME/data")
         Path("/home/user/data")
     """
-    expanded = os.path.expanduser(os.path.expandvars(path))
-    return Path(expanded).resolve()
+    return Path(os.path.expanduser(os.path.expandvars(os.fspath(path))))
+
+
+def resolve_path(path: Union[str, os.PathLike]) -> Path:
+    """Expand path like expand_path, then make it absolute and canonical.
+    
+    Args:
+        path: Path string or path-like object that may contain ~ or
+            environment variables
+        
+    Returns:
+        Absolute Path with symlinks resolved
+        
+    Examples:
+        >>> resolve_path("~/documents/../data")
+        Path("/home/user/data")
+    """
+    expanded = os.path.expanduser(os.path.expandvars(os.fspath(path)))
+    # Cache on the absolute form so a later chdir or env change is not masked
+    return _resolve_cached(os.path.join(os.getcwd(), expanded))
+
+
+@lru_cache(maxsize=256)
+def _resolve_cached(path: str) -> Path:
+    """Resolve an absolute path string, caching the result."""
+    return Path(path).resolve()
 
 
 def validate_hostname(hostname: str) -> bool:
@@ -49,17 +117,9 @@ def validate_hostname(hostname: str) -> bool:
     if not hostname or len(hostname) > 253:
         return False
     
-    # Allow IP addresses
-    if is_valid_ip(hostname):
-        return True
-    
-    # Hostname pattern: alphanumeric, hyphens, dots
-    # Each label must start/end with alphanumeric, max 63 chars
-    hostname_pattern = re.compile(
-        r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)*'
-        r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?$'
-    )
-    return bool(hostname_pattern.match(hostname))
+    # Hostname pattern: alphanumeric, hyphens, dots. A valid IPv4 address
+    # is four all-digit labels, which the pattern already accepts.
+    return _HOSTNAME_MATCH(hostname) is not None
 
 
 def is_valid_ip(ip_address: str) -> bool:
@@ -79,22 +139,39 @@ def is_valid_ip(ip_address: str) -> bool:
         >>> is_valid_ip("not.an.ip")
         False
     """
-    if not ip_address:
+    # "0.0.0.0" to "255.255.255.255" is 7 to 15 characters
+    if not ip_address or not 7 <= len(ip_address) <= 15:
         return False
     
-    parts = ip_address.split('.')
-    if len(parts) != 4:
-        return False
+    return _IPV4_MATCH(ip_address) is not None
+
+
+def validate_ips_batch(ip_addresses: Iterable[str]) -> list[bool]:
+    """Check many strings for valid IPv4 addresses at once.
     
-    try:
-        return all(0 <= int(part) <= 255 for part in parts)
-    except (ValueError, TypeError):
-        return False
+    Equivalent to ``[is_valid_ip(a) for a in ip_addresses]`` but calls the
+    compiled matcher directly, without a Python call per address.
+    
+    Args:
+        ip_addresses: Strings to validate as IPv4 addresses
+        
+    Returns:
+        One bool per input, True where the address is valid
+        
+    Examples:
+        >>> validate_ips_batch(["10.0.0.1", "router1", "256.1.1.1"])
+        [True, False, False]
+    """
+    return [match is not None for match in map(_IPV4_MATCH, ip_addresses)]
 
 
 def validate_port(port: int) -> bool:
     """Validate port number is in valid range.
     
+    A chained comparison is the cheapest check CPython offers here; a
+    ``range`` membership test adds a global lookup and falls back to a
+    linear scan for non-int values.
+    
     Args:
         port: Port number to validate
         
@@ -130,12 +207,8 @@ def sanitize_filename(filename: str, replacement: str = "_") -> str:
         >>> sanitize_filename("data/file.csv")
         'data_file.csv'
     """
-    # Remove or replace characters invalid in filenames
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, replacement, filename)
-    
-    # Remove control characters
-    sanitized = ''.join(char for char in sanitized if ord(char) >= 32)
+    # Replace characters invalid in filenames and drop control characters
+    sanitized = filename.translate(_filename_table(replacement))
     
     # Trim spaces and dots from ends
     sanitized = sanitized.strip('. ')
@@ -168,10 +241,42 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
     
-    if max_length <= len(suffix):
+    cut = max_length - len(suffix)
+    if cut <= 0:
         return suffix[:max_length]
     
-    return text[:max_length - len(suffix)] + suffix
+    return f"{text[:cut]}{suffix}"
+
+
+def make_truncator(max_length: int, suffix: str = "...") -> Callable[[str], str]:
+    """Build a truncate_string equivalent with the length and suffix fixed.
+    
+    The cut point is computed once, so callers that always truncate to the
+    same width skip that arithmetic per call.
+    
+    Args:
+        max_length: Maximum length including suffix
+        suffix: Suffix to add if truncated (default: "...")
+        
+    Returns:
+        Function taking the text and returning it truncated
+        
+    Examples:
+        >>> truncate = make_truncator(10)
+        >>> truncate("This is a long string")
+        'This is...'
+    """
+    cut = max_length - len(suffix)
+    if cut <= 0:
+        short_suffix = suffix[:max_length]
+        
+        def truncate(text: str) -> str:
+            return text if len(text) <= max_length else short_suffix
+    else:
+        def truncate(text: str) -> str:
+            return text if len(text) <= max_length else f"{text[:cut]}{suffix}"
+    
+    return truncate
 
 
 def parse_csv_line(line: str, delimiter: str = ",") -> list[str]:
@@ -190,8 +295,9 @@ def parse_csv_line(line: str, delimiter: str = ",") -> list[str]:
         >>> parse_csv_line('a,b,c')
         ['a', 'b', 'c']
     """
-    import csv
-    from io import StringIO
+    # Unquoted single-line rows split the same way csv.reader would
+    if line and '"' not in line and '\n' not in line and '\r' not in line:
+        return [field.strip() for field in line.split(delimiter)]
     
     reader = csv.reader(StringIO(line), delimiter=delimiter)
     fields = next(reader, [])
@@ -218,15 +324,12 @@ def format_duration(seconds: float) -> str:
     if seconds < 60:
         return f"{seconds:.1f}s"
     
-    minutes = int(seconds // 60)
-    remaining_seconds = seconds % 60
-    
-    if minutes < 60:
-        return f"{minutes}m {remaining_seconds:.1f}s"
+    minutes, remaining_seconds = divmod(seconds, 60)
+    hours, remaining_minutes = divmod(int(minutes), 60)
     
-    hours = minutes // 60
-    remaining_minutes = minutes % 60
-    return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
+    if hours:
+        return f"{hours}h {remaining_minutes}m {remaining_seconds:.1f}s"
+    return f"{remaining_minutes}m {remaining_seconds:.1f}s"
 
 
 def get_file_size_str(size_bytes: int) -> str:
@@ -246,8 +349,9 @@ def get_file_size_str(size_bytes: int) -> str:
         >>> get_file_size_str(1048576)
         '1.0 MB'
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
@@ -4,21 +4,35 @@ Unit tests for netmiko_collector.py
 """
 
 import csv
+import gzip
 import os
+import socket
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from netmiko_collector import (
+    HandshakeLimiter,
+    Result,
+    batch_resolve,
     connect_and_execute,
+    forget_password,
+    get_password,
     load_commands,
     load_config,
     load_devices,
+    load_devices_soa,
     process_devices_parallel,
     save_config,
+    save_results,
     save_to_csv,
+    save_to_html,
 )
+from netmiko_collector_workers import pickle_results, run_pickled
 
 
 class TestLoadDevices:
@@ -60,6 +74,24 @@ class TestLoadDevices:
         finally:
             os.unlink(temp_file)
 
+    def test_load_devices_soa(self):
+        """Test column-wise loading matches load_devices."""
+        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
+            f.write("hostname,ip_address,device_type\n")
+            f.write("router1,192.168.1.1,cisco_ios\n")
+            f.write("switch1,192.168.1.2,\n")
+            temp_file = f.name
+
+        try:
+            columns = load_devices_soa(temp_file, default_device_type="cisco_nxos")
+            assert columns == {
+                "hostname": ["router1", "switch1"],
+                "ip_address": ["192.168.1.1", "192.168.1.2"],
+                "device_type": ["cisco_ios", "cisco_nxos"],
+            }
+        finally:
+            os.unlink(temp_file)
+
     def test_load_devices_file_not_found(self):
         """Test error when devices file doesn't exist."""
         with pytest.raises(FileNotFoundError):
@@ -167,22 +199,22 @@ class TestSaveToCSV:
     def test_save_to_csv_valid(self):
         """Test saving results to CSV."""
         results = [
-            {
-                "timestamp": "2025-10-20 14:30:15",
-                "hostname": "router1",
-                "ip_address": "192.168.1.1",
-                "command": "show version",
-                "output": "Cisco IOS...",
-                "status": "success",
-            },
-            {
-                "timestamp": "2025-10-20 14:30:18",
-                "hostname": "router1",
-                "ip_address": "192.168.1.1",
-                "command": "show ip interface brief",
-                "output": "Interface...",
-                "status": "success",
-            },
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS...",
+                status="success",
+            ),
+            Result(
+                timestamp="2025-10-20 14:30:18",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show ip interface brief",
+                output="Interface...",
+                status="success",
+            ),
         ]
 
         with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
@@ -203,6 +235,28 @@ class TestSaveToCSV:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
 
+    def test_save_to_csv_compressed(self, tmp_path):
+        """Test saving results to a gzip-compressed CSV."""
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS...",
+                status="success",
+            ),
+        ]
+        output_file = tmp_path / "output.csv"
+
+        save_to_csv(results, str(output_file), compress=True)
+
+        assert not output_file.exists()
+        with gzip.open(f"{output_file}.gz", "rt", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1
+        assert rows[0]["hostname"] == "router1"
+
     def test_save_to_csv_empty_results(self):
         """Test saving empty results (should not create file)."""
         with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as f:
@@ -219,6 +273,247 @@ class TestSaveToCSV:
                 os.unlink(temp_file)
 
 
+class TestSaveToHTML:
+    """Test the save_to_html function."""
+
+    def test_save_to_html_escapes_fields(self, tmp_path):
+        """Test that device data and command output are HTML-escaped."""
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show run | include <name>",
+                output='<script>alert("x")</script> & more',
+                status="success",
+            ),
+        ]
+        output_file = tmp_path / "report.html"
+
+        save_to_html(results, str(output_file))
+
+        content = output_file.read_text(encoding="utf-8")
+        assert "<script>" not in content
+        assert "&lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; &amp; more" in content
+        assert "show run | include &lt;name&gt;" in content
+
+
+class TestSaveResults:
+    """Test the save_results function."""
+
+    def test_save_results_parallel_matches_sequential(self, tmp_path):
+        """Test that parallel saving writes every requested format."""
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS...",
+                status="success",
+            ),
+        ]
+        formats = ["csv", "json", "markdown"]
+        (tmp_path / "seq").mkdir()
+        (tmp_path / "par").mkdir()
+
+        save_results(results, str(tmp_path / "seq" / "output.csv"), formats, parallel=False)
+        save_results(results, str(tmp_path / "par" / "output.csv"), formats)
+
+        for name in ("output.csv", "output.json", "output.md"):
+            assert (tmp_path / "par" / name).exists()
+        sequential = (tmp_path / "seq" / "output.csv").read_text(encoding="utf-8")
+        assert (tmp_path / "par" / "output.csv").read_text(encoding="utf-8") == sequential
+
+    def test_save_results_parallel_html(self, tmp_path):
+        """Test that HTML is written alongside CSV when saving in parallel."""
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS...",
+                status="success",
+            ),
+        ]
+        save_results(results, str(tmp_path / "output.csv"), ["csv", "html"])
+
+        assert (tmp_path / "output.csv").exists()
+        content = (tmp_path / "output.html").read_text(encoding="utf-8")
+        assert "router1" in content
+        assert "Cisco IOS..." in content
+
+    def test_save_results_excel_in_worker_process(self, tmp_path):
+        """Test that the Excel writer produces a workbook from a worker process."""
+        openpyxl = pytest.importorskip("openpyxl")
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS...",
+                status="success",
+            ),
+        ]
+        save_results(results, str(tmp_path / "output.csv"), ["csv", "excel"])
+
+        workbook = openpyxl.load_workbook(tmp_path / "output.xlsx")
+        assert workbook["Detailed Results"]["B2"].value == "router1"
+
+    def test_writers_run_under_spawn(self, tmp_path):
+        """Test that pickled results and writers survive a spawned worker."""
+        results = [
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="<b>Cisco IOS</b>",
+                status="success",
+            ),
+        ]
+        output_file = tmp_path / "output.html"
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            pool.submit(
+                run_pickled, save_to_html, pickle_results(results), str(output_file)
+            ).result()
+
+        assert "&lt;b&gt;Cisco IOS&lt;/b&gt;" in output_file.read_text(encoding="utf-8")
+
+
+class TestGetPassword:
+    """Test the get_password function."""
+
+    @pytest.fixture
+    def mock_keyring(self, monkeypatch):
+        """Provide a mocked keyring module."""
+        mock = MagicMock()
+        monkeypatch.setattr("netmiko_collector.KEYRING_AVAILABLE", True)
+        monkeypatch.setattr("netmiko_collector.keyring", mock, raising=False)
+        return mock
+
+    def test_uses_cached_password(self, mock_keyring):
+        """Test that a cached password skips the prompt."""
+        mock_keyring.get_password.return_value = "cached"
+
+        with patch("netmiko_collector.getpass") as mock_getpass:
+            assert get_password("Password: ", "admin", use_cache=True) == "cached"
+
+        mock_getpass.assert_not_called()
+
+    def test_prompts_and_stores(self, mock_keyring):
+        """Test that a typed password is stored in the keyring."""
+        mock_keyring.get_password.return_value = None
+
+        with patch("netmiko_collector.getpass", return_value="typed"):
+            assert get_password("Password: ", "admin", use_cache=True) == "typed"
+
+        mock_keyring.set_password.assert_called_once_with("netmiko-collector", "admin", "typed")
+
+    def test_cache_disabled(self, mock_keyring):
+        """Test that use_cache=False never touches the keyring."""
+        with patch("netmiko_collector.getpass", return_value="typed"):
+            assert get_password("Password: ", "admin", use_cache=False) == "typed"
+
+        mock_keyring.get_password.assert_not_called()
+        mock_keyring.set_password.assert_not_called()
+
+    def test_cache_off_by_default(self, mock_keyring):
+        """Test that passwords are only stored when caching is requested."""
+        with patch("netmiko_collector.getpass", return_value="typed"):
+            assert get_password("Password: ", "admin") == "typed"
+
+        mock_keyring.get_password.assert_not_called()
+        mock_keyring.set_password.assert_not_called()
+
+    def test_forget_password(self, mock_keyring):
+        """Test that a cached password is deleted from the keyring."""
+        forget_password("admin")
+
+        mock_keyring.delete_password.assert_called_once_with("netmiko-collector", "admin")
+
+    def test_forget_missing_password(self, mock_keyring):
+        """Test that forgetting a password that was never stored is not an error."""
+        mock_keyring.delete_password.side_effect = Exception("not found")
+
+        forget_password("admin")
+
+
+class TestBatchResolve:
+    """Test the batch_resolve function."""
+
+    @pytest.fixture
+    def dns_cache(self, tmp_path, monkeypatch):
+        """Redirect the DNS cache into a temporary directory."""
+        path = tmp_path / "cache" / "dns.json"
+        monkeypatch.setattr("netmiko_collector.DNS_CACHE_FILE", path)
+        return path
+
+    def test_resolves_each_name_once(self, dns_cache):
+        """Test that names are resolved once and IP literals are skipped."""
+        addrinfo = [(2, 1, 6, "", ("10.0.0.1", 0))]
+        with patch("netmiko_collector.socket.getaddrinfo", return_value=addrinfo) as mock_gai:
+            resolved = batch_resolve(["router1", "router1", "192.168.1.1"])
+
+        assert resolved == {"router1": "10.0.0.1"}
+        assert mock_gai.call_count == 1
+        assert not dns_cache.exists()
+
+    def test_persist_writes_cache(self, dns_cache):
+        """Test that answers are only written to disk when persist is set."""
+        addrinfo = [(2, 1, 6, "", ("10.0.0.1", 0))]
+        with patch("netmiko_collector.socket.getaddrinfo", return_value=addrinfo):
+            batch_resolve(["router1"], persist=True)
+
+        assert dns_cache.exists()
+
+    def test_uses_cache_within_ttl(self, dns_cache):
+        """Test that cached answers skip DNS lookups."""
+        dns_cache.parent.mkdir(parents=True)
+        dns_cache.write_text('{"router1": ["10.0.0.9", %d]}' % (time.time() + 60))
+
+        with patch("netmiko_collector.socket.getaddrinfo") as mock_gai:
+            resolved = batch_resolve(["router1"], persist=True)
+
+        assert resolved == {"router1": "10.0.0.9"}
+        mock_gai.assert_not_called()
+
+    def test_failed_lookup_omitted(self, dns_cache):
+        """Test that unresolvable names are left for the SSH library."""
+        error = socket.gaierror("Name or service not known")
+        with patch("netmiko_collector.socket.getaddrinfo", side_effect=error):
+            assert batch_resolve(["missing.example"]) == {}
+
+
+class TestHandshakeLimiter:
+    """Test the HandshakeLimiter class."""
+
+    def test_burst_then_throttle(self):
+        """Test that handshakes beyond the burst wait for token refill."""
+        limiter = HandshakeLimiter(rate_per_sec=20, burst=2)
+
+        start = time.monotonic()
+        for _ in range(2):
+            with limiter:
+                pass
+        burst_elapsed = time.monotonic() - start
+
+        with limiter:
+            pass
+        throttled_elapsed = time.monotonic() - start
+
+        assert burst_elapsed < 0.04
+        assert throttled_elapsed >= 0.04
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            HandshakeLimiter(rate_per_sec=0)
+
+
 class TestConfigManagement:
     """Test configuration management functions."""
 
@@ -284,14 +579,14 @@ class TestParallelProcessing:
 
         # Mock the actual connection
         mock_results = [
-            {
-                "timestamp": "2025-10-20 14:30:15",
-                "hostname": "router1",
-                "ip_address": "192.168.1.1",
-                "command": "show version",
-                "output": "Cisco IOS",
-                "status": "success",
-            }
+            Result(
+                timestamp="2025-10-20 14:30:15",
+                hostname="router1",
+                ip_address="192.168.1.1",
+                command="show version",
+                output="Cisco IOS",
+                status="success",
+            )
         ]
 
         with patch("netmiko_collector.connect_with_retry", return_value=mock_results):
@@ -314,7 +609,7 @@ class TestParallelProcessing:
 
             # Should get results from both devices
             assert len(results) >= 1
-            assert all(isinstance(r, dict) for r in results)
+            assert all(isinstance(r, Result) for r in results)
 
 
 class TestWhitespaceStripping:
@@ -344,7 +639,7 @@ class TestWhitespaceStripping:
             # Output should have trailing whitespace stripped from each line
             # and leading/trailing empty lines removed
             expected = "  Line with spaces\n  Another line"
-            assert results[0]["output"] == expected
+            assert results[0].output == expected
 
             # Test with whitespace stripping disabled
             results = connect_and_execute(
@@ -354,4 +649,4 @@ class TestWhitespaceStripping:
             assert len(results) == 1
             # Output should NOT be stripped (original)
             expected = "  Line with spaces  \n  Another line  \n  "
-            assert results[0]["output"] == expected
+            assert results[0].output == expected
@@ -0,0 +1,181 @@
+"""Tests for async_executor module."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.netmiko_collector.async_executor import (
+    _connect_options,
+    execute_on_devices_async,
+    run_on_devices_async,
+    supports_async,
+)
+from src.netmiko_collector.models import (
+    AuthMethod,
+    Device,
+    Command,
+    DeviceType,
+    ExecutionStatus,
+)
+from src.netmiko_collector.ssh import SSHConfig
+
+
+class FakePermissionDenied(Exception):
+    """Stand-in for asyncssh.PermissionDenied."""
+
+
+class FakeError(Exception):
+    """Stand-in for asyncssh.Error."""
+
+
+class FakeConnection:
+    """Minimal asyncssh connection returning canned command output."""
+
+    def __init__(self, host):
+        self.host = host
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def run(self, command, check=False):
+        if command == "bad":
+            return SimpleNamespace(exit_status=1, stdout="", stderr="invalid command")
+        return SimpleNamespace(exit_status=0, stdout=f"{self.host}: {command}", stderr="")
+
+
+def fake_connect(**options):
+    """Connect to any host except 'denied'."""
+    if options["host"] == "denied":
+        raise FakePermissionDenied("bad password")
+    return FakeConnection(options["host"])
+
+
+@pytest.fixture
+def fake_asyncssh():
+    """Patch the asyncssh import with a fake module."""
+    module = SimpleNamespace(
+        connect=fake_connect,
+        PermissionDenied=FakePermissionDenied,
+        Error=FakeError,
+    )
+    with patch(
+        "src.netmiko_collector.async_executor._import_asyncssh",
+        return_value=module,
+    ):
+        yield module
+
+
+@pytest.fixture
+def test_commands():
+    """Create test commands."""
+    return [Command(command="show version"), Command(command="bad")]
+
+
+class TestSupportsAsync:
+    """Tests for supports_async."""
+
+    def test_requires_asyncssh(self):
+        """Test that async is unavailable without asyncssh."""
+        devices = [Device(hostname="sw1", device_type=DeviceType.ARISTA_EOS)]
+        with patch(
+            "src.netmiko_collector.async_executor.asyncssh_available",
+            return_value=False,
+        ):
+            assert not supports_async(devices)
+
+    def test_requires_exec_capable_devices(self):
+        """Test that interactive-only device types fall back to threads."""
+        with patch(
+            "src.netmiko_collector.async_executor.asyncssh_available",
+            return_value=True,
+        ):
+            assert supports_async([Device(hostname="sw1", device_type=DeviceType.ARISTA_EOS)])
+            assert not supports_async([
+                Device(hostname="sw1", device_type=DeviceType.ARISTA_EOS),
+                Device(hostname="r1", device_type=DeviceType.CISCO_IOS),
+            ])
+
+
+class TestConnectOptions:
+    """Tests for _connect_options."""
+
+    def test_password_auth_keeps_host_key_checking(self):
+        """Test password devices send a password and leave known_hosts alone."""
+        device = Device(hostname="sw1", username="admin", password="secret")
+
+        options = _connect_options(device, SSHConfig())
+
+        assert options["password"] == "secret"
+        assert "client_keys" not in options
+        assert "known_hosts" not in options
+
+    def test_key_auth(self):
+        """Test key devices send their key file instead of a password."""
+        device = Device(
+            hostname="sw1",
+            auth_method=AuthMethod.KEY,
+            ssh_key_file="/keys/id_ed25519",
+        )
+
+        options = _connect_options(device, SSHConfig())
+
+        assert options["client_keys"] == ["/keys/id_ed25519"]
+        assert "password" not in options
+
+
+class TestExecuteOnDevicesAsync:
+    """Tests for execute_on_devices_async."""
+
+    def test_executes_all_devices(self, fake_asyncssh, test_commands):
+        """Test that every device and command produces a result."""
+        devices = [Device(hostname=f"sw{i}") for i in range(5)]
+        callback_calls = []
+
+        results, stats = asyncio.run(
+            execute_on_devices_async(
+                devices,
+                test_commands,
+                max_workers=2,
+                progress_callback=lambda s, d, r: callback_calls.append(d),
+            )
+        )
+
+        assert len(results) == 10
+        assert stats.completed_devices == 5
+        assert stats.successful_commands == 5
+        assert stats.failed_commands == 5
+        assert len(callback_calls) == 5
+
+        ok = [r for r in results if r.command.command == "show version"]
+        assert all(r.status == ExecutionStatus.SUCCESS for r in ok)
+        assert ok[0].output == f"{ok[0].device.hostname}: show version"
+
+        bad = [r for r in results if r.command.command == "bad"]
+        assert all(r.status == ExecutionStatus.FAILED for r in bad)
+        assert bad[0].error == "invalid command"
+
+    def test_authentication_failure(self, fake_asyncssh, test_commands):
+        """Test that an auth failure marks all commands as failed."""
+        results, stats = asyncio.run(
+            execute_on_devices_async([Device(hostname="denied")], test_commands)
+        )
+
+        assert len(results) == 2
+        assert all(r.status == ExecutionStatus.FAILED for r in results)
+        assert "Authentication failed" in results[0].error
+        assert stats.failed_devices == 1
+
+    def test_sync_wrapper(self, fake_asyncssh, test_commands):
+        """Test that run_on_devices_async drives the coroutine to completion."""
+        devices = [Device(hostname=f"sw{i}") for i in range(3)]
+
+        results, stats = run_on_devices_async(devices, test_commands, max_workers=200)
+
+        assert len(results) == 6
+        assert stats.completed_devices == 3
+        assert stats.end_time is not None
@@ -1,35 +1,92 @@
 """Tests for CLI module."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+import typer
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable, Optional
+from unittest.mock import MagicMock
 from typer.testing import CliRunner
 
+from src.netmiko_collector import async_executor, cli, executor, formatters
+from src.netmiko_collector.async_executor import run_on_devices_async, supports_async
 from src.netmiko_collector.cli import app
+from src.netmiko_collector.commands import load_commands_from_file
+from src.netmiko_collector.devices import load_devices_from_csv
+from src.netmiko_collector.executor import ExecutionStats, execute_on_devices
+from src.netmiko_collector.formatters import get_formatter
 from src.netmiko_collector.models import Device, Command, ExecutionResult, ExecutionStatus
-from src.netmiko_collector.executor import ExecutionStats
+from src.netmiko_collector.pool import ConnectionPool
+from src.netmiko_collector.ui import BatchedProgress
 
 
 runner = CliRunner()
 
+DEVICES_CSV = (
+    b"hostname,ip,username,password\n"
+    b"router1,192.168.1.1,admin,password123\n"
+    b"router2,192.168.1.2,admin,password123\n"
+)
+COMMANDS_TXT = b"show version\nshow ip interface brief\n"
 
-@pytest.fixture
-def temp_devices_file(tmp_path):
-    """Create a temporary devices CSV file."""
-    devices_file = tmp_path / "devices.csv"
-    devices_file.write_text(
-        "hostname,ip,username,password\n"
-        "router1,192.168.1.1,admin,password123\n"
-        "router2,192.168.1.2,admin,password123\n"
-    )
+
+class _StubFormatter:
+    """Formatter double returning fixed output, cheaper to build than a Mock."""
+    
+    __slots__ = ("_out",)
+    
+    def __init__(self, out: str):
+        self._out = out
+    
+    def format(self, *args, **kwargs) -> str:
+        return self._out
+    
+    def write(self, results, fh) -> None:
+        fh.write(self._out.encode("utf-8"))
+
+
+def run_main(devices_file, commands_file, output_file, **options) -> int:
+    """Call the CLI's main() directly and return the exit code it raises.
+    
+    Skips Typer's argv parsing for tests that only care about what main()
+    does with already-parsed options.
+    """
+    kwargs = {
+        "output_format": "csv",
+        "username": None,
+        "password": None,
+        "ssh_key": None,
+        "ssh_config": None,
+        "workers": 10,
+        "use_async": False,
+        "connection_pool": False,
+        "version": False,
+    }
+    kwargs.update(options)
+    with pytest.raises(typer.Exit) as exc_info:
+        cli.main(devices_file, commands_file, output_file, **kwargs)
+    return exc_info.value.exit_code
+
+
+@pytest.fixture(scope="session")
+def temp_devices_file(tmp_path_factory):
+    """Create a temporary devices CSV file, shared by every test.
+    
+    The CLI only reads it, so one copy is written per session.
+    """
+    devices_file = tmp_path_factory.mktemp("cli_inputs") / "devices.csv"
+    devices_file.write_bytes(DEVICES_CSV)
     return devices_file
 
 
-@pytest.fixture
-def temp_commands_file(tmp_path):
-    """Create a temporary commands file."""
-    commands_file = tmp_path / "commands.txt"
-    commands_file.write_text("show version\nshow ip interface brief\n")
+@pytest.fixture(scope="session")
+def temp_commands_file(tmp_path_factory):
+    """Create a temporary commands file, shared by every test.
+    
+    The CLI only reads it, so one copy is written per session.
+    """
+    commands_file = tmp_path_factory.mktemp("cli_inputs") / "commands.txt"
+    commands_file.write_bytes(COMMANDS_TXT)
     return commands_file
 
 
@@ -72,130 +129,177 @@ def mock_results():
     ]
 
 
+@dataclass
+class CLIMocks:
+    """Mocks installed over the names the CLI looks up at run time."""
+
+    load_devices: MagicMock
+    load_commands: MagicMock
+    execute: MagicMock
+    get_formatter: MagicMock
+    supports_async: MagicMock
+    run_async: MagicMock
+
+
+@pytest.fixture
+def cli_mocks(monkeypatch, mock_devices, mock_commands):
+    """Replace the CLI's loaders, executor and formatter lookup with mocks.
+    
+    The loaders return mock_devices and mock_commands unless a test
+    overrides them.
+    """
+    mocks = CLIMocks(
+        load_devices=MagicMock(spec=load_devices_from_csv, return_value=mock_devices),
+        load_commands=MagicMock(spec=load_commands_from_file, return_value=mock_commands),
+        execute=MagicMock(spec=execute_on_devices),
+        get_formatter=MagicMock(spec=get_formatter),
+        supports_async=MagicMock(spec=supports_async, return_value=False),
+        run_async=MagicMock(spec=run_on_devices_async),
+    )
+    monkeypatch.setattr(cli, "load_devices_from_csv", mocks.load_devices)
+    monkeypatch.setattr(cli, "load_commands_from_file", mocks.load_commands)
+    # main() imports these from their source modules on each call
+    monkeypatch.setattr(executor, "execute_on_devices", mocks.execute)
+    monkeypatch.setattr(formatters, "get_formatter", mocks.get_formatter)
+    monkeypatch.setattr(async_executor, "supports_async", mocks.supports_async)
+    monkeypatch.setattr(async_executor, "run_on_devices_async", mocks.run_async)
+    return mocks
+
+
+def _stats(completed: int, successful: int, failed: int) -> ExecutionStats:
+    """Build stats for a two-device run."""
+    stats = ExecutionStats()
+    stats.total_devices = 2
+    stats.completed_devices = completed
+    stats.successful_devices = successful
+    stats.failed_devices = failed
+    stats.start_time = 0.0
+    stats.end_time = 2.8
+    return stats
+
+
+def _fake_executor(results, stats):
+    """Build an executor double that honours execute_on_devices' contract.
+    
+    Each device's results go to the sink (or are retained), the progress
+    callback is called as callback(stats, device, device_results), and the
+    call returns (all_results, stats).
+    """
+    def execute(devices, commands, max_workers=10, progress_callback=None, sink=None, pool=None):
+        by_device = {}
+        for result in results:
+            by_device.setdefault(result.device, []).append(result)
+        
+        retained = []
+        for device, device_results in by_device.items():
+            if sink is not None:
+                for result in device_results:
+                    sink(result)
+            else:
+                retained.extend(device_results)
+            if progress_callback:
+                progress_callback(stats, device, device_results)
+        return retained, stats
+    
+    return execute
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One end-to-end CLI run against mocked loaders and executor."""
+
+    stats: Callable[[], ExecutionStats]
+    expected_exit: int
+    options: dict = field(default_factory=dict)
+    ext: str = ".csv"
+    has_results: bool = True
+    formatter_output: str = "output"
+    expected_execute_kwargs: dict = field(default_factory=dict)
+    expected_format: Optional[str] = None
+    expect_output_file: bool = True
+    expected_message: Optional[str] = None
+
+
+CLI_SCENARIOS = [
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=2, failed=0),
+            expected_exit=0,
+            expected_message="All devices completed successfully",
+        ),
+        id="successful-execution",
+    ),
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=1, failed=1),
+            expected_exit=1,
+            expected_message="1 device(s) failed",
+        ),
+        id="execution-with-failures",
+    ),
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=2, failed=0),
+            expected_exit=0,
+            options={"output_format": "json"},
+            ext=".json",
+            formatter_output='{"results": []}',
+            expected_format="json",
+        ),
+        id="custom-output-format",
+    ),
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=2, failed=0),
+            expected_exit=0,
+            options={"workers": 5},
+            expected_execute_kwargs={"max_workers": 5},
+        ),
+        id="custom-workers",
+    ),
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=2, failed=0),
+            expected_exit=0,
+            options={"output_format": "yaml"},
+            ext=".yaml",
+            expected_format="yaml",
+        ),
+        id="yaml-output",
+    ),
+    pytest.param(
+        Scenario(
+            stats=partial(_stats, completed=2, successful=0, failed=2),
+            expected_exit=1,
+            has_results=False,
+            expect_output_file=False,
+            expected_message="No results to write",
+        ),
+        id="no-results",
+    ),
+]
+
+
 class TestCLI:
     """Test suite for CLI commands."""
 
-    def test_version_flag(self):
-        """Test --version flag."""
-        result = runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert "netmiko-collector version" in result.stdout
-
-    def test_help_flag(self):
-        """Test --help flag."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "Network device automation tool" in result.stdout
-        assert "--devices" in result.stdout
-        assert "--commands" in result.stdout
-
-    def test_missing_required_options(self):
-        """Test that missing required options causes error."""
-        result = runner.invoke(app, [])
-        assert result.exit_code != 0
-
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_successful_execution(
-        self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
-        temp_devices_file,
-        temp_commands_file,
-        tmp_path,
-        mock_devices,
-        mock_commands,
-        mock_results,
-    ):
-        """Test successful command execution."""
-        output_file = tmp_path / "output.csv"
-        
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        
-        stats = ExecutionStats()
-        stats.total_devices = 2
-        stats.completed_devices = 2
-        stats.successful_devices = 2
-        stats.failed_devices = 0
-        stats.start_time = 0.0
-        stats.end_time = 2.8
-        mock_execute.return_value = stats
-        
-        mock_formatter = Mock()
-        mock_formatter.format.return_value = "device,command,output\nrouter1,show version,output1\n"
-        mock_get_formatter.return_value = mock_formatter
-        
-        # Run CLI
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-            ],
-        )
-        
-        # Assertions
-        assert result.exit_code == 0
-        assert mock_load_devices.called
-        assert mock_load_commands.called
-        assert mock_execute.called
-        assert output_file.exists()
-
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_execution_with_failures(
-        self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
-        temp_devices_file,
-        temp_commands_file,
-        tmp_path,
-        mock_devices,
-        mock_commands,
-    ):
-        """Test execution with some failures."""
-        output_file = tmp_path / "output.csv"
-        
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        
-        stats = ExecutionStats(
-            total=2,
-            completed=2,
-            successful=1,
-            failed=1,
-            duration=2.8,
-        )
-        mock_execute.return_value = stats
-        
-        mock_formatter = Mock()
-        mock_formatter.format.return_value = "device,command,output\nrouter1,show version,output1\n"
-        mock_get_formatter.return_value = mock_formatter
-        
-        # Run CLI
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-            ],
-        )
-        
-        # Should exit with code 1 due to failures
-        assert result.exit_code == 1
+    @pytest.mark.parametrize("args,succeeds,expected_text", [
+        pytest.param(["--version"], True, ["netmiko-collector version"], id="version"),
+        pytest.param(
+            ["--help"],
+            True,
+            ["Execute commands on network devices via SSH", "--devices", "--commands"],
+            id="help",
+        ),
+        pytest.param([], False, [], id="missing-required-options"),
+    ])
+    def test_basic_flags(self, args, succeeds, expected_text):
+        """Test --version, --help, and missing required options."""
+        result = runner.invoke(app, args, catch_exceptions=False)
+        
+        assert (result.exit_code == 0) is succeeds
+        for text in expected_text:
+            assert text in result.stdout
 
     def test_nonexistent_devices_file(self, temp_commands_file, tmp_path):
         """Test error handling for nonexistent devices file."""
@@ -205,6 +309,7 @@ class TestCLI:
                 "--devices", str(tmp_path / "nonexistent.csv"),
                 "--commands", str(temp_commands_file),
             ],
+            catch_exceptions=False,
         )
         assert result.exit_code != 0
 
@@ -216,118 +321,18 @@ class TestCLI:
                 "--devices", str(temp_devices_file),
                 "--commands", str(tmp_path / "nonexistent.txt"),
             ],
+            catch_exceptions=False,
         )
         assert result.exit_code != 0
 
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_custom_output_format(
-        self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
-        temp_devices_file,
-        temp_commands_file,
-        tmp_path,
-        mock_devices,
-        mock_commands,
-    ):
-        """Test custom output format."""
-        output_file = tmp_path / "output.json"
-        
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        
-        stats = ExecutionStats()
-        stats.total_devices = 2
-        stats.completed_devices = 2
-        stats.successful_devices = 2
-        stats.failed_devices = 0
-        stats.start_time = 0.0
-        stats.end_time = 2.8
-        mock_execute.return_value = stats
-        
-        mock_formatter = Mock()
-        mock_formatter.format.return_value = '{"results": []}'
-        mock_get_formatter.return_value = mock_formatter
-        
-        # Run CLI with JSON format
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-                "--format", "json",
-            ],
-        )
-        
-        assert result.exit_code == 0
-        assert mock_get_formatter.called_with("json")
-
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_custom_workers(
-        self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
-        temp_devices_file,
-        temp_commands_file,
-        tmp_path,
-        mock_devices,
-        mock_commands,
-    ):
-        """Test custom number of workers."""
-        output_file = tmp_path / "output.csv"
-        
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        
-        stats = ExecutionStats()
-        stats.total_devices = 2
-        stats.completed_devices = 2
-        stats.successful_devices = 2
-        stats.failed_devices = 0
-        stats.start_time = 0.0
-        stats.end_time = 2.8
-        mock_execute.return_value = stats
-        
-        mock_formatter = Mock()
-        mock_formatter.format.return_value = "output"
-        mock_get_formatter.return_value = mock_formatter
-        
-        # Run CLI with custom workers
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-                "--workers", "5",
-            ],
-        )
-        
-        assert result.exit_code == 0
-
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
     def test_load_devices_error(
         self,
-        mock_load_devices,
+        cli_mocks,
         temp_devices_file,
         temp_commands_file,
-        tmp_path,
     ):
         """Test error handling when loading devices fails."""
-        mock_load_devices.side_effect = ValueError("Invalid device file")
+        cli_mocks.load_devices.side_effect = ValueError("Invalid device file")
         
         result = runner.invoke(
             app,
@@ -335,24 +340,19 @@ class TestCLI:
                 "--devices", str(temp_devices_file),
                 "--commands", str(temp_commands_file),
             ],
+            catch_exceptions=False,
         )
         
         assert result.exit_code == 3  # Invalid input error
 
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
     def test_load_commands_error(
         self,
-        mock_load_commands,
-        mock_load_devices,
+        cli_mocks,
         temp_devices_file,
         temp_commands_file,
-        tmp_path,
-        mock_devices,
     ):
         """Test error handling when loading commands fails."""
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.side_effect = ValueError("Invalid commands file")
+        cli_mocks.load_commands.side_effect = ValueError("Invalid commands file")
         
         result = runner.invoke(
             app,
@@ -360,145 +360,219 @@ class TestCLI:
                 "--devices", str(temp_devices_file),
                 "--commands", str(temp_commands_file),
             ],
+            catch_exceptions=False,
         )
         
         assert result.exit_code == 3  # Invalid input error
 
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
     def test_execution_error(
         self,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
+        cli_mocks,
         temp_devices_file,
         temp_commands_file,
         tmp_path,
-        mock_devices,
-        mock_commands,
     ):
         """Test error handling during execution."""
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        mock_execute.side_effect = Exception("Execution failed")
+        cli_mocks.execute.side_effect = Exception("Execution failed")
         
         result = runner.invoke(
             app,
             [
                 "--devices", str(temp_devices_file),
                 "--commands", str(temp_commands_file),
+                "--output", str(tmp_path / "output.csv"),
             ],
+            catch_exceptions=False,
         )
         
         assert result.exit_code == 1  # Generic error
+        assert not (tmp_path / "output.csv").exists()
 
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_progress_callback(
+    @pytest.mark.parametrize("scenario", CLI_SCENARIOS)
+    def test_cli_scenarios(
         self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
+        scenario,
+        cli_mocks,
         temp_devices_file,
         temp_commands_file,
         tmp_path,
-        mock_devices,
-        mock_commands,
         mock_results,
+        capsys,
     ):
-        """Test that progress callback is set up correctly."""
-        output_file = tmp_path / "output.csv"
-        
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
-        
-        def execute_side_effect(devices, commands, max_workers, progress_callback):
-            # Simulate calling progress callback for each result
-            for result in mock_results:
-                progress_callback(result)
-            return ExecutionStats(
-                total=2,
-                completed=2,
-                successful=2,
-                failed=0,
-                duration=2.8,
-            )
+        """Test a full run of main() for each scenario in the matrix."""
+        output_file = tmp_path / f"output{scenario.ext}"
+        cli_mocks.execute.side_effect = _fake_executor(
+            mock_results if scenario.has_results else [], scenario.stats()
+        )
+        cli_mocks.get_formatter.return_value = _StubFormatter(scenario.formatter_output)
         
-        mock_execute.side_effect = execute_side_effect
+        exit_code = run_main(temp_devices_file, temp_commands_file, output_file, **scenario.options)
         
-        mock_formatter = Mock()
-        mock_formatter.format.return_value = "output"
-        mock_get_formatter.return_value = mock_formatter
+        assert exit_code == scenario.expected_exit
+        if scenario.expected_message is not None:
+            assert scenario.expected_message in capsys.readouterr().out
+        assert cli_mocks.load_devices.called
+        assert cli_mocks.load_commands.called
         
-        # Run CLI
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-            ],
+        call_kwargs = cli_mocks.execute.call_args.kwargs
+        assert callable(call_kwargs["progress_callback"])
+        for name, value in scenario.expected_execute_kwargs.items():
+            assert call_kwargs[name] == value
+        
+        if scenario.expected_format is not None:
+            cli_mocks.get_formatter.assert_called_once_with(scenario.expected_format)
+            assert output_file.read_text(encoding="utf-8") == scenario.formatter_output
+        assert output_file.exists() == scenario.expect_output_file
+    
+    def test_csv_results_streamed_through_sink(
+        self,
+        cli_mocks,
+        temp_devices_file,
+        temp_commands_file,
+        tmp_path,
+        mock_results,
+    ):
+        """Test CSV output is written by the sink from the executor's results."""
+        output_file = tmp_path / "output.csv"
+        cli_mocks.execute.side_effect = _fake_executor(
+            mock_results, _stats(completed=2, successful=2, failed=0)
         )
         
-        assert result.exit_code == 0
-        # Verify execute was called with progress_callback parameter
-        call_kwargs = mock_execute.call_args[1]
-        assert "progress_callback" in call_kwargs
-        assert callable(call_kwargs["progress_callback"])
-
-    @patch("src.netmiko_collector.cli.load_devices_from_csv")
-    @patch("src.netmiko_collector.cli.load_commands_from_file")
-    @patch("src.netmiko_collector.cli.execute_on_devices")
-    @patch("src.netmiko_collector.cli.get_formatter")
-    def test_no_results(
+        exit_code = run_main(temp_devices_file, temp_commands_file, output_file)
+        
+        assert exit_code == 0
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert "Cisco IOS Version 15.1" in lines[1]
+        assert callable(cli_mocks.execute.call_args.kwargs["sink"])
+    
+    def test_csv_sink_without_results(
         self,
-        mock_get_formatter,
-        mock_execute,
-        mock_load_commands,
-        mock_load_devices,
+        cli_mocks,
         temp_devices_file,
         temp_commands_file,
         tmp_path,
-        mock_devices,
-        mock_commands,
+        capsys,
     ):
-        """Test handling of no results."""
+        """Test an empty sink leaves no output file and reports no results."""
         output_file = tmp_path / "output.csv"
+        cli_mocks.execute.side_effect = _fake_executor(
+            [], _stats(completed=2, successful=0, failed=2)
+        )
         
-        # Setup mocks
-        mock_load_devices.return_value = mock_devices
-        mock_load_commands.return_value = mock_commands
+        exit_code = run_main(temp_devices_file, temp_commands_file, output_file)
+        
+        assert exit_code == 1
+        assert "No results to write" in capsys.readouterr().out
+        assert not output_file.exists()
+    
+    def test_async_executor_used_when_supported(
+        self,
+        cli_mocks,
+        temp_devices_file,
+        temp_commands_file,
+        tmp_path,
+        mock_results,
+    ):
+        """Test --async runs the async executor under the same contract."""
+        output_file = tmp_path / "output.json"
+        cli_mocks.supports_async.return_value = True
+        cli_mocks.run_async.side_effect = _fake_executor(
+            mock_results, _stats(completed=2, successful=2, failed=0)
+        )
+        cli_mocks.get_formatter.return_value = _StubFormatter('{"results": []}')
+        
+        exit_code = run_main(temp_devices_file, temp_commands_file, output_file,
+                             output_format="json", use_async=True)
+        
+        assert exit_code == 0
+        cli_mocks.execute.assert_not_called()
+        assert cli_mocks.run_async.call_args.kwargs["max_workers"] == 10
+        assert output_file.read_text(encoding="utf-8") == '{"results": []}'
+    
+    @pytest.mark.parametrize("use_async,supported", [
+        pytest.param(False, True, id="not-requested"),
+        pytest.param(True, False, id="unsupported"),
+    ])
+    def test_threaded_executor_used_without_async(
+        self,
+        cli_mocks,
+        temp_devices_file,
+        temp_commands_file,
+        tmp_path,
+        mock_results,
+        use_async,
+        supported,
+    ):
+        """Test the Netmiko executor runs unless --async is given and usable."""
+        cli_mocks.supports_async.return_value = supported
+        cli_mocks.execute.side_effect = _fake_executor(
+            mock_results, _stats(completed=2, successful=2, failed=0)
+        )
         
-        # No results scenario
-        def execute_side_effect(devices, commands, max_workers, progress_callback):
-            # Don't call progress_callback
-            return ExecutionStats(
-                total=2,
-                completed=0,
-                successful=0,
-                failed=2,
-                duration=0.1,
-            )
+        exit_code = run_main(temp_devices_file, temp_commands_file, tmp_path / "output.csv",
+                             use_async=use_async)
+        
+        assert exit_code == 0
+        cli_mocks.execute.assert_called_once()
+        cli_mocks.run_async.assert_not_called()
+    
+    @pytest.mark.parametrize("connection_pool", [
+        pytest.param(False, id="disabled"),
+        pytest.param(True, id="enabled"),
+    ])
+    def test_connection_pool_passed_to_executor(
+        self,
+        cli_mocks,
+        temp_devices_file,
+        temp_commands_file,
+        tmp_path,
+        mock_results,
+        monkeypatch,
+        connection_pool,
+    ):
+        """Test --connection-pool hands a pool to the executor and closes it after."""
+        pool_class = MagicMock(spec=ConnectionPool)
+        monkeypatch.setattr(cli, "ConnectionPool", pool_class)
+        cli_mocks.execute.side_effect = _fake_executor(
+            mock_results, _stats(completed=2, successful=2, failed=0)
+        )
         
-        mock_execute.side_effect = execute_side_effect
+        exit_code = run_main(temp_devices_file, temp_commands_file, tmp_path / "output.csv",
+                             connection_pool=connection_pool)
+        
+        assert exit_code == 0
+        pool = cli_mocks.execute.call_args.kwargs["pool"]
+        if connection_pool:
+            assert pool is pool_class.return_value
+            pool.close.assert_called_once()
+        else:
+            assert pool is None
+            pool_class.assert_not_called()
+    
+    def test_progress_advances_once_per_device(
+        self,
+        cli_mocks,
+        temp_devices_file,
+        temp_commands_file,
+        tmp_path,
+        mock_results,
+        monkeypatch,
+    ):
+        """Test each completed device advances the batched progress bar once."""
+        advances = []
         
-        mock_formatter = Mock()
-        mock_get_formatter.return_value = mock_formatter
+        class RecordingProgress(BatchedProgress):
+            def advance(self, count: int = 1) -> None:
+                advances.append(count)
+                super().advance(count)
         
-        # Run CLI
-        result = runner.invoke(
-            app,
-            [
-                "--devices", str(temp_devices_file),
-                "--commands", str(temp_commands_file),
-                "--output", str(output_file),
-            ],
+        monkeypatch.setattr(cli, "BatchedProgress", RecordingProgress)
+        cli_mocks.execute.side_effect = _fake_executor(
+            mock_results, _stats(completed=2, successful=2, failed=0)
         )
         
-        # Should handle empty results gracefully
-        assert "No results to write" in result.stdout or result.exit_code == 1
+        exit_code = run_main(temp_devices_file, temp_commands_file, tmp_path / "output.csv")
+        
+        assert exit_code == 0
+        assert advances == [1, 1]
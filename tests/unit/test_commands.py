@@ -1,13 +1,18 @@
 """Unit tests for commands module."""
 
+import shutil
+import subprocess
 from pathlib import Path
 
 import pytest
 
 from src.netmiko_collector.commands import (
+    BULK_LOAD_THRESHOLD,
     commands_to_strings,
     filter_commands,
+    join_for_batch,
     load_commands_from_file,
+    split_batch_output,
 )
 from src.netmiko_collector.models import Command
 
@@ -15,73 +20,28 @@ from src.netmiko_collector.models import Command
 class TestLoadCommandsFromFile:
     """Tests for load_commands_from_file function."""
     
-    def test_load_commands_simple(self, tmp_path):
-        """Test loading simple commands file."""
-        commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
-            "show version\n"
-            "show interfaces\n"
-            "show ip route\n"
-        )
-        
-        commands = load_commands_from_file(commands_file)
-        
-        assert len(commands) == 3
-        assert commands[0].command_string == "show version"
-        assert commands[1].command_string == "show interfaces"
-        assert commands[2].command_string == "show ip route"
-    
-    def test_load_commands_with_comments(self, tmp_path):
-        """Test that comments are ignored."""
-        commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
-            "# This is a comment\n"
-            "show version\n"
-            "# Another comment\n"
-            "show interfaces\n"
-        )
-        
-        commands = load_commands_from_file(commands_file)
-        
-        assert len(commands) == 2
-        assert commands[0].command_string == "show version"
-        assert commands[1].command_string == "show interfaces"
-    
-    def test_load_commands_with_blank_lines(self, tmp_path):
-        """Test that blank lines are ignored."""
-        commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
-            "show version\n"
-            "\n"
-            "\n"
-            "show interfaces\n"
-            "\n"
-        )
-        
-        commands = load_commands_from_file(commands_file)
-        
-        assert len(commands) == 2
-        assert commands[0].command_string == "show version"
-        assert commands[1].command_string == "show interfaces"
-    
-    def test_load_commands_with_whitespace(self, tmp_path):
-        """Test that leading/trailing whitespace is trimmed."""
-        commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
-            "  show version  \n"
-            "\t show interfaces \t\n"
-        )
-        
-        commands = load_commands_from_file(commands_file)
-        
-        assert len(commands) == 2
-        assert commands[0].command_string == "show version"
-        assert commands[1].command_string == "show interfaces"
-    
-    def test_load_commands_mixed_content(self, tmp_path):
-        """Test file with mix of commands, comments, and blank lines."""
-        commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
+    @pytest.mark.parametrize("content,expected", [
+        pytest.param(
+            "show version\nshow interfaces\nshow ip route\n",
+            ["show version", "show interfaces", "show ip route"],
+            id="simple",
+        ),
+        pytest.param(
+            "# This is a comment\nshow version\n# Another comment\nshow interfaces\n",
+            ["show version", "show interfaces"],
+            id="comments",
+        ),
+        pytest.param(
+            "show version\n\n\nshow interfaces\n\n",
+            ["show version", "show interfaces"],
+            id="blank-lines",
+        ),
+        pytest.param(
+            "  show version  \n\t show interfaces \t\n",
+            ["show version", "show interfaces"],
+            id="whitespace",
+        ),
+        pytest.param(
             "# Configuration commands\n"
             "\n"
             "show version\n"
@@ -90,15 +50,25 @@ class TestLoadCommandsFromFile:
             "\n"
             "# Network commands\n"
             "show ip route\n"
-            "\n"
-        )
+            "\n",
+            ["show version", "show interfaces", "show ip route"],
+            id="mixed",
+        ),
+        pytest.param("show version\n", ["show version"], id="single"),
+        pytest.param(
+            "show running-config | include interface GigabitEthernet\n",
+            ["show running-config | include interface GigabitEthernet"],
+            id="long",
+        ),
+    ])
+    def test_load_commands(self, tmp_path, content, expected):
+        """Test comments and blank lines are skipped and commands trimmed."""
+        commands_file = tmp_path / "commands.txt"
+        commands_file.write_text(content)
         
         commands = load_commands_from_file(commands_file)
         
-        assert len(commands) == 3
-        assert commands[0].command_string == "show version"
-        assert commands[1].command_string == "show interfaces"
-        assert commands[2].command_string == "show ip route"
+        assert [c.command_string for c in commands] == expected
     
     def test_load_commands_file_not_found(self, tmp_path):
         """Test error when commands file doesn't exist."""
@@ -107,46 +77,64 @@ class TestLoadCommandsFromFile:
         with pytest.raises(FileNotFoundError, match="Commands file not found"):
             load_commands_from_file(commands_file)
     
-    def test_load_commands_empty_file(self, tmp_path):
+    @pytest.mark.parametrize("content", [
+        pytest.param("", id="empty"),
+        pytest.param("# Comment 1\n# Comment 2\n\n", id="only-comments"),
+    ])
+    def test_load_commands_no_valid_commands(self, tmp_path, content):
         """Test error when file has no valid commands."""
         commands_file = tmp_path / "commands.txt"
-        commands_file.write_text("")
+        commands_file.write_text(content)
         
         with pytest.raises(ValueError, match="No valid commands found"):
             load_commands_from_file(commands_file)
     
-    def test_load_commands_only_comments(self, tmp_path):
-        """Test error when file has only comments."""
+    def test_load_commands_comments_not_decoded(self, tmp_path):
+        """Test that comment lines are skipped before UTF-8 decoding."""
         commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(
-            "# Comment 1\n"
-            "# Comment 2\n"
-            "\n"
+        commands_file.write_bytes(
+            b"# latin-1 comment: caf\xe9\n"
+            b"show ip route vrf caf\xc3\xa9\n"
         )
         
-        with pytest.raises(ValueError, match="No valid commands found"):
-            load_commands_from_file(commands_file)
+        commands = load_commands_from_file(commands_file)
+        
+        assert len(commands) == 1
+        assert commands[0].command_string == "show ip route vrf café"
     
-    def test_load_commands_single_command(self, tmp_path):
-        """Test loading file with single command."""
+    @pytest.mark.parametrize("repeat", [
+        pytest.param(1, id="small"),
+        pytest.param(BULK_LOAD_THRESHOLD, id="bulk"),
+    ])
+    def test_load_commands_unicode_whitespace(self, tmp_path, repeat):
+        """Test no-break spaces are trimmed like other whitespace at any file size."""
         commands_file = tmp_path / "commands.txt"
-        commands_file.write_text("show version\n")
+        commands_file.write_bytes(
+            b"\xc2\xa0\n" * repeat
+            + b"show version\xc2\xa0\n"
+            + b"\xc2\xa0# comment\n"
+        )
         
         commands = load_commands_from_file(commands_file)
         
-        assert len(commands) == 1
-        assert commands[0].command_string == "show version"
+        assert [c.command_string for c in commands] == ["show version"]
     
-    def test_load_commands_long_command(self, tmp_path):
-        """Test loading file with long command."""
-        long_cmd = "show running-config | include interface GigabitEthernet"
+    def test_load_commands_large_file(self, tmp_path):
+        """Test large files parse the same as small ones."""
+        block = (
+            "# Interface checks\r\n"
+            "  show interfaces status  \r\n"
+            "\r\n"
+            "show ip route vrf café\r\n"
+        )
         commands_file = tmp_path / "commands.txt"
-        commands_file.write_text(f"{long_cmd}\n")
+        commands_file.write_bytes((block * 5000).encode("utf-8"))
         
         commands = load_commands_from_file(commands_file)
         
-        assert len(commands) == 1
-        assert commands[0].command_string == long_cmd
+        assert len(commands) == 10000
+        assert commands[0].command_string == "show interfaces status"
+        assert commands[1].command_string == "show ip route vrf café"
 
 
 class TestCommandsToStrings:
@@ -169,103 +157,206 @@ class TestCommandsToStrings:
         """Test converting empty list."""
         strings = commands_to_strings([])
         assert len(strings) == 0
+    
+    def test_commands_to_strings_large(self):
+        """Test converting a large list keeps every command in order."""
+        commands = [Command(command=f"show interface Gi0/{i}") for i in range(10_000)]
+        
+        strings = commands_to_strings(commands)
+        
+        assert len(strings) == 10_000
+        assert strings == [c.command_string for c in commands]
+
+
+@pytest.fixture(scope="session")
+def sample_commands():
+    """Commands shared by the filter tests; Command is frozen, so sharing is safe."""
+    return (
+        Command(command="show version"),
+        Command(command="show interfaces"),
+        Command(command="show ip route"),
+        Command(command="show interfaces status"),
+    )
 
 
 class TestFilterCommands:
     """Tests for filter_commands function."""
     
-    def test_filter_commands_no_filters(self):
+    def test_filter_commands_no_filters(self, sample_commands):
         """Test that no filters returns all commands."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-            Command(command="show ip route"),
-        ]
+        commands = sample_commands[:3]
         
-        filtered = filter_commands(commands)
+        filtered = list(filter_commands(commands))
         
         assert len(filtered) == 3
     
-    def test_filter_commands_include_pattern(self):
+    def test_filter_commands_include_pattern(self, sample_commands):
         """Test include pattern filtering."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-            Command(command="show ip route"),
-        ]
+        commands = sample_commands[:3]
         
-        filtered = filter_commands(commands, include_patterns=["interface"])
+        filtered = list(filter_commands(commands, include_patterns=["interface"]))
         
         assert len(filtered) == 1
         assert filtered[0].command_string == "show interfaces"
     
-    def test_filter_commands_multiple_include_patterns(self):
+    def test_filter_commands_multiple_include_patterns(self, sample_commands):
         """Test multiple include patterns (OR logic)."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-            Command(command="show ip route"),
-        ]
+        commands = sample_commands[:3]
         
-        filtered = filter_commands(
+        filtered = list(filter_commands(
             commands,
             include_patterns=["interface", "route"]
-        )
+        ))
         
         assert len(filtered) == 2
         assert filtered[0].command_string == "show interfaces"
         assert filtered[1].command_string == "show ip route"
     
-    def test_filter_commands_exclude_pattern(self):
+    def test_filter_commands_exclude_pattern(self, sample_commands):
         """Test exclude pattern filtering."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-            Command(command="show ip route"),
-        ]
+        commands = sample_commands[:3]
         
-        filtered = filter_commands(commands, exclude_patterns=["interface"])
+        filtered = list(filter_commands(commands, exclude_patterns=["interface"]))
         
         assert len(filtered) == 2
         assert filtered[0].command_string == "show version"
         assert filtered[1].command_string == "show ip route"
     
-    def test_filter_commands_include_and_exclude(self):
+    def test_filter_commands_include_and_exclude(self, sample_commands):
         """Test both include and exclude patterns."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-            Command(command="show interfaces status"),
-            Command(command="show ip route"),
-        ]
+        commands = sample_commands
         
-        filtered = filter_commands(
+        filtered = list(filter_commands(
             commands,
             include_patterns=["show"],
             exclude_patterns=["status"]
-        )
+        ))
         
         assert len(filtered) == 3
         assert "show interfaces status" not in [c.command_string for c in filtered]
     
-    def test_filter_commands_no_matches(self):
+    def test_filter_commands_no_matches(self, sample_commands):
         """Test filtering that matches nothing."""
-        commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
-        ]
+        commands = sample_commands[:2]
         
-        filtered = filter_commands(commands, include_patterns=["configure"])
+        filtered = list(filter_commands(commands, include_patterns=["configure"]))
         
         assert len(filtered) == 0
     
-    def test_filter_commands_exclude_all(self):
+    def test_filter_commands_exclude_all(self, sample_commands):
         """Test exclude pattern that removes everything."""
+        commands = sample_commands[:2]
+        
+        filtered = list(filter_commands(commands, exclude_patterns=["show"]))
+        
+        assert len(filtered) == 0
+    
+    def test_filter_commands_patterns_are_literal(self):
+        """Test regex metacharacters in patterns match literally."""
         commands = [
-            Command(command="show version"),
-            Command(command="show interfaces"),
+            Command(command="show run | include hostname"),
+            Command(command="show running-config"),
+            Command(command="show ip route 10.0.0.0"),
         ]
         
-        filtered = filter_commands(commands, exclude_patterns=["show"])
+        filtered = list(filter_commands(commands, include_patterns=["| include", "10.0.0.0"]))
         
-        assert len(filtered) == 0
+        assert [c.command_string for c in filtered] == [
+            "show run | include hostname",
+            "show ip route 10.0.0.0",
+        ]
+    
+    def test_filter_commands_many_patterns(self):
+        """Test filtering against a large pattern set."""
+        commands = [Command(command=f"show interface Gi0/{i}") for i in range(50)]
+        patterns = [f"Gi0/{i}" for i in range(40, 50)] + [f"Te1/{i}" for i in range(500)]
+        
+        filtered = list(filter_commands(commands, exclude_patterns=patterns))
+        
+        # Gi0/40-49 are excluded; the Te1 patterns match nothing
+        assert len(filtered) == 40
+    
+    def test_filter_commands_large_scale(self):
+        """Test a large command list filters the same as a per-pattern scan."""
+        commands = [
+            Command(command=f"show {kind} {i}")
+            for i in range(2_500)
+            for kind in ("interface", "ip route", "version", "interfaces status")
+        ]
+        include = ["interface", "route", "configure"]
+        exclude = ["status", "99"]
+        
+        filtered = list(filter_commands(commands, include_patterns=include,
+                                        exclude_patterns=exclude))
+        
+        expected = [
+            c for c in commands
+            if any(p in c.command for p in include) and not any(p in c.command for p in exclude)
+        ]
+        assert filtered == expected
+    
+    def test_filter_commands_is_lazy(self):
+        """Test commands are filtered lazily from any iterable."""
+        def generate():
+            yield Command(command="show version")
+            yield Command(command="show interfaces")
+            raise AssertionError("filter consumed more than needed")
+        
+        filtered = filter_commands(generate(), include_patterns=["show"])
+        
+        assert next(filtered).command_string == "show version"
+
+
+class TestBatchCommands:
+    """Tests for join_for_batch and split_batch_output."""
+    
+    def test_join_for_batch(self):
+        """Test commands are joined into one marked shell line."""
+        commands = [Command(command="uname -a"), Command(command="df -h")]
+        
+        batch = join_for_batch(commands, marker="END")
+        
+        assert batch == (
+            "{\n"
+            "uname -a\nprintf 'END:%s\\n' 0\n"
+            "df -h\nprintf 'END:%s\\n' 1\n"
+            "}"
+        )
+    
+    @pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+    @pytest.mark.parametrize("first,expected", [
+        pytest.param("echo one", "one", id="plain"),
+        pytest.param("echo one;", "one", id="trailing-semicolon"),
+        pytest.param("true &", "", id="trailing-ampersand"),
+        pytest.param("echo one # comment", "one", id="comment"),
+    ])
+    def test_join_for_batch_runs_in_shell(self, first, expected):
+        """Test shell syntax in one command does not break the markers of the rest."""
+        commands = [Command(command=first), Command(command="echo two")]
+        
+        completed = subprocess.run(
+            ["sh"], input=join_for_batch(commands, marker="END"),
+            capture_output=True, text=True, check=True,
+        )
+        
+        assert split_batch_output(completed.stdout, marker="END") == [expected, "two"]
+    
+    def test_split_batch_output(self):
+        """Test combined output is split back per command."""
+        output = "Linux router\nEND:0\nfs1\nfs2\nEND:1\n"
+        
+        assert split_batch_output(output, marker="END") == ["Linux router", "fs1\nfs2"]
+    
+    def test_split_batch_output_ignores_echoed_command(self):
+        """Test the echoed printf format string is not taken as a marker."""
+        output = "printf 'END:%s\\n' 0\nLinux router\nEND:0\n"
+        
+        assert split_batch_output(output, marker="END") == [
+            "printf 'END:%s\\n' 0\nLinux router"
+        ]
+    
+    def test_split_batch_output_incomplete(self):
+        """Test a truncated batch returns only the finished outputs."""
+        output = "Linux router\nEND:0\npartial df output"
+        
+        assert split_batch_output(output, marker="END") == ["Linux router"]
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from src.netmiko_collector.devices import (
+    iter_devices_from_csv,
     load_devices_from_csv,
     validate_devices,
 )
@@ -152,6 +153,23 @@ class TestLoadDevicesFromCsv:
         assert devices[0].username == "admin"
         assert devices[0].password == "secret"
     
+    def test_load_devices_short_rows(self, tmp_path):
+        """Test that missing trailing fields and blank lines are tolerated."""
+        csv_file = tmp_path / "devices.csv"
+        csv_file.write_text(
+            "hostname,port,username\n"
+            "router1\n"
+            "\n"
+            "router2,2222\n"
+        )
+        
+        devices = load_devices_from_csv(csv_file, default_username="admin")
+        
+        assert [d.hostname for d in devices] == ["router1", "router2"]
+        assert devices[0].port == 22
+        assert devices[1].port == 2222
+        assert devices[1].username == "admin"
+    
     def test_load_devices_file_not_found(self, tmp_path):
         """Test error when CSV file doesn't exist."""
         csv_file = tmp_path / "nonexistent.csv"
@@ -267,6 +285,33 @@ class TestLoadDevicesFromCsv:
             load_devices_from_csv(csv_file)
 
 
+class TestIterDevicesFromCsv:
+    """Tests for iter_devices_from_csv function."""
+    
+    def test_iter_devices_yields_lazily(self, tmp_path):
+        """Test devices are parsed one row at a time."""
+        csv_file = tmp_path / "devices.csv"
+        csv_file.write_text(
+            "hostname;port\n"
+            "router1;22\n"
+            "invalid_host!;22\n"
+        )
+        
+        devices = iter_devices_from_csv(csv_file)
+        
+        # The bad row is only reached on the second device
+        assert next(devices).hostname == "router1"
+        with pytest.raises(ValueError, match="Error on line 3"):
+            next(devices)
+    
+    def test_iter_devices_no_data_rows(self, tmp_path):
+        """Test a header-only file yields nothing."""
+        csv_file = tmp_path / "devices.csv"
+        csv_file.write_text("hostname\n")
+        
+        assert list(iter_devices_from_csv(csv_file)) == []
+
+
 class TestValidateDevices:
     """Tests for validate_devices function."""
     
@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 import time
 
 from src.netmiko_collector.executor import (
+    SUBMIT_AHEAD,
     ExecutionStats,
     execute_on_devices,
     execute_on_device_batches,
@@ -66,6 +67,7 @@ class TestExecutionStats:
         assert stats.failed_commands == 0
         assert stats.start_time is None
         assert stats.end_time is None
+        assert not hasattr(stats, "__dict__")
     
     def test_start(self):
         """Test starting execution tracking."""
@@ -303,6 +305,36 @@ class TestExecuteOnDevices:
         # Verify callback was called for each device
         assert len(callback_calls) == len(test_devices)
     
+    @patch("src.netmiko_collector.executor.execute_commands_on_device")
+    def test_execute_on_device_batches_stats_counted_once(self, mock_execute, test_devices, test_commands):
+        """Test every batch records into one shared stats object exactly once."""
+        def mock_exec(device, commands, ssh_config):
+            return [
+                ExecutionResult(
+                    device=device,
+                    command=cmd,
+                    output="",
+                    status=ExecutionStatus.SUCCESS,
+                )
+                for cmd in commands
+            ]
+        
+        mock_execute.side_effect = mock_exec
+        seen_stats = set()
+        
+        results, stats = execute_on_device_batches(
+            test_devices,
+            test_commands,
+            batch_size=2,
+            max_workers=2,
+            progress_callback=lambda s, device, results: seen_stats.add(id(s)),
+        )
+        
+        assert seen_stats == {id(stats)}
+        assert stats.completed_devices == len(test_devices)
+        assert stats.successful_commands == len(test_devices) * len(test_commands)
+        assert stats.end_time is not None
+    
     @patch("src.netmiko_collector.executor.execute_commands_on_device")
     def test_execute_on_devices_executor_exception(self, mock_execute, test_devices, test_commands):
         """Test handling of executor exceptions."""
@@ -334,6 +366,37 @@ class TestExecuteOnDevices:
         # Verify failed device results
         failed_results = [r for r in results if "Executor error" in r.error]
         assert len(failed_results) == len(test_commands)
+    
+    @patch("src.netmiko_collector.executor.execute_commands_on_device")
+    def test_execute_on_devices_bounded_submission(self, mock_execute, test_commands):
+        """Test only a bounded window of devices is submitted at a time."""
+        devices = [Device(hostname=f"10.0.0.{i}") for i in range(1, 41)]
+        mock_execute.side_effect = lambda device, commands, ssh_config: []
+        
+        submitted = []
+        completed = []
+        window = []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        class CountingExecutor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submitted.append(args[1])
+                window.append(len(submitted) - len(completed))
+                return super().submit(*args, **kwargs)
+        
+        with patch("src.netmiko_collector.executor.ThreadPoolExecutor", CountingExecutor):
+            _, stats = execute_on_devices(
+                devices,
+                test_commands,
+                max_workers=3,
+                progress_callback=lambda s, device, results: completed.append(device),
+            )
+        
+        assert sorted(submitted, key=devices.index) == devices
+        assert stats.completed_devices == len(devices)
+        # The replacement is submitted before the finished device is reported
+        assert max(window) <= 3 * SUBMIT_AHEAD + 1
 
 
 class TestExecuteOnDeviceBatches:
@@ -398,6 +461,31 @@ class TestExecuteOnDeviceBatches:
         assert stats.completed_devices == len(test_devices)
         assert all(r.status == ExecutionStatus.SUCCESS for r in results)
     
+    @patch("src.netmiko_collector.executor.execute_commands_on_device")
+    def test_execute_on_device_batches_reuses_thread_pool(self, mock_execute, test_devices, test_commands):
+        """Test all batches are dispatched on a single thread pool."""
+        mock_execute.side_effect = lambda device, commands, ssh_config: []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        pools = []
+        
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+        
+        with patch("src.netmiko_collector.executor.ThreadPoolExecutor", RecordingExecutor):
+            _, stats = execute_on_device_batches(
+                test_devices,
+                test_commands,
+                batch_size=2,
+                max_workers=2,
+            )
+        
+        assert len(pools) == 1
+        assert stats.completed_devices == len(test_devices)
+    
     @patch("src.netmiko_collector.executor.execute_commands_on_device")
     def test_execute_on_device_batches_with_callback(self, mock_execute, test_devices, test_commands):
         """Test batch execution with progress callback."""
@@ -1,5 +1,7 @@
 """Tests for output formatters."""
 
+import csv
+import io
 import json
 from datetime import datetime
 from pathlib import Path
@@ -13,7 +15,9 @@ from src.netmiko_collector.formatters import (
     YAMLFormatter,
     HTMLFormatter,
     XLSXFormatter,
+    get_formatter,
 )
+from src.netmiko_collector.formatters.base import project_results
 
 
 @pytest.fixture
@@ -27,7 +31,7 @@ def sample_results():
             output="Cisco IOS Software, Version 15.2",
             error="",
             duration=1.5,
-            timestamp=datetime(2025, 1, 1, 12, 0, 0)
+            executed_at=datetime(2025, 1, 1, 12, 0, 0)
         ),
         ExecutionResult(
             device=Device(hostname="router2", device_type=DeviceType.CISCO_IOS, username="admin"),
@@ -36,7 +40,7 @@ def sample_results():
             output="",
             error="Authentication failed",
             duration=0.5,
-            timestamp=datetime(2025, 1, 1, 12, 0, 1)
+            executed_at=datetime(2025, 1, 1, 12, 0, 1)
         ),
         ExecutionResult(
             device=Device(hostname="router3", device_type=DeviceType.CISCO_IOS, username="admin"),
@@ -45,7 +49,7 @@ def sample_results():
             output="Gateway of last resort is 10.0.0.1",
             error="",
             duration=0.0,
-            timestamp=datetime.now()
+            executed_at=datetime.now()
         ),
     ]
 
@@ -93,6 +97,17 @@ class TestCSVFormatter:
         # Last result has 0.0 duration
         assert "0" in lines[3]  # 0 ms
     
+    def test_format_quotes_special_characters(self, sample_results):
+        """Test fields with delimiters, quotes or newlines round-trip."""
+        sample_results[0].output = 'Interface, "Gi0/1"\nup'
+        formatter = CSVFormatter()
+        output = formatter.format(sample_results)
+        
+        rows = list(csv.reader(io.StringIO(output)))
+        assert len(rows) == 4
+        assert rows[1][3] == 'Interface, "Gi0/1"\nup'
+        assert rows[2][4] == "Authentication failed"
+    
     def test_write_to_file(self, sample_results, tmp_path):
         """Test writing CSV to file."""
         formatter = CSVFormatter()
@@ -104,6 +119,17 @@ class TestCSVFormatter:
         content = filepath.read_text()
         assert "hostname,command,status" in content
         assert "router1" in content
+    
+    def test_write_streams_same_bytes(self, sample_results):
+        """Test streaming to a binary file object matches format()."""
+        sample_results[0].output = 'Schnittstelle "Gi0/1", überlastet'
+        formatter = CSVFormatter()
+        buffer = io.BytesIO()
+        
+        formatter.write(sample_results, buffer)
+        
+        assert not buffer.closed
+        assert buffer.getvalue() == formatter.format(sample_results).encode("utf-8")
 
 
 class TestJSONFormatter:
@@ -156,6 +182,42 @@ class TestJSONFormatter:
         
         data = json.loads(output)
         assert data[0]["timestamp"] == "2025-01-01T12:00:00"
+    
+    def test_format_matches_stdlib_json(self, sample_results):
+        """Test output is identical with or without orjson."""
+        formatter = JSONFormatter()
+        output = formatter.format(sample_results)
+        
+        expected = json.dumps(json.loads(output), indent=2, ensure_ascii=False)
+        assert output == expected
+    
+    def test_format_stdlib_fallback(self, sample_results, monkeypatch):
+        """Test the stdlib path produces the same output when orjson is missing."""
+        formatter = JSONFormatter()
+        output = formatter.format(sample_results)
+        
+        monkeypatch.setattr("src.netmiko_collector.formatters.json_formatter.orjson", None)
+        
+        assert formatter.format(sample_results) == output
+    
+    def test_format_compact_stdlib_fallback(self, sample_results, monkeypatch):
+        """Test indent=None output does not depend on whether orjson is installed."""
+        formatter = JSONFormatter(indent=None)
+        output = formatter.format(sample_results)
+        
+        monkeypatch.setattr("src.netmiko_collector.formatters.json_formatter.orjson", None)
+        
+        assert formatter.format(sample_results) == output
+        assert output == json.dumps(json.loads(output), ensure_ascii=False)
+    
+    def test_write_to_file(self, sample_results, tmp_path):
+        """Test writing JSON directly to a file."""
+        formatter = JSONFormatter()
+        filepath = tmp_path / "output.json"
+        
+        formatter.write_to_file(sample_results, filepath)
+        
+        assert filepath.read_text(encoding="utf-8") == formatter.format(sample_results)
 
 
 class TestYAMLFormatter:
@@ -175,6 +237,28 @@ class TestYAMLFormatter:
         assert data[0]["command"] == "show version"
         assert data[0]["status"] == "success"
     
+    def test_format_keeps_field_order(self, sample_results):
+        """Test fields are emitted in column order rather than sorted."""
+        pytest.importorskip("yaml")
+        import yaml
+        
+        output = YAMLFormatter().format(sample_results)
+        
+        assert list(yaml.safe_load(output)[0]) == [
+            "hostname", "command", "status", "output", "error", "duration_ms", "timestamp"
+        ]
+
+    def test_write_streams_same_bytes(self, sample_results):
+        """Test streaming to a binary file object matches format()."""
+        pytest.importorskip("yaml")
+        sample_results[0].output = "Schnittstelle Gi0/1 überlastet"
+        formatter = YAMLFormatter()
+        buffer = io.BytesIO()
+
+        formatter.write(sample_results, buffer)
+
+        assert buffer.getvalue() == formatter.format(sample_results).encode("utf-8")
+
     def test_format_missing_yaml(self, sample_results, monkeypatch):
         """Test error when PyYAML is not installed."""
         # Mock yaml import to fail
@@ -230,7 +314,7 @@ class TestHTMLFormatter:
                 output='<html>&test',
                 error="",
                 duration=1.0,
-                timestamp=datetime.now()
+                executed_at=datetime.now()
             )
         )
         
@@ -257,6 +341,20 @@ class TestHTMLFormatter:
         assert "1500" in output  # 1.5s = 1500ms
         assert "500" in output   # 0.5s = 500ms
         assert "0" in output     # 0.0 duration
+    
+    def test_write_to_file(self, sample_results, tmp_path):
+        """Test streamed file output matches format()."""
+        formatter = HTMLFormatter()
+        filepath = tmp_path / "output.html"
+        
+        formatter.write_to_file(sample_results, filepath)
+        
+        def without_timestamp(text):
+            return [line for line in text.splitlines() if "Generated:" not in line]
+        
+        content = filepath.read_text(encoding="utf-8")
+        assert content.endswith("</html>")
+        assert without_timestamp(content) == without_timestamp(formatter.format(sample_results))
 
 
 class TestXLSXFormatter:
@@ -324,3 +422,110 @@ class TestXLSXFormatter:
         # Check error in second result
         assert ws['E3'].value == "Authentication failed"
         assert ws['C3'].value == "failed"
+    
+    def test_write_to_file_header_style_and_widths(self, sample_results, tmp_path):
+        """Test the streamed sheet keeps its title, header style and widths."""
+        pytest.importorskip("openpyxl")
+        import openpyxl
+        
+        filepath = tmp_path / "output.xlsx"
+        XLSXFormatter().write_to_file(sample_results, filepath)
+        
+        ws = openpyxl.load_workbook(filepath).active
+        assert ws.title == "Command Results"
+        assert ws['A1'].font.bold
+        assert ws['A1'].fill.fgColor.rgb.endswith("4CAF50")
+        assert ws.column_dimensions['D'].width == XLSXFormatter.COLUMN_WIDTHS["D"]
+        assert ws.max_row == len(sample_results) + 1
+    
+    def test_write_to_file_xlsxwriter_engine(self, sample_results, tmp_path):
+        """Test the xlsxwriter engine writes the same cells as openpyxl."""
+        pytest.importorskip("xlsxwriter")
+        pytest.importorskip("openpyxl")
+        import openpyxl
+        
+        filepath = tmp_path / "output.xlsx"
+        XLSXFormatter(engine="xlsxwriter").write_to_file(sample_results, filepath)
+        
+        ws = openpyxl.load_workbook(filepath).active
+        assert ws.title == "Command Results"
+        assert ws['A1'].value == "Hostname"
+        assert ws['A1'].font.bold
+        assert ws['A2'].value == "router1"
+        assert ws['F2'].value == 1500
+        assert ws['E3'].value == "Authentication failed"
+    
+    def test_xlsxwriter_engine_fits_column_widths(self, sample_results, tmp_path):
+        """Test xlsxwriter column widths follow the longest value, capped."""
+        pytest.importorskip("xlsxwriter")
+        pytest.importorskip("openpyxl")
+        import openpyxl
+        
+        sample_results[0].output = "x" * 200
+        filepath = tmp_path / "output.xlsx"
+        XLSXFormatter(engine="xlsxwriter").write_to_file(sample_results, filepath)
+        
+        ws = openpyxl.load_workbook(filepath).active
+        # xlsxwriter stores widths with a small padding for cell margins
+        assert int(ws.column_dimensions['C'].width) == len("success") + 2
+        assert int(ws.column_dimensions['D'].width) == XLSXFormatter.MAX_COLUMN_WIDTH
+    
+    def test_write_to_file_missing_xlsxwriter(self, sample_results, tmp_path, monkeypatch):
+        """Test error when the xlsxwriter engine is selected but not installed."""
+        import sys
+        monkeypatch.setitem(sys.modules, "xlsxwriter", None)
+        
+        formatter = XLSXFormatter(engine="xlsxwriter")
+        
+        with pytest.raises(ImportError, match="xlsxwriter is required"):
+            formatter.write_to_file(sample_results, tmp_path / "output.xlsx")
+    
+    def test_unknown_engine(self):
+        """Test unknown engines are rejected."""
+        with pytest.raises(ValueError, match="Unknown XLSX engine"):
+            XLSXFormatter(engine="pandas")
+
+
+class TestProjectResults:
+    """Tests for project_results."""
+    
+    def test_columns(self, sample_results):
+        """Test each column holds one resolved value per result."""
+        sample_results[1].duration = None
+        view = project_results(sample_results)
+        
+        assert view.hostnames == ["router1", "router2", "router3"]
+        assert view.commands[0] == "show version"
+        assert view.statuses == ["success", "failed", "success"]
+        assert view.duration_ms == [1500, None, 0]
+        assert view.timestamps[0] == "2025-01-01T12:00:00"
+        assert len(list(zip(*view))) == len(sample_results)
+    
+    def test_empty(self):
+        """Test projecting no results gives empty columns."""
+        assert all(column == [] for column in project_results([]))
+
+
+class TestGetFormatter:
+    """Tests for get_formatter."""
+    
+    @pytest.mark.parametrize("name,cls", [
+        ("csv", CSVFormatter),
+        ("JSON", JSONFormatter),
+        ("yaml", YAMLFormatter),
+        ("html", HTMLFormatter),
+        ("Xlsx", XLSXFormatter),
+    ])
+    def test_get_formatter(self, name, cls):
+        """Test lazily imported formatters match the package exports."""
+        assert type(get_formatter(name)) is cls
+    
+    def test_instance_reused(self):
+        """Test the shared instance is returned unless fresh is requested."""
+        assert get_formatter("csv") is get_formatter("CSV")
+        assert get_formatter("csv", fresh=True) is not get_formatter("csv")
+    
+    def test_unknown_format(self):
+        """Test unknown format names are rejected."""
+        with pytest.raises(ValueError, match="Unknown format: txt"):
+            get_formatter("txt")
@@ -6,6 +6,7 @@ validation, properties, and conversion methods.
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from src.netmiko_collector.models import (
     Device,
@@ -78,6 +79,14 @@ class TestDevice:
         assert device.has_tag("datacenter1")
         assert device.enabled_commands is False
 
+    def test_device_tags_case_insensitive(self):
+        """Test that tags are normalized to lowercase at construction."""
+        device = Device(hostname="router1", tags=frozenset({"Production", "DC1"}))
+        assert device.tags == frozenset({"production", "dc1"})
+        assert device.has_tag("PRODUCTION")
+        assert device.has_tag("dc1")
+        assert not device.has_tag("lab")
+
     def test_device_empty_hostname_raises_error(self):
         """Test that empty hostname raises ValueError."""
         with pytest.raises(ValueError, match="hostname cannot be empty"):
@@ -248,7 +257,7 @@ class TestExecutionResult:
             status=ExecutionStatus.SUCCESS,
             output="test output",
             error="",
-            timestamp=timestamp,
+            executed_at=timestamp,
             duration=2.5,
             retries=1,
         )
@@ -264,6 +273,36 @@ class TestExecutionResult:
         assert result_dict["duration"] == 2.5
         assert result_dict["retries"] == 1
 
+    def test_execution_result_default_timestamp_deferred(self, sample_device, sample_command):
+        """Test the default timestamp is kept as epoch seconds until read."""
+        result = ExecutionResult(
+            device=sample_device,
+            command=sample_command,
+            status=ExecutionStatus.SUCCESS,
+        )
+        expected = datetime.fromtimestamp(result.timestamp_epoch)
+
+        assert result.timestamp_iso == expected.isoformat()
+        assert result.timestamp == expected
+
+        result.timestamp = datetime(2025, 10, 27, 12, 0, 0)
+        assert result.timestamp_iso == "2025-10-27T12:00:00"
+        assert result.timestamp_epoch == result.timestamp.timestamp()
+
+    def test_execution_result_replace_keeps_timestamp(self, sample_device, sample_command):
+        """Test dataclasses.replace() carries an explicit execution time over."""
+        result = ExecutionResult(
+            device=sample_device,
+            command=sample_command,
+            status=ExecutionStatus.PENDING,
+            executed_at=datetime(2025, 10, 27, 12, 0, 0),
+        )
+
+        updated = replace(result, status=ExecutionStatus.SUCCESS)
+
+        assert updated.timestamp == datetime(2025, 10, 27, 12, 0, 0)
+        assert updated.timestamp_iso == "2025-10-27T12:00:00"
+
     def test_execution_result_with_retries(self, sample_device, sample_command):
         """Test result with retry attempts."""
         result = ExecutionResult(
@@ -296,3 +335,13 @@ class TestExecutionResult:
         result.output = "Updated output"
         assert result.status == ExecutionStatus.SUCCESS
         assert result.output == "Updated output"
+
+    def test_models_use_slots(self, sample_device, sample_command):
+        """Test that the models store fields in slots, not an instance dict."""
+        result = ExecutionResult(
+            device=sample_device,
+            command=sample_command,
+            status=ExecutionStatus.PENDING,
+        )
+        for instance in (sample_device, sample_command, result):
+            assert not hasattr(instance, "__dict__")
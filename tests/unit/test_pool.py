@@ -0,0 +1,127 @@
+"""Tests for connection pool module."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.netmiko_collector.pool import ConnectionPool, pool_key
+from src.netmiko_collector.ssh import execute_commands_on_device
+from src.netmiko_collector.models import Device, Command, DeviceType
+
+
+@pytest.fixture
+def pool():
+    """Create a pool whose reaper never runs during a test."""
+    with ConnectionPool(max_size=2, reap_interval=3600) as connection_pool:
+        yield connection_pool
+
+
+@pytest.fixture
+def live_connection():
+    """Create a mock connection that reports itself alive."""
+    connection = Mock()
+    connection.is_alive.return_value = True
+    return connection
+
+
+class TestPoolKey:
+    """Tests for pool_key function."""
+
+    def test_pool_key(self):
+        """Test key is built from host, port, user and device type."""
+        device = Device(hostname="r1", port=2222, username="admin", device_type=DeviceType.ARISTA_EOS)
+        assert pool_key(device) == ("r1", 2222, "admin", "arista_eos")
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool class."""
+
+    def test_acquire_miss_uses_factory(self, pool, live_connection):
+        """Test that an empty pool opens a new connection."""
+        factory = Mock(return_value=live_connection)
+
+        assert pool.acquire(("r1", 22, "admin", "cisco_ios"), factory) is live_connection
+        factory.assert_called_once()
+
+    def test_release_then_acquire_reuses(self, pool, live_connection):
+        """Test that a released connection is handed out again."""
+        key = ("r1", 22, "admin", "cisco_ios")
+        conn = pool.acquire(key, lambda: live_connection)
+        pool.release(key, conn)
+
+        factory = Mock()
+        assert pool.acquire(key, factory) is live_connection
+        factory.assert_not_called()
+        live_connection.disconnect.assert_not_called()
+
+    def test_dead_connection_not_reused(self, pool, live_connection):
+        """Test that a dropped session is closed and replaced."""
+        key = ("r1", 22, "admin", "cisco_ios")
+        pool.release(key, pool.acquire(key, lambda: live_connection))
+        live_connection.is_alive.return_value = False
+
+        fresh = Mock()
+        assert pool.acquire(key, lambda: fresh) is fresh
+        live_connection.disconnect.assert_called_once()
+
+    def test_release_when_full_closes(self, pool):
+        """Test that connections beyond max_size are closed."""
+        connections = [Mock() for _ in range(3)]
+        for i, conn in enumerate(connections):
+            pool.release((f"r{i}", 22, "admin", "cisco_ios"), conn)
+
+        assert len(pool) == 2
+        connections[2].disconnect.assert_called_once()
+
+    def test_evict_expired(self, live_connection):
+        """Test that idle connections past the timeout are closed."""
+        with ConnectionPool(idle_timeout=10, reap_interval=3600) as pool:
+            key = ("r1", 22, "admin", "cisco_ios")
+            with patch("src.netmiko_collector.pool.time.monotonic", return_value=100.0):
+                pool.release(key, pool.acquire(key, lambda: live_connection))
+            with patch("src.netmiko_collector.pool.time.monotonic", return_value=111.0):
+                assert pool.evict_expired() == 1
+
+            assert len(pool) == 0
+            live_connection.disconnect.assert_called_once()
+
+    def test_close_disconnects_idle(self, live_connection):
+        """Test that closing the pool closes idle connections."""
+        pool = ConnectionPool(reap_interval=3600)
+        key = ("r1", 22, "admin", "cisco_ios")
+        pool.release(key, pool.acquire(key, lambda: live_connection))
+
+        pool.close()
+
+        live_connection.disconnect.assert_called_once()
+        pool.release(key, Mock())
+        assert len(pool) == 0
+
+
+class TestPooledExecution:
+    """Tests for executing commands through a pool."""
+
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_connection_reused_across_runs(self, mock_connect, pool, live_connection):
+        """Test that a second run on the same device skips ConnectHandler."""
+        live_connection.send_command.return_value = "output"
+        mock_connect.return_value = live_connection
+        device = Device(hostname="r1", username="admin", password="secret")
+        commands = [Command(command="show version")]
+
+        execute_commands_on_device(device, commands, pool=pool)
+        execute_commands_on_device(device, commands, pool=pool)
+
+        mock_connect.assert_called_once()
+        live_connection.disconnect.assert_not_called()
+
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_failed_connection_not_returned(self, mock_connect, pool, live_connection):
+        """Test that a connection with a command error is discarded."""
+        live_connection.send_command.side_effect = Exception("channel closed")
+        mock_connect.return_value = live_connection
+        device = Device(hostname="r1", username="admin", password="secret")
+
+        execute_commands_on_device(device, [Command(command="show version")], pool=pool)
+
+        assert len(pool) == 0
+        live_connection.disconnect.assert_called_once()
@@ -0,0 +1,80 @@
+"""Tests for result sink module."""
+
+import csv
+from unittest.mock import patch
+
+import pytest
+
+from src.netmiko_collector.executor import execute_on_devices
+from src.netmiko_collector.formatters import CSVFormatter
+from src.netmiko_collector.models import Command, Device, ExecutionResult, ExecutionStatus
+from src.netmiko_collector.sink import ResultSink
+
+
+@pytest.fixture
+def test_results():
+    """Create test results."""
+    return [
+        ExecutionResult(
+            device=Device(hostname=f"router{i}"),
+            command=Command(command="show version"),
+            status=ExecutionStatus.SUCCESS,
+            output=f"output {i}",
+            duration=0.25,
+        )
+        for i in range(3)
+    ]
+
+
+class TestResultSink:
+    """Tests for ResultSink class."""
+
+    def test_writes_rows_as_csv(self, test_results, tmp_path):
+        """Test sink output matches the CSV formatter."""
+        filepath = tmp_path / "output.csv"
+
+        with ResultSink(filepath) as sink:
+            for result in test_results:
+                sink.put(result)
+
+        assert sink.count == 3
+        assert filepath.read_bytes().decode("utf-8") == CSVFormatter().format(test_results)
+
+    def test_close_is_idempotent(self, tmp_path):
+        """Test closing twice does not fail."""
+        sink = ResultSink(tmp_path / "output.csv")
+        sink.close()
+        sink.close()
+
+        with open(tmp_path / "output.csv", encoding="utf-8", newline="") as f:
+            assert next(csv.reader(f)) == list(CSVFormatter.HEADER)
+
+    def test_write_error_raised_on_close(self, tmp_path):
+        """Test a failure in the writer thread surfaces on close."""
+        sink = ResultSink(tmp_path / "output.csv")
+        sink.put(object())
+
+        with pytest.raises(AttributeError):
+            sink.close()
+
+
+class TestExecuteOnDevicesSink:
+    """Tests for streaming executor results into a sink."""
+
+    @patch("src.netmiko_collector.executor.execute_commands_on_device")
+    def test_sink_receives_results(self, mock_execute, test_results):
+        """Test results go to the sink instead of being retained."""
+        devices = [result.device for result in test_results]
+        by_device = {result.device: [result] for result in test_results}
+        mock_execute.side_effect = lambda device, commands, ssh_config: by_device[device]
+        received = []
+
+        results, stats = execute_on_devices(
+            devices,
+            [Command(command="show version")],
+            sink=received.append,
+        )
+
+        assert results == []
+        assert sorted(r.hostname for r in received) == ["router0", "router1", "router2"]
+        assert stats.successful_commands == 3
@@ -5,9 +5,12 @@ from unittest.mock import Mock, patch, MagicMock
 from netmiko.exceptions import NetmikoTimeoutException, NetmikoAuthenticationException
 
 from src.netmiko_collector.ssh import (
+    ChunkedSSHChannel,
+    FastReadMixin,
     SSHConfig,
     SSHConnection,
     execute_commands_on_device,
+    fast_read_class,
 )
 from src.netmiko_collector.models import (
     Device,
@@ -70,6 +73,50 @@ class TestSSHConfig:
         assert config.session_log == "/tmp/session.log"
 
 
+class TestFastRead:
+    """Tests for the chunked channel reader."""
+    
+    def test_read_channel_joins_chunks(self):
+        """Test pending chunks are joined and decoded once."""
+        remote = Mock()
+        remote.recv_ready.side_effect = [True, True, False]
+        # "é" split across the two reads
+        remote.recv.side_effect = [b"caf\xc3", b"\xa9\nRouter#"]
+        
+        channel = ChunkedSSHChannel(remote, "utf-8")
+        
+        assert channel.read_channel() == "café\nRouter#"
+    
+    def test_read_channel_closed(self):
+        """Test an empty read on a ready channel raises."""
+        remote = Mock()
+        remote.recv_ready.return_value = True
+        remote.recv.return_value = b""
+        
+        channel = ChunkedSSHChannel(remote, "utf-8")
+        
+        with pytest.raises(Exception, match="closed by remote"):
+            channel.read_channel()
+    
+    def test_fast_read_class(self):
+        """Test the fast-read class extends Netmiko's class and is cached."""
+        cls = fast_read_class("cisco_ios")
+        
+        assert issubclass(cls, FastReadMixin)
+        assert cls is fast_read_class("cisco_ios")
+    
+    @patch("src.netmiko_collector.ssh.fast_read_class")
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_connect_fast_read(self, mock_connect, mock_fast_class, test_device):
+        """Test fast_read connects through the fast-read class."""
+        conn = SSHConnection(test_device, SSHConfig(fast_read=True))
+        conn.connect()
+        
+        mock_fast_class.assert_called_once_with("cisco_ios")
+        mock_fast_class.return_value.assert_called_once()
+        mock_connect.assert_not_called()
+
+
 class TestSSHConnection:
     """Tests for SSHConnection class."""
     
@@ -190,6 +237,36 @@ class TestSSHConnection:
         assert not conn.is_connected
         assert mock_connect.call_count == 3
     
+    @patch("src.netmiko_collector.ssh.random.uniform", return_value=1.0)
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    @patch("src.netmiko_collector.ssh.time.sleep")
+    def test_connect_retry_backoff(self, mock_sleep, mock_connect, mock_uniform, test_device):
+        """Test retry delays double per attempt up to max_retry_delay."""
+        config = SSHConfig(max_retries=5, retry_delay=2, max_retry_delay=5)
+        mock_connect.side_effect = NetmikoTimeoutException("Timeout")
+        
+        conn = SSHConnection(test_device, config)
+        
+        with pytest.raises(NetmikoTimeoutException):
+            conn.connect()
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 5, 5]
+    
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    @patch("src.netmiko_collector.ssh.time.sleep")
+    def test_connect_retry_budget_exhausted(self, mock_sleep, mock_connect, test_device):
+        """Test retries stop once the next delay would exceed the budget."""
+        config = SSHConfig(max_retries=5, retry_delay=10, retry_budget=1)
+        mock_connect.side_effect = NetmikoTimeoutException("Timeout")
+        
+        conn = SSHConnection(test_device, config)
+        
+        with pytest.raises(NetmikoTimeoutException):
+            conn.connect()
+        
+        assert mock_connect.call_count == 1
+        mock_sleep.assert_not_called()
+    
     @patch("src.netmiko_collector.ssh.ConnectHandler")
     def test_context_manager(self, mock_connect, test_device):
         """Test SSHConnection as context manager."""
@@ -336,7 +413,8 @@ class TestExecuteCommandsOnDevice:
         assert all("Connection timeout" in r.error for r in results)
     
     @patch("src.netmiko_collector.ssh.ConnectHandler")
-    def test_execute_commands_generic_error(self, mock_connect, test_device, test_commands):
+    @patch("src.netmiko_collector.ssh.time.sleep")
+    def test_execute_commands_generic_error(self, mock_sleep, mock_connect, test_device, test_commands):
         """Test command execution with generic error."""
         mock_connect.side_effect = Exception("Connection error")
         
@@ -364,3 +442,69 @@ class TestExecuteCommandsOnDevice:
         assert results[0].output == "Version output"
         assert results[1].status == ExecutionStatus.TIMEOUT
         assert "Command timeout" in results[1].error
+    
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_execute_commands_error_marks_remaining(self, mock_connect, test_device):
+        """Test a mid-run connection error fails exactly the commands not yet run."""
+        commands = [Command(command="show version")] * 3
+        first = Mock(command=commands[0])
+        mock_connect.return_value = Mock()
+        
+        with patch.object(
+            SSHConnection, "execute_command", side_effect=[first, OSError("Socket closed")]
+        ):
+            results = execute_commands_on_device(test_device, commands)
+        
+        assert len(results) == 3
+        assert results[0] is first
+        assert all(r.status == ExecutionStatus.FAILED for r in results[1:])
+        assert all("Socket closed" in r.error for r in results[1:])
+
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_execute_commands_batched(self, mock_connect, test_commands):
+        """Test batched execution sends one write and splits the output."""
+        device = Device(hostname="server1", device_type=DeviceType.GENERIC)
+        mock_connection = Mock()
+        mock_connection.send_command_timing.return_value = (
+            "Version output\n__NMC_END__:0\nInterface output\n__NMC_END__:1\n"
+        )
+        mock_connect.return_value = mock_connection
+        
+        results = execute_commands_on_device(
+            device, test_commands, SSHConfig(batch_commands=True)
+        )
+        
+        mock_connection.send_command_timing.assert_called_once()
+        mock_connection.send_command.assert_not_called()
+        assert [r.output for r in results] == ["Version output", "Interface output"]
+        assert all(r.status == ExecutionStatus.SUCCESS for r in results)
+    
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_execute_commands_batched_incomplete(self, mock_connect, test_commands):
+        """Test commands missing from a truncated batch are timeouts."""
+        device = Device(hostname="server1", device_type=DeviceType.GENERIC)
+        mock_connection = Mock()
+        mock_connection.send_command_timing.return_value = "Version output\n__NMC_END__:0\n"
+        mock_connect.return_value = mock_connection
+        
+        results = execute_commands_on_device(
+            device, test_commands, SSHConfig(batch_commands=True)
+        )
+        
+        assert results[0].status == ExecutionStatus.SUCCESS
+        assert results[1].status == ExecutionStatus.TIMEOUT
+    
+    @patch("src.netmiko_collector.ssh.ConnectHandler")
+    def test_execute_commands_batch_unsupported_device(self, mock_connect, test_device, test_commands):
+        """Test device types without a shell fall back to per-command mode."""
+        mock_connection = Mock()
+        mock_connection.send_command.side_effect = ["Version output", "Interface output"]
+        mock_connect.return_value = mock_connection
+        
+        results = execute_commands_on_device(
+            test_device, test_commands, SSHConfig(batch_commands=True)
+        )
+        
+        mock_connection.send_command_timing.assert_not_called()
+        assert mock_connection.send_command.call_count == 2
+        assert all(r.status == ExecutionStatus.SUCCESS for r in results)
@@ -13,10 +13,12 @@ from src.netmiko_collector.models import (
     AuthMethod,
 )
 from src.netmiko_collector.ui import (
+    BatchedProgress,
     create_device_summary,
     create_panel,
     create_progress_bar,
     create_results_table,
+    create_stats_summary,
     print_error,
     print_success,
     print_warning,
@@ -54,6 +56,37 @@ class TestCreateProgressBar:
         progress = create_progress_bar(total=5, description="Custom task")
         assert progress is not None
 
+    def test_progress_bars_share_columns(self):
+        """Test progress bars reuse the same column instances."""
+        first = create_progress_bar(total=1)
+        second = create_progress_bar(total=2)
+        assert len(first.columns) == 5
+        assert all(a is b for a, b in zip(first.columns, second.columns))
+
+
+class TestBatchedProgress:
+    """Tests for BatchedProgress class."""
+
+    def test_advances_are_coalesced(self):
+        """Test many advances reach the progress bar as one update."""
+        progress = Mock()
+
+        with BatchedProgress(progress, "task", interval=60) as batched:
+            for _ in range(100):
+                batched.advance()
+            progress.update.assert_not_called()
+
+        progress.update.assert_called_once_with("task", advance=100)
+
+    def test_no_update_without_advances(self):
+        """Test flushing with nothing pending does not touch the display."""
+        progress = Mock()
+
+        with BatchedProgress(progress, "task", interval=0.01):
+            pass
+
+        progress.update.assert_not_called()
+
 
 class TestCreateResultsTable:
     """Tests for create_results_table function."""
@@ -162,6 +195,17 @@ class TestCreateResultsTable:
         table = create_results_table(results)
         assert table is not None
 
+    def test_commands_column_counts_outputs(self, device, command):
+        """Test the Commands column matches the size of each result's outputs."""
+        results = [
+            ExecutionResult(device=device, command=command, status=ExecutionStatus.SUCCESS,
+                            output="output1"),
+            ExecutionResult(device=device, command=command, status=ExecutionStatus.FAILED,
+                            error="Error"),
+        ]
+        table = create_results_table(results)
+        assert list(table.columns[3].cells) == [str(len(r.outputs)) for r in results]
+
 
 class TestCreatePanel:
     """Tests for create_panel function."""
@@ -277,3 +321,17 @@ class TestCreateDeviceSummary:
         assert "Timeout: 1" in summary
         assert "Auth Failed: 1" in summary
 
+
+class TestCreateStatsSummary:
+    """Tests for create_stats_summary function."""
+
+    def test_creates_summary_from_stats(self):
+        """Test the summary reports the executor's device counters."""
+        stats = Mock(total_devices=3, successful_devices=2, failed_devices=1, duration=2.5)
+
+        summary = create_stats_summary(stats)
+
+        assert "Total Devices: 3" in summary
+        assert "Success: 2" in summary
+        assert "Failed: 1" in summary
+        assert "Duration: 2.5s" in summary
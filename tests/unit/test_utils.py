@@ -10,10 +10,13 @@ from src.netmiko_collector.utils import (
     format_duration,
     get_file_size_str,
     is_valid_ip,
+    make_truncator,
     parse_csv_line,
+    resolve_path,
     sanitize_filename,
     truncate_string,
     validate_hostname,
+    validate_ips_batch,
     validate_port,
 )
 
@@ -34,15 +37,41 @@ class TestExpandPath:
         assert "/tmp/test/file.txt" in str(result)
     
     def test_absolute_path_unchanged(self):
-        """Test absolute path is resolved but not changed."""
+        """Test absolute path is not changed."""
         result = expand_path("/absolute/path/file.txt")
-        assert result.is_absolute()
-        assert "absolute" in str(result)
+        assert result == Path("/absolute/path/file.txt")
+    
+    def test_relative_path_not_resolved(self):
+        """Test relative path stays relative."""
+        result = expand_path("relative/path.txt")
+        assert result == Path("relative/path.txt")
+    
+    def test_path_object_accepted(self, monkeypatch):
+        """Test Path objects are expanded like strings."""
+        monkeypatch.setenv("TEST_DIR", "/tmp/test")
+        assert expand_path(Path("$TEST_DIR/file.txt")) == expand_path("$TEST_DIR/file.txt")
+
+
+class TestResolvePath:
+    """Tests for resolve_path function."""
+    
+    def test_expands_then_resolves(self, monkeypatch):
+        """Test ~ and environment variables are expanded before resolving."""
+        monkeypatch.setenv("TEST_DIR", "/tmp/test")
+        assert resolve_path("$TEST_DIR/../file.txt") == Path("/tmp/file.txt").resolve()
+        assert resolve_path("~/file.txt") == expand_path("~/file.txt").resolve()
     
     def test_relative_path_resolved(self):
         """Test relative path is resolved to absolute."""
-        result = expand_path("relative/path.txt")
+        result = resolve_path("relative/path.txt")
         assert result.is_absolute()
+    
+    def test_relative_path_follows_cwd(self, tmp_path, monkeypatch):
+        """Test cached resolution still tracks the current directory."""
+        first = resolve_path("file.txt")
+        monkeypatch.chdir(tmp_path)
+        assert resolve_path("file.txt") == tmp_path.resolve() / "file.txt"
+        assert resolve_path("file.txt") != first
 
 
 class TestValidateHostname:
@@ -76,6 +105,7 @@ class TestValidateHostname:
         assert not validate_hostname("host_name!")
         assert not validate_hostname("server@domain.com")
         assert not validate_hostname("router#1")
+        assert not validate_hostname("router1\n")
     
     def test_hostname_with_trailing_dot(self):
         """Test hostname with trailing dot (FQDN format)."""
@@ -93,6 +123,7 @@ class TestIsValidIp:
         assert is_valid_ip("172.16.0.1")
         assert is_valid_ip("255.255.255.255")
         assert is_valid_ip("0.0.0.0")
+        assert is_valid_ip("010.001.000.199")
     
     def test_invalid_ip_out_of_range(self):
         """Test IP with octets out of range."""
@@ -106,10 +137,18 @@ class TestIsValidIp:
         assert not is_valid_ip("192.168.1.1.1")
         assert not is_valid_ip("not.an.ip.address")
         assert not is_valid_ip("192.168.1.a")
+        assert not is_valid_ip("192.168.1. 1")
+        assert not is_valid_ip("router1.example.com")
+        assert not is_valid_ip("1" * 16)
     
     def test_invalid_ip_empty(self):
         """Test empty string is invalid."""
         assert not is_valid_ip("")
+    
+    def test_validate_ips_batch(self):
+        """Test batch validation agrees with is_valid_ip."""
+        addresses = ["192.168.1.1", "", "256.1.1.1", "router1", "0.0.0.0", "1" * 16]
+        assert validate_ips_batch(addresses) == [is_valid_ip(a) for a in addresses]
 
 
 class TestValidatePort:
@@ -167,6 +206,11 @@ class TestSanitizeFilename:
         """Test custom replacement character."""
         result = sanitize_filename("file:name", replacement="-")
         assert result == "file-name"
+    
+    def test_sanitize_replacement_used_literally(self):
+        """Test replacement text is inserted as-is next to dropped control chars."""
+        result = sanitize_filename("a:b\x07\tc", replacement="\\")
+        assert result == "a\\bc"
 
 
 class TestTruncateString:
@@ -198,6 +242,14 @@ class TestTruncateString:
         """Test suffix longer than max length."""
         result = truncate_string("Text", 2, suffix="...")
         assert result == ".."
+    
+    def test_make_truncator_matches_truncate_string(self):
+        """Test a prebuilt truncator behaves like truncate_string."""
+        texts = ["", "Short", "Exactly10!", "This is a long string"]
+        for max_length, suffix in [(10, "..."), (10, ">>"), (2, "...")]:
+            truncate = make_truncator(max_length, suffix)
+            for text in texts:
+                assert truncate(text) == truncate_string(text, max_length, suffix)
 
 
 class TestParseCsvLine:
@@ -232,6 +284,11 @@ class TestParseCsvLine:
         """Test parsing with custom delimiter."""
         result = parse_csv_line("a|b|c", delimiter="|")
         assert result == ["a", "b", "c"]
+    
+    def test_parse_empty_and_multiline(self):
+        """Test empty lines and embedded line breaks still follow csv.reader."""
+        assert parse_csv_line("") == []
+        assert parse_csv_line("a,b\nc,d") == ["a", "b"]
 
 
 class TestFormatDuration:
@@ -279,6 +336,12 @@ class TestGetFileSizeStr:
         """Test formatting gigabytes."""
         assert get_file_size_str(1073741824) == "1.0 GB"
     
+    def test_largest_units(self):
+        """Test sizes past a terabyte stay in PB."""
+        assert get_file_size_str(1024 ** 4 - 1) == "1024.0 GB"
+        assert get_file_size_str(1024 ** 5) == "1.0 PB"
+        assert get_file_size_str(1024 ** 6) == "1024.0 PB"
+    
     def test_zero_size(self):
         """Test formatting zero size."""
         assert get_file_size_str(0) == "0.0 B"